@@ -0,0 +1,160 @@
+"""Compare the legacy and RETURNING-based user admin operations on SQLite.
+
+bcrypt is switched to its minimum cost so the numbers show database round
+trips rather than password hashing. Run from the repository root:
+
+    python -m benchmarks.bench_auth_admin --users 5000 --operations 200
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, List
+
+from passlib.context import CryptContext
+from sqlalchemy import delete, select
+
+from benchmarks.load_test import build_engine
+
+CHEAP_HASH = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("benchmark")
+
+
+async def legacy_delete_user(db, user_id: int) -> bool:
+    from src.backend.app.schemas import User
+
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalars().first()
+    if not user:
+        return False
+    await db.delete(user)
+    await db.commit()
+    return True
+
+
+async def legacy_reset_user_password(db, user_id: int, new_password: str) -> bool:
+    from src.backend.app.crud.create_crud_auth import get_password_hash
+    from src.backend.app.schemas import User
+
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalars().first()
+    if not user:
+        return False
+    user.hashed_password = get_password_hash(new_password)
+    await db.commit()
+    await db.refresh(user)
+    return True
+
+
+async def legacy_get_all_users(db) -> List[Any]:
+    from src.backend.app.schemas import User
+
+    result = await db.execute(select(User).order_by(User.id))
+    return result.scalars().all()  # type: ignore
+
+
+async def seed_users(engine, n_users: int) -> List[int]:
+    from src.backend.app.engine_database import Base
+    from src.backend.app.schemas import User
+
+    table = User.__table__
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(delete(table))
+        await conn.execute(
+            table.insert(),
+            [
+                {"username": f"admin_bench_{i:06d}", "hashed_password": CHEAP_HASH}
+                for i in range(n_users)
+            ],
+        )
+        result = await conn.execute(select(table.c.id).order_by(table.c.id))
+        return list(result.scalars())
+
+
+async def measure(
+    engine, n_users: int, run: Callable[[Any, List[int]], Awaitable[None]]
+) -> dict[str, Any]:
+    from src.backend.app.engine_database import SessionLocal
+    from src.utils import RequestStats, request_stats
+
+    user_ids = await seed_users(engine, n_users)
+    stats = RequestStats()
+    token = request_stats.set(stats)
+    start = time.perf_counter()
+    try:
+        async with SessionLocal() as db:
+            await run(db, user_ids)
+    finally:
+        request_stats.reset(token)
+    return {
+        "ms": round((time.perf_counter() - start) * 1000, 1),
+        "statements": stats.db_queries,
+    }
+
+
+async def main_async(n_users: int, operations: int) -> None:
+    path = os.path.join(tempfile.mkdtemp(prefix="bench_auth_"), "bench.db")
+    engine = build_engine("sqlite", path)
+
+    from src.backend.app.crud import create_crud_auth as auth
+    from src.backend.app.middleware import instrument_engine
+
+    auth.pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+    instrument_engine(engine)
+
+    def delete_one_by_one(delete_func):
+        async def run(db, user_ids):
+            for user_id in user_ids[:operations]:
+                await delete_func(db, user_id)
+
+        return run
+
+    def reset_one_by_one(reset_func):
+        async def run(db, user_ids):
+            for user_id in user_ids[:operations]:
+                await reset_func(db, user_id, "new-password")
+
+        return run
+
+    async def bulk_delete(db, user_ids):
+        await auth.delete_users(db, user_ids[:operations])
+
+    async def bulk_reset(db, user_ids):
+        await auth.reset_users_passwords(
+            db, {user_id: "new-password" for user_id in user_ids[:operations]}
+        )
+
+    async def list_all(db, user_ids):
+        await legacy_get_all_users(db)
+
+    async def list_page(db, user_ids):
+        await auth.get_all_users(db, page=1, page_size=100)
+
+    cases = [
+        ("delete  legacy", delete_one_by_one(legacy_delete_user)),
+        ("delete  returning", delete_one_by_one(auth.delete_user)),
+        ("delete  bulk", bulk_delete),
+        ("reset   legacy", reset_one_by_one(legacy_reset_user_password)),
+        ("reset   returning", reset_one_by_one(auth.reset_user_password)),
+        ("reset   bulk", bulk_reset),
+        ("list    all rows", list_all),
+        ("list    page of 100", list_page),
+    ]
+    for name, run in cases:
+        print(f"{name:<22} {await measure(engine, n_users, run)}")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=5_000)
+    parser.add_argument("--operations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.users, args.operations))
+
+
+if __name__ == "__main__":
+    main()
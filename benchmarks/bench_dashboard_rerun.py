@@ -0,0 +1,89 @@
+"""Time dashboard reruns with and without the derived-data cache.
+
+Each rerun rebuilds what the "Indicadores de Cadastro" page shows for one
+filter selection; the selections cycle the way a user toggling the
+multiselects would. Run from the repository root:
+
+    python -m benchmarks.bench_dashboard_rerun --rows 1000 10000
+"""
+
+import argparse
+import logging
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, List
+
+from benchmarks.bench_members_serialization import build_rows
+
+# The frontend imports its sibling modules as top-level names.
+sys.path.insert(0, str(Path(__file__).parents[1] / "src" / "frontend" / "app"))
+
+from dashboard import (  # noqa: E402
+    cached_dashboard_view,
+    cached_members_frame,
+    dashboard_view,
+    members_frame,
+)
+from member_table import MemberTable  # noqa: E402
+
+SELECTIONS = [
+    (("Não", "Sim"), ("Feminino", "Masculino")),
+    (("Sim",), ("Feminino", "Masculino")),
+    (("Sim",), ("Feminino",)),
+    (("Não", "Sim"), ("Feminino",)),
+]
+
+
+def api_payload(n_rows: int) -> List[dict[str, Any]]:
+    return [
+        {**row, "date_birth": row["date_birth"].isoformat()}
+        for row in build_rows(n_rows)
+    ]
+
+
+def uncached_rerun(members, version, today, semeador_sel, gender_sel) -> None:
+    df = members_frame(members, today)
+    dashboard_view(df, list(semeador_sel), list(gender_sel))
+
+
+def cached_rerun(members, version, today, semeador_sel, gender_sel) -> None:
+    cached_members_frame(version, today, members)
+    cached_dashboard_view(version, today, semeador_sel, gender_sel, members)
+
+
+def measure(func: Callable[..., None], members, reruns: int) -> dict[str, Any]:
+    version = f"bench-{id(members)}"
+    today = date.today()
+    timings = []
+    for i in range(reruns):
+        semeador_sel, gender_sel = SELECTIONS[i % len(SELECTIONS)]
+        start = time.perf_counter()
+        func(members, version, today, semeador_sel, gender_sel)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {
+        "max_ms": round(timings[-1] * 1000, 1),
+        "median_ms": round(timings[len(timings) // 2] * 1000, 2),
+        "total_ms": round(sum(timings) * 1000, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--reruns", type=int, default=40)
+    args = parser.parse_args()
+
+    # Outside `streamlit run` every cache call warns about the missing runtime.
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    for n_rows in args.rows:
+        members = MemberTable.from_payload(api_payload(n_rows))
+        for name, func in (("uncached", uncached_rerun), ("cached", cached_rerun)):
+            print(f"{n_rows:>8} rows  {name:<9} {measure(func, members, args.reruns)}")
+
+
+if __name__ == "__main__":
+    main()
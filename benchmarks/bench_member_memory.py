@@ -0,0 +1,76 @@
+"""Memory held by a cached members list in each representation.
+
+Python-heap bytes come from ``tracemalloc`` (which sees NumPy buffers);
+Arrow buffers live in pyarrow's own pool and are added from
+``pyarrow.total_allocated_bytes``. The payload is parsed from JSON, so
+every cell is its own object as it is after ``response.json()``. Run from
+the repository root:
+
+    python -m benchmarks.bench_member_memory --rows 100000
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+import pandas as pd
+import pyarrow as pa
+
+from benchmarks.bench_dashboard_rerun import api_payload
+from src.backend.app.validator import YouthMemberResponse
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "src" / "frontend" / "app"))
+
+from member_table import MemberTable  # noqa: E402
+
+
+def measure(build: Callable[[], Any]) -> tuple[Any, int, float]:
+    gc.collect()
+    arrow_before = pa.total_allocated_bytes()
+    tracemalloc.start()
+    start = time.perf_counter()
+    value = build()
+    seconds = time.perf_counter() - start
+    heap, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, heap + pa.total_allocated_bytes() - arrow_before, seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    body = json.dumps(api_payload(args.rows))
+    payload, payload_bytes, _ = measure(lambda: json.loads(body))
+
+    results = [("list of dicts (response.json())", payload_bytes, 0.0)]
+    models, size, seconds = measure(
+        lambda: [YouthMemberResponse.model_construct(**m) for m in payload]
+    )
+    results.append(("list of YouthMemberResponse", size, seconds))
+    frame, size, seconds = measure(lambda: pd.DataFrame(payload))
+    results.append(("pd.DataFrame(payload)", size, seconds))
+    table, size, seconds = measure(lambda: MemberTable.from_payload(payload))
+    results.append(("MemberTable.from_payload", size, seconds))
+    table_frame, size, seconds = measure(table.to_frame)
+    results.append(("MemberTable.to_frame (extra)", size, seconds))
+    _, size, seconds = measure(table.to_payload)
+    results.append(("MemberTable.to_payload", size, seconds))
+
+    print(f"{args.rows} members")
+    print(f"{'representation':<34}{'MiB':>9}{'B/member':>10}{'build ms':>10}")
+    for name, size, seconds in results:
+        print(
+            f"{name:<34}{size / 2**20:>9.1f}{size / args.rows:>10.0f}"
+            f"{seconds * 1000:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
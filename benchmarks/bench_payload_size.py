@@ -0,0 +1,78 @@
+"""Bytes on the wire for the members list, by encoding and field set.
+
+The app is driven in-process through ``httpx.ASGITransport`` against a
+seeded database, as in ``load_test``. ``identity`` with all fields is the
+payload every client received before compression and ``?fields=``.
+Run from the repository root:
+
+    python -m benchmarks.bench_payload_size --members 10000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.load_test import build_engine, seed
+
+FIELD_SETS = {
+    "all fields": None,
+    "name+phone": "id_member,member_name,phone_number",
+}
+ENCODINGS = ["identity", "gzip", "br"]
+
+
+async def measure(
+    client: httpx.AsyncClient, fields: str | None, encoding: str, repeat: int
+) -> tuple[int, float]:
+    params = {"fields": fields} if fields else {}
+    sizes, latencies = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = await client.get(
+            "/registered/", params=params, headers={"Accept-Encoding": encoding}
+        )
+        latencies.append(time.perf_counter() - start)
+        response.raise_for_status()
+        sizes.append(int(response.headers["content-length"]))
+    return sizes[-1], statistics.median(latencies) * 1000
+
+
+async def main_async(database: str, n_members: int, repeat: int) -> None:
+    path = os.path.join(tempfile.mkdtemp(prefix="bench_payload_"), "bench.db")
+    engine = build_engine(database, path)
+    await seed(engine, n_members)
+
+    from src.backend.app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    print(f"{database}, {n_members} members, GET /registered/")
+    print(f"{'fields':<12}{'encoding':<10}{'bytes':>12}{'vs before':>11}{'ms':>9}")
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        before = None
+        for label, fields in FIELD_SETS.items():
+            for encoding in ENCODINGS:
+                size, latency_ms = await measure(c, fields, encoding, repeat)
+                before = before or size
+                print(
+                    f"{label:<12}{encoding:<10}{size:>12,}"
+                    f"{size / before:>10.1%}{latency_ms:>9.1f}"
+                )
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database", choices=["sqlite", "postgres"], default="sqlite")
+    parser.add_argument("--members", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.database, args.members, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
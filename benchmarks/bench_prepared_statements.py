@@ -0,0 +1,183 @@
+"""Per-query latency of the hot member queries with and without statement reuse.
+
+Three setups run the same statements against the same seeded database:
+
+* ``legacy``: the query file is read and ``text()`` built on every call, and
+  the driver's prepared statement cache is off;
+* ``text cached``: one ``text()`` per query file, driver cache still off;
+* ``prepared``: one ``text()`` per file and ``DB_STATEMENT_CACHE_SIZE``
+  prepared statements kept per connection.
+
+Writes run inside a transaction that is rolled back, so every setup sees the
+same rows. Run from the repository root:
+
+    python -m benchmarks.bench_prepared_statements --members 10000 --calls 2000
+
+``--database postgres`` uses the DB_* variables read by ConnectionDatabase.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from benchmarks.load_test import build_engine, seed
+
+CRUD_DIR = Path(__file__).resolve().parents[1] / "src" / "backend" / "app" / "crud"
+
+
+def legacy_statement(engine: AsyncEngine, sql_file: str) -> Any:
+    # What every CRUD call did before: resolve, read and parse the file.
+    query_dir = CRUD_DIR.parent / "sql" / "query"
+    path_file = query_dir / f"{sql_file}.{engine.dialect.name}.sql"
+    if not path_file.is_file():
+        path_file = query_dir / f"{sql_file}.sql"
+    with open(path_file) as file:
+        return text(f"-- sql_file: {sql_file}\n{file.read()}")
+
+
+def cached_statement(engine: AsyncEngine, sql_file: str) -> Any:
+    from src.utils import SqlReadFile
+
+    return SqlReadFile(
+        sql_file=sql_file, engine=engine, current_dir=CRUD_DIR
+    ).statement()
+
+
+def member_engine(database: str, sqlite_path: str, cache_size: int) -> AsyncEngine:
+    from src.utils import ConnectionDatabase
+
+    os.environ["DB_STATEMENT_CACHE_SIZE"] = str(cache_size)
+    os.environ["SQLITE_PATH"] = sqlite_path
+    return ConnectionDatabase().initialize_engine()
+
+
+def queries(ids: list[int]) -> dict[str, tuple[str, Callable[[int], dict]]]:
+    filters = {
+        "gender": None,
+        "t_shirt": None,
+        "food_allergy": None,
+        "sower": None,
+        "ministry_position": None,
+        "search": None,
+    }
+    update = {
+        "member_name": None,
+        "gender": None,
+        "phone_number": None,
+        "t_shirt": "G",
+        "food_allergy": None,
+        "sower": None,
+        "ministry_position": None,
+        "date_birth": None,
+        "email": None,
+    }
+    return {
+        "get by id": (
+            "get_member_by_id",
+            lambda i: {"id_member": ids[i % len(ids)]},
+        ),
+        "list page": (
+            "search_members",
+            lambda i: {**filters, "limit": 50, "offset": (i % 20) * 50},
+        ),
+        "count": ("count_members", lambda i: filters),
+        "update": (
+            "update_member",
+            lambda i: {**update, "id_member": ids[i % len(ids)]},
+        ),
+        "delete": ("delete_member", lambda i: {"id_member": ids[i % len(ids)]}),
+    }
+
+
+async def time_chunk(
+    engine: AsyncEngine,
+    build: Callable[[], Any],
+    params: Callable[[int], dict],
+    offset: int,
+    calls: int,
+) -> list[float]:
+    latencies = []
+    async with engine.connect() as conn:
+        for i in range(offset, offset + calls):
+            start = time.perf_counter()
+            result = await conn.execute(build(), params(i))
+            result.all()
+            latencies.append(time.perf_counter() - start)
+        # Also releases the SQLite write lock for the next setup.
+        await conn.rollback()
+    return latencies
+
+
+async def main_async(
+    database: str, n_members: int, calls: int, cache_size: int, rounds: int
+) -> None:
+    path = os.path.join(tempfile.mkdtemp(prefix="bench_prepared_"), "bench.db")
+    ids = await seed(build_engine(database, path), n_members)
+
+    setups = [
+        ("legacy", 0, legacy_statement),
+        ("text cached", 0, cached_statement),
+        ("prepared", cache_size, cached_statement),
+    ]
+    engines = {setup: member_engine(database, path, size) for setup, size, _ in setups}
+    results: dict[str, dict[str, float]] = {}
+    chunk = max(1, calls // rounds)
+    for name, (sql_file, params) in queries(ids).items():
+        latencies: dict[str, list[float]] = {setup: [] for setup, _, _ in setups}
+        # Setups take turns so drift in the machine or the database (WAL
+        # growth, page cache) hits all of them alike. The first chunk of
+        # each warms the pool connection and the caches and is discarded.
+        for round_number in range(rounds + 1):
+            for setup, _, statement_for in setups:
+                engine = engines[setup]
+                timed = await time_chunk(
+                    engine,
+                    lambda: statement_for(engine, sql_file),
+                    params,
+                    round_number * chunk,
+                    chunk,
+                )
+                if round_number:
+                    latencies[setup].extend(timed)
+        results[name] = {
+            setup: statistics.median(values) * 1_000_000
+            for setup, values in latencies.items()
+        }
+
+    for engine in engines.values():
+        await engine.dispose()
+
+    print(f"{database}, {n_members} members, median µs per call over {calls} calls")
+    print(f"{'query':<12}" + "".join(f"{setup:>14}" for setup, _, _ in setups))
+    for name, by_setup in results.items():
+        print(
+            f"{name:<12}"
+            + "".join(f"{by_setup[setup]:>14.1f}" for setup, _, _ in setups)
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database", choices=["sqlite", "postgres"], default="sqlite")
+    parser.add_argument("--members", type=int, default=10_000)
+    parser.add_argument("--calls", type=int, default=2_000)
+    parser.add_argument("--cache-size", type=int, default=256)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(
+        main_async(
+            args.database, args.members, args.calls, args.cache_size, args.rounds
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""Load-test the API in-process against a seeded SQLite or Postgres database.
+
+The FastAPI app is driven through ``httpx.ASGITransport``, so no server is
+started. Results are written as JSON so runs can be diffed between commits.
+
+    python -m benchmarks.load_test --database sqlite --members 10000 \\
+        --requests 500 --concurrency 20 --output load_test.json
+
+``--database postgres`` uses the DB_* variables read by ConnectionDatabase;
+its ``youth_members`` and ``users`` tables are emptied before seeding.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import httpx
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Token signing needs a key; benchmark runs fall back to a throwaway one.
+os.environ.setdefault("SECRET_KEY", "benchmark-only-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+# Every simulated login comes from one client; keep the brute-force limiter
+# out of the way so the scenario measures authentication itself.
+os.environ.setdefault("LOGIN_IP_BURST", "1000000")
+os.environ.setdefault("LOGIN_USER_BURST", "1000000")
+
+SEED_CHUNK_SIZE = 5_000
+BENCH_USER = "bench_user"
+BENCH_PASSWORD = "bench_password"  # nosec B105 - synthetic benchmark user
+T_SHIRTS = ["PP", "P", "M", "G", "GG", "XG", "EG", "G1", "G2", "G3", "G4"]
+SCENARIOS = ["list", "get", "create", "update", "delete", "login"]
+
+
+def synthetic_member(i: int) -> dict[str, Any]:
+    return {
+        "member_name": f"Membro Sintetico {i:07d}",
+        "gender": "Masculino" if i % 2 else "Feminino",
+        "phone_number": f"11{900000000 + i}",
+        "t_shirt": T_SHIRTS[i % len(T_SHIRTS)],
+        "food_allergy": "Sim" if i % 7 == 0 else "Não",
+        "sower": "Sim" if i % 3 == 0 else "Não",
+        "ministry_position": "Sim" if i % 5 == 0 else "Não",
+        "date_birth": date(1995, 1, 1) + timedelta(days=i % 7000),
+        "email": f"membro{i}@exemplo.com",
+    }
+
+
+def build_engine(database: str, sqlite_path: str) -> AsyncEngine:
+    # The app picks its engine from the environment when first imported.
+    os.environ["DB_SGBD"] = database
+    if database == "sqlite":
+        os.environ["SQLITE_PATH"] = sqlite_path
+
+    from src.backend.app.engine_database import engine
+
+    return engine  # type: ignore
+
+
+async def seed(engine: AsyncEngine, n_members: int) -> list[int]:
+    from src.backend.app.crud.create_crud_auth import get_password_hash
+    from src.backend.app.engine_database import Base
+    from src.backend.app.schemas import User, YouthMembersSchema
+
+    table = YouthMembersSchema.__table__
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(delete(table))
+        await conn.execute(delete(User.__table__))
+
+        now = datetime.now(timezone.utc)
+        for start in range(1, n_members + 1, SEED_CHUNK_SIZE):
+            end = min(start + SEED_CHUNK_SIZE, n_members + 1)
+            rows = []
+            for i in range(start, end):
+                rows.append(
+                    synthetic_member(i) | {"create_date": now, "update_date": now}
+                )
+            await conn.execute(table.insert(), rows)
+
+        await conn.execute(
+            User.__table__.insert(),
+            {
+                "username": BENCH_USER,
+                "hashed_password": get_password_hash(BENCH_PASSWORD),
+            },
+        )
+        result = await conn.execute(select(table.c.id_member))
+        return list(result.scalars())
+
+
+def summarize(latencies: list[float], errors: int, wall_seconds: float) -> dict:
+    ordered = sorted(latencies)
+    cuts = (
+        statistics.quantiles(ordered, n=100, method="inclusive")
+        if len(ordered) > 1
+        else ordered * 99
+    )
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / wall_seconds, 2),
+        "p50_ms": round(cuts[49] * 1000, 2),
+        "p95_ms": round(cuts[94] * 1000, 2),
+        "p99_ms": round(cuts[98] * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
+
+
+async def run_scenario(
+    n_requests: int,
+    concurrency: int,
+    call: Callable[[int], Awaitable[httpx.Response]],
+) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def one(i: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            response = await call(i)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(n_requests)))
+    return summarize(latencies, errors, time.perf_counter() - wall_start)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    engine = build_engine(args.database, args.sqlite_path)
+    member_ids = await seed(engine, args.members)
+
+    from src.backend.app.main import app
+
+    rng = random.Random(args.seed)
+    created: list[int] = []
+    results: dict[str, dict] = {}
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+
+        async def create(i: int) -> httpx.Response:
+            payload = synthetic_member(args.members + 1 + i)
+            payload["date_birth"] = payload["date_birth"].isoformat()
+            response = await c.post("/registered/", json=payload)
+            if response.status_code < 400:
+                created.append(response.json()["id_member"])
+            return response
+
+        calls: dict[str, Callable[[int], Awaitable[httpx.Response]]] = {
+            "list": lambda i: c.get("/registered/"),
+            "get": lambda i: c.get(f"/registered/{rng.choice(member_ids)}"),
+            "create": create,
+            "update": lambda i: c.put(
+                f"/registered/{rng.choice(member_ids)}",
+                json={"sower": rng.choice(["Sim", "Não"])},
+            ),
+            "delete": lambda i: c.delete(
+                f"/registered/{created[i] if i < len(created) else member_ids[-1 - i]}"
+            ),
+            "login": lambda i: c.post(
+                "/auth/login",
+                data={"username": BENCH_USER, "password": BENCH_PASSWORD},
+            ),
+        }
+
+        for name in args.scenarios:
+            n_requests = {
+                "list": args.list_requests,
+                "login": args.login_requests,
+            }.get(name, args.requests)
+            results[name] = await run_scenario(
+                n_requests, args.concurrency, calls[name]
+            )
+            print(f"{name:<8} {results[name]}")
+
+    await engine.dispose()
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "database": args.database,
+            "members": args.members,
+            "concurrency": args.concurrency,
+            "python": platform.python_version(),
+        },
+        "scenarios": results,
+    }
+
+
+def git_commit() -> str | None:
+    git_dir = Path(__file__).resolve().parent.parent / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if head.startswith("ref: "):
+            return (git_dir / head[5:]).read_text().strip()
+        return head
+    except OSError:
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database", choices=["sqlite", "postgres"], default="sqlite")
+    parser.add_argument(
+        "--sqlite-path",
+        default=os.path.join(tempfile.gettempdir(), "youth_registry_bench.db"),
+    )
+    parser.add_argument("--members", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--list-requests", type=int, default=20)
+    parser.add_argument("--login-requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="load_test.json")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
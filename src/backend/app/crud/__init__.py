@@ -1,7 +1,32 @@
 from .create_crud_app import (
     create_member as create_member,
     delete_member as delete_member,
+    get_age_brackets as get_age_brackets,
     get_all_members as get_all_members,
+    get_birthdays as get_birthdays,
+    get_deleted_members as get_deleted_members,
+    get_members_version as get_members_version,
     get_participant_by_id as get_member_by_id,
+    parse_member_fields as parse_member_fields,
+    restore_members as restore_members,
+    search_members as search_members,
     update_member as update_member,
 )
+from .create_crud_export import (
+    EXPORT_FORMATS as EXPORT_FORMATS,
+    parse_export_columns as parse_export_columns,
+    stream_members_export as stream_members_export,
+)
+from .create_crud_queue import (
+    REGISTRATION_MODE as REGISTRATION_MODE,
+    registration_queue as registration_queue,
+)
+from .create_crud_events import member_events as member_events
+from .create_crud_audit import (
+    audit_log as audit_log,
+    get_member_audit as get_member_audit,
+)
+from .create_crud_purge import (
+    member_purge_job as member_purge_job,
+    purge_deleted_members as purge_deleted_members,
+)
@@ -1,13 +1,25 @@
+from calendar import isleap
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from hashlib import sha1
 from math import e
 from pathlib import Path
+from typing import List, Optional
 
 from sqlalchemy.exc import IntegrityError
 
 from ..engine_database import engine
+from .create_crud_audit import audit_log, audit_values
+from .create_crud_events import member_events
 from ..schemas import YouthMembersSchema
 from ....utils import SqlReadFile
 from ..validator import (
+    AgeBracketCount,
+    YouthMemberBirthday,
     YouthMemberCreate,
+    YouthMemberDeleted,
+    YouthMemberFilters,
+    YouthMemberPage,
     YouthMemberResponse,
     YouthMembersBase,
     YouthMemberUpdate,
@@ -16,11 +28,22 @@ from ..validator import (
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
+from sqlalchemy import Date, DateTime, bindparam, select, text, tuple_
+from sqlalchemy.sql.selectable import TextualSelect
+
+
+def is_duplicate_member(error: IntegrityError) -> bool:
+    """Whether ``error`` is the member primary key (name, phone, t-shirt)."""
+    # Postgres names the constraint; SQLite lists its columns.
+    message = str(error.orig)
+    return "pk_member_composite" in message or "youth_members.member_name" in message
 
 
 async def create_member(
-    db: AsyncSession, member: YouthMemberCreate, commit: bool = True
+    db: AsyncSession,
+    member: YouthMemberCreate,
+    commit: bool = True,
+    username: Optional[str] = None,
 ) -> YouthMemberResponse:
 
     if not member.member_name or len(member.member_name.strip()) == 0:
@@ -76,6 +99,7 @@ async def create_member(
     if not member.email:
         raise HTTPException(status_code=400, detail="Email não pode estar vazio!")
 
+    key = (member.member_name, member.phone_number, member.t_shirt)
     member = YouthMembersSchema(**member.model_dump())  # type: ignore
 
     try:
@@ -83,11 +107,37 @@ async def create_member(
             db.add(member)
             await db.commit()
             await db.refresh(member)
+            audit_log.record(
+                "insert", member.id_member, username, new_values=audit_values(member)
+            )
+            await member_events.publish(
+                "insert",
+                YouthMemberResponse.model_validate(member).model_dump(mode="json"),
+            )
 
         return member  # type: ignore
     except IntegrityError as e:
-        if "pk_member_composite" in str(e.orig):
+        if is_duplicate_member(e):
             await db.rollback()
+            # Deleted members keep their key until purged, so point to restore.
+            in_trash = await db.execute(
+                select(YouthMembersSchema.id_member).where(
+                    tuple_(
+                        YouthMembersSchema.member_name,
+                        YouthMembersSchema.phone_number,
+                        YouthMembersSchema.t_shirt,
+                    )
+                    == key,
+                    YouthMembersSchema.deleted_at.is_not(None),
+                )
+            )
+            id_deleted = in_trash.scalar()
+            if id_deleted is not None:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Este membro foi excluído (código {id_deleted}); "
+                    "restaure o cadastro em vez de cadastrá-lo novamente.",
+                )
             raise HTTPException(
                 status_code=400, detail="Este membro já está cadastrado."
             )
@@ -96,55 +146,316 @@ async def create_member(
             raise e
 
 
-async def delete_member(db: AsyncSession, id_member: int, commit: bool = True):
-    current_dir = Path(__file__).parent
-
-    validate_member = SqlReadFile(
-        sql_file="validate_id_member", engine=engine, current_dir=current_dir
-    ).read_sql_file()
-
-    query = text(validate_member)
-    result = await db.execute(query, {"id_member": id_member})
-    result_query = result.mappings().first()
+async def delete_member(
+    db: AsyncSession,
+    id_member: int,
+    commit: bool = True,
+    username: Optional[str] = None,
+):
+    delete_query = SqlReadFile(
+        sql_file="delete_member", engine=engine, current_dir=Path(__file__).parent
+    ).statement()
+    result = await db.execute(delete_query, {"id_member": id_member})
+    deleted = result.mappings().first()
 
-    if not result_query:
+    if not deleted:
         raise HTTPException(status_code=404, detail="Membro não encontrado!")
 
-    delete_query = SqlReadFile(
-        sql_file="delete_member", engine=engine, current_dir=current_dir
-    ).read_sql_file()
-    await db.execute(text(delete_query), {"id_member": id_member})
-
     if commit:
         await db.commit()
+        audit_log.record(
+            "delete", id_member, username, old_values=audit_values(deleted)
+        )
+        await member_events.publish("delete", {"id_member": id_member})
 
     return {"detail": f"Jovem {id_member} removido do cadastro com sucesso"}
 
 
-async def get_all_members(db: AsyncSession):
-    all_members = SqlReadFile(
-        sql_file="get_all_members", engine=engine, current_dir=Path(__file__).parent
+async def restore_members(
+    db: AsyncSession, id_members: List[int], username: Optional[str] = None
+) -> List[YouthMemberResponse]:
+    """Undo ``delete_member`` for every id still in the trash, in one statement.
+
+    Ids that are not deleted (or were already purged) are skipped.
+    """
+    restore_query = SqlReadFile(
+        sql_file="restore_members", engine=engine, current_dir=Path(__file__).parent
+    ).statement()
+    query = restore_query.bindparams(bindparam("ids", expanding=True))
+    result = await db.execute(query, {"ids": list(set(id_members))})
+    rows = result.mappings().all()
+    await db.commit()
+
+    restored = []
+    for row in rows:
+        member = YouthMemberResponse.model_validate(row)
+        audit_log.record(
+            "restore", member.id_member, username, new_values=audit_values(row)
+        )
+        await member_events.publish("insert", member.model_dump(mode="json"))
+        restored.append(member)
+    return sorted(restored, key=lambda member: member.id_member)
+
+
+async def get_deleted_members(
+    db: AsyncSession,
+    page: int = 1,
+    page_size: int = 50,
+    since: Optional[datetime] = None,
+) -> List[YouthMemberDeleted]:
+    """Deleted members not yet purged, most recently deleted first.
+
+    With ``since``, only members deleted at or after it: the tombstones a
+    client that last synced at ``since`` has to drop.
+    """
+    deleted_query = SqlReadFile(
+        sql_file="get_deleted_members", engine=engine, current_dir=Path(__file__).parent
+    ).statement()
+    if since is not None and since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+
+    query = deleted_query.bindparams(
+        bindparam("since", type_=DateTime(timezone=True))
+    ).columns(deleted_at=YouthMembersSchema.deleted_at.type)
+    result = await db.execute(
+        query,
+        {"since": since, "limit": page_size, "offset": (page - 1) * page_size},
     )
-    all_members.read_sql_file()
-    rows = await all_members.execute_query_sql()
+    return [YouthMemberDeleted.model_validate(dict(row)) for row in result.mappings()]
+
+
+# Response fields and the SELECT expression that reads each one.
+MEMBER_FIELDS = {
+    "id_member": "id_member",
+    "member_name": "member_name",
+    "gender": "gender",
+    "phone_number": "phone_number",
+    "t_shirt": "RTRIM(t_shirt) AS t_shirt",
+    "food_allergy": "food_allergy",
+    "sower": "sower",
+    "ministry_position": "ministry_position",
+    "date_birth": "date_birth",
+    "email": "email",
+}
+
+
+def parse_member_fields(fields: Optional[str]) -> Optional[tuple[str, ...]]:
+    """Turn ``?fields=a,b`` into the selected fields in canonical order."""
+    if not fields:
+        return None
+
+    selected = {field.strip() for field in fields.split(",") if field.strip()}
+    invalid = sorted(selected - MEMBER_FIELDS.keys())
+    if invalid or not selected:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Campos inválidos: {', '.join(invalid)}",
+        )
+    return tuple(field for field in MEMBER_FIELDS if field in selected)
+
+
+@lru_cache(maxsize=None)
+def _member_rows_query(sql_file: str, fields: tuple[str, ...]) -> TextualSelect:
+    # One statement per query file and field set; fields come in canonical
+    # order, so there are at most 2**10 of them per file.
+    query = SqlReadFile(
+        sql_file=sql_file, engine=engine, current_dir=Path(__file__).parent
+    ).read_sql_file()
+    statement = text(
+        query.format(columns=", ".join(MEMBER_FIELDS[field] for field in fields))
+    )
+    if "date_birth" in fields:
+        return statement.columns(date_birth=YouthMembersSchema.date_birth.type)
+    return statement.columns()
+
+
+async def get_all_members(
+    db: AsyncSession,
+    filters: Optional[YouthMemberFilters] = None,
+    fields: Optional[tuple[str, ...]] = None,
+):
+    """All live members ordered by name, with only ``fields`` when given."""
+    query = _member_rows_query("get_all_members", fields or tuple(MEMBER_FIELDS))
+    result = await db.execute(query, (filters or YouthMemberFilters()).model_dump())
+    rows = result.all()
 
     if not rows:
         raise HTTPException(status_code=404, detail="Não há membro cadastrados")
 
-    return [YouthMemberResponse(**dict(row._mapping)) for row in rows]  # type: ignore
+    # Rows were validated on write, so they are wrapped without re-validation.
+    return [YouthMemberResponse.model_construct(**row._mapping) for row in rows]
+
+
+async def search_members(
+    db: AsyncSession,
+    page: int = 1,
+    page_size: int = 50,
+    search: Optional[str] = None,
+    filters: Optional[YouthMemberFilters] = None,
+    fields: Optional[tuple[str, ...]] = None,
+) -> YouthMemberPage:
+    """Return one page of members ordered by name, optionally matching ``search``.
+
+    ``search`` is a case-insensitive substring of the name, phone or email.
+    Unlike the full listing, an empty page is a normal result, not a 404.
+    ``fields`` limits the columns read for the items.
+    """
+    count_query = SqlReadFile(
+        sql_file="count_members", engine=engine, current_dir=Path(__file__).parent
+    ).statement()
+
+    params = (filters or YouthMemberFilters()).model_dump()
+    search = (search or "").strip().lower()
+    if search:
+        escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        params["search"] = f"%{escaped}%"
+    else:
+        params["search"] = None
+
+    total = (await db.execute(count_query, params)).scalar_one()
+
+    result = await db.execute(
+        _member_rows_query("search_members", fields or tuple(MEMBER_FIELDS)),
+        {**params, "limit": page_size, "offset": (page - 1) * page_size},
+    )
+
+    return YouthMemberPage.model_construct(
+        items=[YouthMemberResponse.model_construct(**row._mapping) for row in result],
+        total=total,
+        page=page,
+        page_size=page_size,
+    )
+
+
+async def get_members_version(
+    db: AsyncSession,
+    filters: Optional[YouthMemberFilters] = None,
+    fields: Optional[tuple[str, ...]] = None,
+) -> str:
+    """Return an ETag that changes whenever a member is created, updated or deleted.
+
+    Each filter and field set is a different representation, so each gets
+    its own ETag.
+    """
+    members_version = SqlReadFile(
+        sql_file="get_members_version",
+        engine=engine,
+        current_dir=Path(__file__).parent,
+    ).statement()
+
+    result = await db.execute(members_version)
+    row = result.mappings().one()
+    fingerprint = (
+        f"{row['total']}:{row['last_id']}:{row['last_update']}:"
+        f"{(filters or YouthMemberFilters()).model_dump_json()}:{fields}"
+    )
+    return f'"{sha1(fingerprint.encode(), usedforsecurity=False).hexdigest()}"'
+
+
+AGE_BRACKET_LIMITS = (12, 15, 18, 25, 30)
+AGE_BRACKETS = ("0-11", "12-14", "15-17", "18-24", "25-29", "30+")
+
+
+def _month_day(day: date) -> int:
+    return day.month * 100 + day.day
+
+
+def _birthday_in_year(date_birth: date, year: int) -> date:
+    # Members born on 29 February celebrate on the 28th in common years.
+    try:
+        return date_birth.replace(year=year)
+    except ValueError:
+        return date(year, 2, 28)
+
+
+def _years_before(day: date, years: int) -> date:
+    return _birthday_in_year(day, day.year - years)
+
+
+async def get_birthdays(
+    db: AsyncSession, date_from: date, date_to: date
+) -> List[YouthMemberBirthday]:
+    """Members with a birthday between ``date_from`` and ``date_to``, inclusive.
+
+    The range may cross the new year; it is matched on the indexed
+    month/day expression as one or two ranges.
+    """
+    if date_to < date_from or date_to - date_from >= timedelta(days=366):
+        raise HTTPException(
+            status_code=400, detail="Intervalo de datas inválido (máximo de um ano)"
+        )
+
+    start, end = _month_day(date_from), _month_day(date_to)
+    if end == 228 and not isleap(date_to.year):
+        # Stored 29 February birthdays are celebrated on the 28th this year.
+        end = 229
+    if date_to.year == date_from.year:
+        ranges = {"start_a": start, "end_a": end, "start_b": 0, "end_b": -1}
+    else:
+        ranges = {"start_a": start, "end_a": 1231, "start_b": 101, "end_b": end}
+
+    birthdays_query = SqlReadFile(
+        sql_file="get_birthdays", engine=engine, current_dir=Path(__file__).parent
+    ).statement()
+    query = birthdays_query.columns(date_birth=YouthMembersSchema.date_birth.type)
+    result = await db.execute(query, ranges)
+
+    birthdays = []
+    for row in result:
+        birthday = _birthday_in_year(row.date_birth, date_from.year)
+        if birthday < date_from:
+            birthday = _birthday_in_year(row.date_birth, date_from.year + 1)
+        birthdays.append(
+            YouthMemberBirthday(
+                id_member=row.id_member,
+                member_name=row.member_name,
+                date_birth=row.date_birth,
+                birthday=birthday,
+                turning_age=birthday.year - row.date_birth.year,
+            )
+        )
+    return sorted(birthdays, key=lambda item: (item.birthday, item.member_name))
+
+
+async def get_age_brackets(
+    db: AsyncSession, today: Optional[date] = None
+) -> List[AgeBracketCount]:
+    """Count members per exact age bracket as of ``today``.
+
+    Each bracket limit becomes a birth-date cutoff, so the counts read only
+    the ``date_birth`` index.
+    """
+    today = today or date.today()
+    age_brackets_query = SqlReadFile(
+        sql_file="get_age_brackets", engine=engine, current_dir=Path(__file__).parent
+    ).statement()
+
+    cutoffs = {
+        f"cutoff_{limit}": _years_before(today, limit) for limit in AGE_BRACKET_LIMITS
+    }
+    query = age_brackets_query.bindparams(
+        *(bindparam(name, type_=Date) for name in cutoffs)
+    )
+    result = await db.execute(query, cutoffs)
+
+    totals = {row.bracket: row.total for row in result}
+    return [
+        AgeBracketCount(bracket=bracket, total=totals.get(bracket, 0))
+        for bracket in AGE_BRACKETS
+    ]
 
 
 async def get_participant_by_id(db: AsyncSession, id_member: int):
     member_by_id = SqlReadFile(
         sql_file="get_member_by_id", engine=engine, current_dir=Path(__file__).parent
-    ).read_sql_file()
+    ).statement()
 
-    result = await db.execute(text(member_by_id), {"id_member": id_member})
+    result = await db.execute(member_by_id, {"id_member": id_member})
     row = result.mappings().first()
     if not row:
         raise HTTPException(status_code=404, detail="Registro de membro não encontrado")
 
-    return YouthMemberResponse.model_validate(dict(row._mapping)).model_dump()
+    return YouthMemberResponse.model_validate(dict(row)).model_dump()
 
 
 async def update_member(
@@ -152,24 +463,39 @@ async def update_member(
     id_member: int,
     member_update: YouthMemberUpdate,
     commit: bool = True,
+    username: Optional[str] = None,
 ):
-
+    current_dir = Path(__file__).parent
     update_member_query = SqlReadFile(
-        sql_file="update_member", engine=engine, current_dir=Path(__file__).parent
-    ).read_sql_file()
+        sql_file="update_member", engine=engine, current_dir=current_dir
+    ).statement()
 
     params = member_update.model_dump(exclude_none=True)
 
     if not params:
         raise HTTPException(status_code=400, detail="Escolha um campo para alterar")
 
+    old_values = None
+    if engine.dialect.name == "sqlite":  # type: ignore
+        # SQLite's RETURNING cannot read the joined copy of the old row that
+        # the Postgres statement returns, so it is read first instead.
+        member_by_id = SqlReadFile(
+            sql_file="get_member_by_id", engine=engine, current_dir=current_dir
+        ).statement()
+        previous = await db.execute(member_by_id, {"id_member": id_member})
+        previous_row = previous.mappings().first()
+        if previous_row:
+            old_values = audit_values(previous_row)
+
     params = member_update.model_dump(exclude_unset=False)
     params["id_member"] = id_member
-    result = await db.execute(text(update_member_query), params=params)
+    result = await db.execute(update_member_query, params=params)
 
     row = result.mappings().first()
     if not row:
         raise HTTPException(status_code=404, detail="Membro não encontrado")
+    if old_values is None:
+        old_values = audit_values(row, prefix="old_")
 
     try:
         if commit:
@@ -178,4 +504,8 @@ async def update_member(
         await db.rollback()
         raise HTTPException(status_code=500, detail="Erro inesperado, tente novamente!")
 
-    return YouthMemberResponse.model_validate(row).model_dump(exclude_none=True)
+    updated = YouthMemberResponse.model_validate(row)
+    if commit:
+        audit_log.record("update", id_member, username, old_values, audit_values(row))
+        await member_events.publish("update", updated.model_dump(mode="json"))
+    return updated.model_dump(exclude_none=True)
@@ -0,0 +1,230 @@
+import asyncio
+import logging
+import os
+import time
+from datetime import date, datetime, timezone
+from typing import Any, List, Mapping, Optional
+
+from dotenv import load_dotenv
+from fastapi import HTTPException
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..engine_database import SessionLocal
+from ..schemas import MemberAudit
+from ..validator import MemberAuditEntry
+from ....utils import registry
+
+load_dotenv()
+AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", 500))
+AUDIT_FLUSH_MS = int(os.getenv("AUDIT_FLUSH_MS", 500))
+AUDIT_MAX_PENDING = int(os.getenv("AUDIT_MAX_PENDING", 100_000))
+
+logger = logging.getLogger(__name__)
+
+audit_batch_rows = registry.histogram(
+    "audit_batch_rows",
+    "Audit records written per batch.",
+    buckets=(1, 5, 10, 25, 50, 100, 200, 500, 1000),
+)
+audit_dropped = registry.counter(
+    "audit_dropped_total", "Audit records dropped because the buffer was full."
+)
+
+AUDITED_FIELDS = (
+    "member_name",
+    "gender",
+    "phone_number",
+    "t_shirt",
+    "food_allergy",
+    "sower",
+    "ministry_position",
+    "date_birth",
+    "email",
+)
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, str):
+        # CHAR columns come back blank-padded on some dialects.
+        return value.rstrip()
+    return value
+
+
+def audit_values(row: Any, prefix: str = "") -> dict[str, Any]:
+    """Pick the audited member fields out of a row mapping or ORM object."""
+    if not isinstance(row, Mapping):
+        return {field: _jsonable(getattr(row, field)) for field in AUDITED_FIELDS}
+    return {field: _jsonable(row[f"{prefix}{field}"]) for field in AUDITED_FIELDS}
+
+
+class AuditLogWriter:
+    """Buffer audit records in memory and insert them in batches.
+
+    ``record`` only queues, so a mutation never waits on the audit insert.
+    The background task writes every ``flush_ms`` or ``batch_size`` records,
+    whichever comes first, and ``stop`` flushes what is left. When the
+    database is unreachable records wait in the buffer, up to
+    ``max_pending``; beyond that new records are dropped and counted.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = AUDIT_BATCH_SIZE,
+        flush_ms: int = AUDIT_FLUSH_MS,
+        max_pending: int = AUDIT_MAX_PENDING,
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_seconds = flush_ms / 1000
+        self.max_pending = max_pending
+        self._queue: Optional[asyncio.Queue[Optional[dict[str, Any]]]] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        registry.gauge(
+            "audit_queue_depth",
+            "Audit records waiting to be written.",
+            lambda: float(self._queue.qsize()) if self._queue is not None else 0.0,
+        )
+
+    def record(
+        self,
+        operation: str,
+        id_member: int,
+        username: Optional[str],
+        old_values: Optional[dict[str, Any]] = None,
+        new_values: Optional[dict[str, Any]] = None,
+    ) -> None:
+        if self._queue is None:
+            logger.warning("Audit writer is not running; %s not recorded", operation)
+            return
+        if self._queue.qsize() >= self.max_pending:
+            audit_dropped.inc()
+            return
+
+        if old_values and new_values:
+            # Updates keep only the fields that actually changed.
+            changed = [k for k in new_values if old_values.get(k) != new_values[k]]
+            old_values = {k: old_values[k] for k in changed}
+            new_values = {k: new_values[k] for k in changed}
+
+        self._queue.put_nowait(
+            {
+                "id_member": id_member,
+                "operation": operation,
+                "username": username,
+                "old_values": old_values,
+                "new_values": new_values,
+                "changed_at": datetime.utcnow(),
+            }
+        )
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run(), name="audit-writer")
+
+    async def stop(self, timeout: float = 10) -> None:
+        if self._worker is None:
+            return
+        # The sentinel ends the worker after it writes everything queued
+        # before it; cancelling would lose the batch being collected.
+        self._queue.put_nowait(None)  # type: ignore
+        try:
+            await asyncio.wait_for(self._worker, timeout)
+        except asyncio.TimeoutError:
+            logger.error(
+                "Audit writer stopped with %d records unwritten",
+                self._queue.qsize(),  # type: ignore
+            )
+        self._worker = None
+        self._queue = None
+
+    async def _next_batch(self) -> tuple[List[dict[str, Any]], bool]:
+        batch: List[dict[str, Any]] = []
+        deadline = None
+        while len(batch) < self.batch_size:
+            if deadline is None:
+                item = await self._queue.get()  # type: ignore
+                deadline = time.monotonic() + self.flush_seconds
+            else:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)  # type: ignore
+                except asyncio.TimeoutError:
+                    break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    async def _run(self) -> None:
+        while True:
+            batch, stopping = await self._next_batch()
+            while batch:
+                try:
+                    await self._write(batch)
+                    break
+                except Exception:
+                    logger.exception("Audit batch of %d failed", len(batch))
+                    await asyncio.sleep(1)
+            if stopping:
+                return
+
+    async def _write(self, batch: List[dict[str, Any]]) -> None:
+        async with SessionLocal() as db:
+            await db.execute(insert(MemberAudit), batch)
+            await db.commit()
+        audit_batch_rows.observe(len(batch))
+
+
+audit_log = AuditLogWriter()
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+async def get_member_audit(
+    db: AsyncSession,
+    id_member: Optional[int] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    page: int = 1,
+    page_size: int = 50,
+) -> tuple[List[MemberAuditEntry], int]:
+    """Newest-first audit records, optionally for one member and time window.
+
+    Both filters match the ``(id_member, changed_at)`` and ``changed_at``
+    indexes.
+    """
+    since, until = _naive_utc(since), _naive_utc(until)
+    if since and until and until < since:
+        raise HTTPException(status_code=400, detail="Intervalo de datas inválido")
+
+    conditions = []
+    if id_member is not None:
+        conditions.append(MemberAudit.id_member == id_member)
+    if since is not None:
+        conditions.append(MemberAudit.changed_at >= since)
+    if until is not None:
+        conditions.append(MemberAudit.changed_at < until)
+
+    total = (
+        await db.execute(
+            select(func.count()).select_from(MemberAudit).where(*conditions)
+        )
+    ).scalar_one()
+    result = await db.execute(
+        select(MemberAudit)
+        .where(*conditions)
+        .order_by(MemberAudit.changed_at.desc(), MemberAudit.id.desc())
+        .limit(page_size)
+        .offset((page - 1) * page_size)
+    )
+    entries = [MemberAuditEntry.model_validate(row) for row in result.scalars()]
+    return entries, total
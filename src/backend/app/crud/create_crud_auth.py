@@ -1,30 +1,91 @@
 from datetime import datetime, timedelta
-from typing import List, Union
+from hashlib import sha256
+from typing import List, Optional, Tuple, Union
 from dotenv import load_dotenv
+import hmac
+import math
 import os
+import secrets
 
-from jose import jwt
+from fastapi import HTTPException, status
+from jose import JWTError, jwt
 from passlib.context import CryptContext
-from sqlalchemy import select
+from sqlalchemy import case, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..schemas.schema_refresh_token import RefreshToken
 from ..schemas.schema_user import User
 from ..validator import UserCreate
+from ....utils import (
+    MemoryTokenBucketBackend,
+    RateLimit,
+    TokenBucketBackend,
+    observe_section,
+    parse_networks,
+    registry,
+)
 
 load_dotenv()
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 14))
+LOGIN_IP_BURST = int(os.getenv("LOGIN_IP_BURST", 20))
+LOGIN_IP_PER_MINUTE = float(os.getenv("LOGIN_IP_PER_MINUTE", 10))
+LOGIN_USER_BURST = int(os.getenv("LOGIN_USER_BURST", 5))
+LOGIN_USER_PER_MINUTE = float(os.getenv("LOGIN_USER_PER_MINUTE", 3))
+# The Streamlit server and the proxies in front of the API, whose forwarded
+# client addresses are believed (comma-separated addresses or CIDR ranges).
+TRUSTED_PROXIES = parse_networks(os.getenv("TRUSTED_PROXIES", ""))
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Verified against when the username does not exist, so unknown and known
+# users cost the same bcrypt round and cannot be told apart by timing.
+DUMMY_PASSWORD_HASH = pwd_context.hash("dummy-password-for-timing")
+
+
+login_rate_limited = registry.counter(
+    "login_rate_limited_total", "Login attempts rejected before authentication."
+)
+login_ip_limit = RateLimit(
+    "login_ip", LOGIN_IP_BURST, LOGIN_IP_PER_MINUTE, MemoryTokenBucketBackend()
+)
+login_user_limit = RateLimit(
+    "login_user", LOGIN_USER_BURST, LOGIN_USER_PER_MINUTE, login_ip_limit.backend
+)
+
+
+def set_rate_limit_backend(backend: TokenBucketBackend) -> None:
+    """Share login buckets through another backend, e.g. one store for all workers."""
+    login_ip_limit.backend = backend
+    login_user_limit.backend = backend
+
+
+async def check_login_rate_limit(client_ip: str, username: str) -> None:
+    """Reject the attempt with 429 before any DB lookup or bcrypt work."""
+    for scope, limit, key in (
+        ("ip", login_ip_limit, client_ip),
+        ("username", login_user_limit, username.strip().lower()),
+    ):
+        retry_after = await limit.hit(key)
+        if retry_after > 0:
+            login_rate_limited.inc(scope=scope)
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Muitas tentativas de login, tente novamente mais tarde",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    with observe_section("bcrypt_verify"):
+        return pwd_context.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    with observe_section("bcrypt_hash"):
+        return pwd_context.hash(password)
 
 
 def create_access_token(
@@ -36,6 +97,77 @@ def create_access_token(
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)  # type: ignore
 
 
+def username_from_token(token: str) -> Optional[str]:
+    """Return the username a valid access token was issued to.
+
+    Forged and expired tokens give None, so a stale session writes an
+    anonymous audit entry instead of one credited to its user.
+    """
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])  # type: ignore
+    except JWTError:
+        return None
+    return payload.get("sub")
+
+
+def hash_refresh_token(token: str) -> str:
+    # Refresh tokens are 256 random bits, so a keyed fast hash is enough;
+    # bcrypt would put the password cost back on every refresh.
+    return hmac.new(SECRET_KEY.encode(), token.encode(), sha256).hexdigest()  # type: ignore
+
+
+async def create_refresh_token(
+    db: AsyncSession, user_id: int, commit: bool = True
+) -> str:
+    now = datetime.utcnow()
+    token = secrets.token_urlsafe(32)
+    await db.execute(
+        delete(RefreshToken).where(
+            RefreshToken.user_id == user_id, RefreshToken.expire_date <= now
+        )
+    )
+    db.add(
+        RefreshToken(
+            user_id=user_id,
+            token_hash=hash_refresh_token(token),
+            expire_date=now + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+    )
+    if commit:
+        await db.commit()
+    return token
+
+
+async def rotate_refresh_token(
+    db: AsyncSession, token: str
+) -> Optional[Tuple[User, str]]:
+    """Exchange a refresh token for a new one; each token works only once."""
+    # Deleting with RETURNING claims the token atomically, so two concurrent
+    # refreshes with the same token cannot both succeed.
+    result = await db.execute(
+        delete(RefreshToken)
+        .where(RefreshToken.token_hash == hash_refresh_token(token))
+        .returning(RefreshToken.user_id, RefreshToken.expire_date)
+    )
+    claimed = result.first()
+    if claimed is None or claimed.expire_date <= datetime.utcnow():
+        await db.commit()
+        return None
+
+    user = await db.get(User, claimed.user_id)
+    if user is None:
+        await db.commit()
+        return None
+
+    new_token = await create_refresh_token(db, claimed.user_id, commit=False)
+    await db.commit()
+    return user, new_token
+
+
+async def revoke_refresh_tokens(db: AsyncSession, user_id: int) -> None:
+    await db.execute(delete(RefreshToken).where(RefreshToken.user_id == user_id))
+
+
 async def get_user(db: AsyncSession, username: str) -> Union[User, None]:
     query = select(User).where(User.username == username)
     result = await db.execute(query)
@@ -56,6 +188,7 @@ async def authenticate_user(
 ) -> Union[User, bool]:
     user = await get_user(db, username)
     if not user:
+        verify_password(password, DUMMY_PASSWORD_HASH)
         return False
     if not verify_password(password, user.hashed_password):  # type: ignore
         return False
@@ -63,36 +196,70 @@ async def authenticate_user(
 
 
 async def delete_user(db: AsyncSession, user_id: int) -> bool:
-    query = select(User).where(User.id == user_id)
-    result = await db.execute(query)
-    user = result.scalars().first()
+    # Refresh tokens go with the user through ON DELETE CASCADE.
+    result = await db.execute(delete(User).where(User.id == user_id).returning(User.id))
+    deleted = result.scalar_one_or_none()
+    await db.commit()
+    return deleted is not None
 
-    if not user:
-        return False
 
-    await db.delete(user)
+async def delete_users(db: AsyncSession, user_ids: List[int]) -> List[int]:
+    """Delete every user in ``user_ids`` in one statement; return the ids found."""
+    result = await db.execute(
+        delete(User).where(User.id.in_(user_ids)).returning(User.id)
+    )
+    deleted = sorted(result.scalars().all())
     await db.commit()
-    return True
+    return deleted
 
 
-async def get_all_users(db: AsyncSession) -> List[User]:
-    query = select(User).order_by(User.id)
+async def get_all_users(
+    db: AsyncSession, page: int = 1, page_size: int = 100
+) -> Tuple[List[User], int]:
+    query = (
+        select(User).order_by(User.id).limit(page_size).offset((page - 1) * page_size)
+    )
     result = await db.execute(query)
-    return result.scalars().all()  # type: ignore
+    total = await db.scalar(select(func.count()).select_from(User))
+    return result.scalars().all(), total or 0  # type: ignore
 
 
 async def reset_user_password(
     db: AsyncSession, user_id: int, new_password: str
 ) -> bool:
-    query = select(User).where(User.id == user_id)
-    result = await db.execute(query)
-    user = result.scalars().first()
-
-    if not user:
+    hashed_password = get_password_hash(new_password)
+    result = await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(hashed_password=hashed_password)
+        .returning(User.id)
+    )
+    if result.scalar_one_or_none() is None:
+        await db.rollback()
         return False
 
-    hashed_password = get_password_hash(new_password)
-    user.hashed_password = hashed_password  # type: ignore
+    # Sessions opened with the old password must log in again.
+    await revoke_refresh_tokens(db, user_id)
     await db.commit()
-    await db.refresh(user)
     return True
+
+
+async def reset_users_passwords(
+    db: AsyncSession, new_passwords: dict[int, str]
+) -> List[int]:
+    """Reset several passwords with one UPDATE; return the ids that exist."""
+    hashed = {
+        user_id: get_password_hash(password)
+        for user_id, password in new_passwords.items()
+    }
+    result = await db.execute(
+        update(User)
+        .where(User.id.in_(hashed))
+        .values(hashed_password=case(hashed, value=User.id))
+        .returning(User.id)
+    )
+    updated = sorted(result.scalars().all())
+    if updated:
+        await db.execute(delete(RefreshToken).where(RefreshToken.user_id.in_(updated)))
+    await db.commit()
+    return updated
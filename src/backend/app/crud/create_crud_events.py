@@ -0,0 +1,224 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import text
+
+from ..engine_database import engine
+from ....utils import registry
+
+load_dotenv()
+MEMBER_EVENTS_BACKEND = os.getenv("MEMBER_EVENTS_BACKEND", "memory").lower()
+MEMBER_EVENTS_BUFFER_SIZE = int(os.getenv("MEMBER_EVENTS_BUFFER_SIZE", 1000))
+MEMBER_EVENTS_HEARTBEAT_SECONDS = float(
+    os.getenv("MEMBER_EVENTS_HEARTBEAT_SECONDS", 15)
+)
+NOTIFY_CHANNEL = "member_events"
+LISTEN_RECONNECT_MAX_SECONDS = 30
+
+logger = logging.getLogger(__name__)
+
+published_events = registry.counter(
+    "member_events_published_total", "Member change events published, by type."
+)
+
+
+def _format_event(event: dict[str, Any]) -> str:
+    return (
+        f"id: {event['id']}\n"
+        f"event: {event['type']}\n"
+        f"data: {json.dumps(event['data'], default=str)}\n\n"
+    )
+
+
+class MemberEventBroker:
+    """Fan member changes out to every open ``/registered/events`` stream.
+
+    Recent events are kept in a ring buffer so a reconnecting client can
+    resume from its ``Last-Event-ID``; when that id has already left the
+    buffer the client gets a ``reset`` event and should reload the list.
+
+    With the ``postgres`` backend, events are published through
+    ``pg_notify`` and every worker delivers what its LISTEN connection
+    receives, so all workers see the same stream. Event ids are publish
+    timestamps in nanoseconds, so they order the same way on every worker.
+    The LISTEN connection is checked every heartbeat and reconnected with
+    backoff when it drops; notifications sent meanwhile are lost, so every
+    stream then gets a ``reset``.
+    """
+
+    def __init__(self, backend: str, buffer_size: int, heartbeat_seconds: float):
+        self.backend = backend
+        self.heartbeat_seconds = heartbeat_seconds
+        self.buffer: deque[dict[str, Any]] = deque(maxlen=buffer_size)
+        self.subscribers: set[asyncio.Queue] = set()
+        self._last_id = 0
+        # Events up to this id are unknown here: published before this
+        # process started or already pushed out of the buffer.
+        self._complete_after = time.time_ns()
+        self._listener: Any = None
+        self._worker: Optional[asyncio.Task] = None
+
+        registry.gauge(
+            "member_event_subscribers",
+            "Open member event streams.",
+            lambda: float(len(self.subscribers)),
+        )
+
+    def _next_id(self) -> int:
+        # Strictly increasing even when two events share a clock tick.
+        self._last_id = max(time.time_ns(), self._last_id + 1)
+        return self._last_id
+
+    def _deliver(self, event: dict[str, Any]) -> None:
+        self._last_id = max(self._last_id, event["id"])
+        if len(self.buffer) == self.buffer.maxlen:
+            self._complete_after = self.buffer[0]["id"]
+        self.buffer.append(event)
+        for queue in self.subscribers:
+            queue.put_nowait(event)
+
+    async def publish(self, event_type: str, data: dict[str, Any]) -> None:
+        event = {"id": self._next_id(), "type": event_type, "data": data}
+        published_events.inc(type=event_type)
+        if self.backend != "postgres":
+            self._deliver(event)
+            return
+
+        # Delivery, including to this worker, happens in the LISTEN callback.
+        async with engine.connect() as conn:  # type: ignore
+            await conn.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {
+                    "channel": NOTIFY_CHANNEL,
+                    "payload": json.dumps(event, default=str),
+                },
+            )
+            await conn.commit()
+
+    async def start(self) -> None:
+        if self.backend != "postgres":
+            return
+        self._worker = asyncio.create_task(self._listen(), name="member-events")
+
+    async def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        await self._close_listener()
+
+    async def _connect_listener(self, lost: asyncio.Event) -> Any:
+        """Open a dedicated LISTEN connection; ``lost`` is set if it closes."""
+        self._listener = await engine.connect()  # type: ignore
+        raw = await self._listener.get_raw_connection()
+
+        def on_notify(connection, pid, channel, payload):
+            try:
+                self._deliver(json.loads(payload))
+            except (ValueError, KeyError):
+                logger.warning("Ignoring malformed member event: %s", payload[:200])
+
+        driver = raw.driver_connection
+        driver.add_termination_listener(lambda connection: lost.set())
+        await driver.add_listener(NOTIFY_CHANNEL, on_notify)
+        return driver
+
+    async def _close_listener(self) -> None:
+        listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        try:
+            # Hands a dead connection back to the pool, which discards it.
+            await listener.invalidate()
+        except Exception:
+            logger.debug("Closing the LISTEN connection failed", exc_info=True)
+
+    async def _listen(self) -> None:
+        backoff, connected_before = 1.0, False
+        while True:
+            lost = asyncio.Event()
+            try:
+                driver = await self._connect_listener(lost)
+            except Exception:
+                logger.exception("Member events LISTEN connection failed")
+                await self._close_listener()
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, LISTEN_RECONNECT_MAX_SECONDS)
+                continue
+
+            if connected_before:
+                logger.warning("Member events LISTEN connection restored")
+                self._reset()
+            connected_before, backoff = True, 1.0
+
+            # The termination callback catches closed sockets; the query
+            # catches connections that hang without being closed.
+            while not lost.is_set():
+                try:
+                    await asyncio.wait_for(lost.wait(), self.heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    try:
+                        await asyncio.wait_for(
+                            driver.execute("SELECT 1"), self.heartbeat_seconds
+                        )
+                    except Exception:
+                        lost.set()
+            logger.warning("Member events LISTEN connection lost; reconnecting")
+            await self._close_listener()
+
+    def _reset(self) -> None:
+        # Events published while nobody listened are gone: every client has
+        # to reload, including those resuming from before the gap.
+        event = {"id": self._next_id(), "type": "reset", "data": {}}
+        self._deliver(event)
+        self._complete_after = event["id"]
+
+    async def stream(self, last_event_id: Optional[str]) -> AsyncIterator[str]:
+        queue: asyncio.Queue = asyncio.Queue()
+        self.subscribers.add(queue)
+        # The backlog is read right after subscribing, so anything published
+        # later is in the queue; ``sent_until`` drops what both contain.
+        backlog = list(self.buffer)
+        complete_after, last_known = self._complete_after, self._last_id
+        sent_until = 0
+        try:
+            # Tells EventSource clients how long to wait before reconnecting.
+            yield "retry: 3000\n\n"
+            if last_event_id is not None:
+                last_id = int(last_event_id) if last_event_id.isdigit() else 0
+                if last_id < complete_after:
+                    sent_until = max(last_known, complete_after)
+                    yield _format_event({"id": sent_until, "type": "reset", "data": {}})
+                else:
+                    for event in backlog:
+                        if event["id"] > last_id:
+                            yield _format_event(event)
+                    sent_until = backlog[-1]["id"] if backlog else 0
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=self.heartbeat_seconds
+                    )
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                if event["id"] <= sent_until:
+                    continue
+                yield _format_event(event)
+        finally:
+            self.subscribers.discard(queue)
+
+
+member_events = MemberEventBroker(
+    MEMBER_EVENTS_BACKEND, MEMBER_EVENTS_BUFFER_SIZE, MEMBER_EVENTS_HEARTBEAT_SECONDS
+)
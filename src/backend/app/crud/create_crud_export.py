@@ -0,0 +1,125 @@
+import csv
+import io
+import os
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable, List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from dotenv import load_dotenv
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from ..engine_database import SessionLocal, engine
+from ..schemas import YouthMembersSchema
+from ..validator import YouthMemberFilters
+from ....utils import SqlReadFile
+
+load_dotenv()
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 5000))
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+EXPORT_COLUMNS = {
+    "id_member": ("id_member", pa.int64()),
+    "member_name": ("member_name", pa.string()),
+    "gender": ("gender", pa.string()),
+    "phone_number": ("phone_number", pa.string()),
+    "t_shirt": ("RTRIM(t_shirt) AS t_shirt", pa.string()),
+    "food_allergy": ("food_allergy", pa.string()),
+    "sower": ("sower", pa.string()),
+    "ministry_position": ("ministry_position", pa.string()),
+    "date_birth": ("date_birth", pa.date32()),
+    "email": ("email", pa.string()),
+    "create_date": ("create_date", pa.timestamp("us", tz="UTC")),
+    "update_date": ("update_date", pa.timestamp("us", tz="UTC")),
+}
+
+
+def parse_export_columns(columns: Optional[str]) -> List[str]:
+    if not columns:
+        return list(EXPORT_COLUMNS)
+
+    selected = [column.strip() for column in columns.split(",") if column.strip()]
+    invalid = [column for column in selected if column not in EXPORT_COLUMNS]
+    if invalid or not selected:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Colunas inválidas para exportação: {', '.join(invalid)}",
+        )
+    return selected
+
+
+def _drain(buffer: io.BytesIO) -> bytes:
+    chunk = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return chunk
+
+
+def _csv_chunk(rows: Iterable[Iterable[Any]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+async def stream_members_export(
+    export_format: str,
+    columns: List[str],
+    filters: Optional[YouthMemberFilters] = None,
+    session_factory: sessionmaker[AsyncSession] = SessionLocal,
+) -> AsyncIterator[bytes]:
+    """Stream the filtered members encoded as CSV, Parquet or Arrow IPC.
+
+    Rows are fetched from the database ``EXPORT_BATCH_SIZE`` at a time and
+    each batch is encoded and yielded before the next one is read, so the
+    whole table is never held in memory.
+    """
+    query = SqlReadFile(
+        sql_file="export_members", engine=engine, current_dir=Path(__file__).parent
+    ).read_sql_file()
+    query = query.format(columns=", ".join(EXPORT_COLUMNS[c][0] for c in columns))
+    params = (filters or YouthMemberFilters()).model_dump()
+
+    schema = pa.schema([(column, EXPORT_COLUMNS[column][1]) for column in columns])
+    buffer = io.BytesIO()
+    writer: Any = None
+
+    if export_format == "csv":
+        yield _csv_chunk([columns])
+    elif export_format == "parquet":
+        writer = pq.ParquetWriter(buffer, schema)
+    else:
+        writer = pa.ipc.new_stream(buffer, schema)
+
+    async with session_factory() as session:
+        statement = text(query).columns(
+            **{c: YouthMembersSchema.__table__.c[c].type for c in columns}
+        )
+        result = await session.stream(
+            statement,
+            params,
+            execution_options={"yield_per": EXPORT_BATCH_SIZE},
+        )
+        async for partition in result.mappings().partitions():
+            if export_format == "csv":
+                yield _csv_chunk(
+                    [row[column] for column in columns] for row in partition
+                )
+                continue
+
+            batch = pa.RecordBatch.from_pylist(
+                [dict(row) for row in partition], schema=schema
+            )
+            writer.write_batch(batch)
+            yield _drain(buffer)
+
+    if writer is not None:
+        writer.close()
+        yield _drain(buffer)
@@ -0,0 +1,115 @@
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import DateTime, bindparam, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..engine_database import SessionLocal, engine
+from ..schemas import MemberAudit
+from .create_crud_audit import audit_log
+from ....utils import SqlReadFile, registry
+
+load_dotenv()
+MEMBER_RETENTION_DAYS = int(os.getenv("MEMBER_RETENTION_DAYS", 30))
+MEMBER_PURGE_INTERVAL_SECONDS = int(os.getenv("MEMBER_PURGE_INTERVAL_SECONDS", 3600))
+MEMBER_PURGE_BATCH_SIZE = int(os.getenv("MEMBER_PURGE_BATCH_SIZE", 500))
+
+logger = logging.getLogger(__name__)
+
+members_purged = registry.counter(
+    "members_purged_total", "Deleted members removed for good after retention."
+)
+
+
+async def purge_deleted_members(
+    db: AsyncSession, cutoff: datetime, batch_size: int = MEMBER_PURGE_BATCH_SIZE
+) -> int:
+    """Hard-delete up to ``batch_size`` members deleted before ``cutoff``.
+
+    Their personal data also goes from the audit history: earlier records
+    keep who changed what and when, with the values cleared, and the purge
+    itself is recorded by id only.
+    """
+    purge_query = SqlReadFile(
+        sql_file="purge_deleted_members",
+        engine=engine,
+        current_dir=Path(__file__).parent,
+    ).statement()
+    query = purge_query.bindparams(bindparam("cutoff", type_=DateTime(timezone=True)))
+    result = await db.execute(query, {"cutoff": cutoff, "batch_size": batch_size})
+    ids = list(result.scalars())
+    if ids:
+        await db.execute(
+            update(MemberAudit)
+            .where(MemberAudit.id_member.in_(ids))
+            .values(old_values=None, new_values=None)
+        )
+    await db.commit()
+
+    for id_member in ids:
+        audit_log.record("purge", id_member, None)
+    members_purged.inc(len(ids))
+    return len(ids)
+
+
+class MemberPurgeJob:
+    """Remove members that have been in the trash longer than the retention.
+
+    Runs every ``interval_seconds``, deleting in batches of ``batch_size``
+    with a commit per batch so locks stay short. Every worker runs its own
+    job; the deletes are idempotent, so overlapping runs only repeat work.
+    """
+
+    def __init__(
+        self,
+        retention_days: int = MEMBER_RETENTION_DAYS,
+        interval_seconds: int = MEMBER_PURGE_INTERVAL_SECONDS,
+        batch_size: int = MEMBER_PURGE_BATCH_SIZE,
+    ) -> None:
+        self.retention = timedelta(days=retention_days)
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._worker: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        self._worker = asyncio.create_task(self._run(), name="member-purge")
+
+    async def stop(self) -> None:
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    async def run_once(self) -> int:
+        cutoff = datetime.now(timezone.utc) - self.retention
+        total = 0
+        while True:
+            async with SessionLocal() as db:
+                purged = await purge_deleted_members(db, cutoff, self.batch_size)
+            total += purged
+            if purged < self.batch_size:
+                return total
+            # Let request traffic in between batches.
+            await asyncio.sleep(0)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                purged = await self.run_once()
+                if purged:
+                    logger.info("Purged %d deleted members", purged)
+            except Exception:
+                logger.exception("Member purge failed")
+            await asyncio.sleep(self.interval_seconds)
+
+
+member_purge_job = MemberPurgeJob()
@@ -0,0 +1,383 @@
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, List, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import exc, insert, select, tuple_
+from sqlalchemy.exc import IntegrityError
+
+from ..engine_database import SessionLocal
+from .create_crud_app import is_duplicate_member
+from .create_crud_audit import audit_log, audit_values
+from .create_crud_events import member_events
+from ..schemas import YouthMembersSchema
+from ..validator import RegistrationTicket, YouthMemberCreate, YouthMemberResponse
+from ....utils import TTLCache, registry
+
+load_dotenv()
+REGISTRATION_MODE = os.getenv("REGISTRATION_MODE", "sync").lower()
+REGISTRATION_JOURNAL_PATH = os.getenv(
+    "REGISTRATION_JOURNAL_PATH", "./registration_journal.jsonl"
+)
+REGISTRATION_JOURNAL_FSYNC = os.getenv("REGISTRATION_JOURNAL_FSYNC", "false") == "true"
+REGISTRATION_BATCH_SIZE = int(os.getenv("REGISTRATION_BATCH_SIZE", 200))
+REGISTRATION_FLUSH_MS = int(os.getenv("REGISTRATION_FLUSH_MS", 200))
+REGISTRATION_TICKET_TTL_SECONDS = int(
+    os.getenv("REGISTRATION_TICKET_TTL_SECONDS", 3600)
+)
+# Failed writes of a batch before its members are retried one by one and
+# the ones that still fail are given up on.
+REGISTRATION_MAX_ATTEMPTS = int(os.getenv("REGISTRATION_MAX_ATTEMPTS", 3))
+REGISTRATION_JOURNAL_COMPACT_BYTES = int(
+    os.getenv("REGISTRATION_JOURNAL_COMPACT_BYTES", 1_048_576)
+)
+
+logger = logging.getLogger(__name__)
+
+batch_rows = registry.histogram(
+    "registration_batch_rows",
+    "Members written per write-behind batch.",
+    buckets=(1, 5, 10, 25, 50, 100, 200, 500, 1000),
+)
+batch_duration = registry.histogram(
+    "registration_batch_seconds", "Time spent writing one write-behind batch."
+)
+
+DUPLICATE_DETAIL = "Este membro já está cadastrado."
+REJECTED_DETAIL = "Não foi possível salvar este cadastro."
+
+# The database is down or saturated: retrying later may succeed, so these
+# never count against a member's attempts.
+UNAVAILABLE_ERRORS = (
+    exc.OperationalError,
+    exc.InterfaceError,
+    exc.TimeoutError,
+    OSError,
+)
+
+
+class RegistrationQueue:
+    """Write-behind buffer for member sign-ups.
+
+    ``submit`` appends the validated member to an append-only journal, queues
+    it and returns a ticket at once. A background task drains the queue into
+    multi-row inserts every ``flush_ms`` or ``batch_size`` members, whichever
+    comes first, and records each ticket's outcome. Batches are marked done in
+    the journal after commit, so members still pending when the process stops
+    are queued again by the next ``start``. The journal is compacted down to
+    those members whenever it grows past ``compact_bytes``.
+
+    While the database is unreachable a batch is retried every
+    ``retry_seconds``. A batch that fails for any other reason
+    ``max_attempts`` times is written one member at a time, and the members
+    that still fail are marked ``failed`` so they cannot block the queue.
+    """
+
+    def __init__(
+        self,
+        journal_path: str,
+        batch_size: int = REGISTRATION_BATCH_SIZE,
+        flush_ms: int = REGISTRATION_FLUSH_MS,
+        fsync: bool = REGISTRATION_JOURNAL_FSYNC,
+        max_attempts: int = REGISTRATION_MAX_ATTEMPTS,
+        compact_bytes: int = REGISTRATION_JOURNAL_COMPACT_BYTES,
+        retry_seconds: float = 1,
+    ) -> None:
+        self.journal_path = Path(journal_path)
+        self.batch_size = batch_size
+        self.flush_seconds = flush_ms / 1000
+        self.fsync = fsync
+        self.max_attempts = max_attempts
+        self.compact_bytes = compact_bytes
+        self.retry_seconds = retry_seconds
+        self._attempts: dict[str, int] = {}
+        self._compacted_bytes = 0
+        self.tickets: TTLCache[RegistrationTicket] = TTLCache(
+            max_entries=100_000, ttl_seconds=REGISTRATION_TICKET_TTL_SECONDS
+        )
+        self._queue: Optional[asyncio.Queue[tuple[str, dict[str, Any]]]] = None
+        self._journal: Any = None
+        self._worker: Optional[asyncio.Task] = None
+
+        registry.gauge(
+            "registration_queue_depth",
+            "Members accepted but not yet written to the database.",
+            lambda: float(self._queue.qsize()) if self._queue is not None else 0.0,
+        )
+
+    def _append(self, record: dict[str, Any]) -> None:
+        self._journal.write(json.dumps(record, default=str) + "\n")
+        self._journal.flush()
+        if self.fsync:
+            os.fsync(self._journal.fileno())
+
+    def _compact(self) -> List[tuple[str, dict[str, Any]]]:
+        """Rewrite the journal with the members not marked done; return them."""
+        if not self.journal_path.exists():
+            return []
+
+        pending: dict[str, dict[str, Any]] = {}
+        with self.journal_path.open(encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn last line from a crash mid-write.
+                    continue
+                if "member" in record:
+                    pending[record["ticket"]] = record["member"]
+                for ticket in record.get("done", []):
+                    pending.pop(ticket, None)
+
+        # Compact the journal down to the members that still need writing.
+        compacted = self.journal_path.with_suffix(".tmp")
+        with compacted.open("w", encoding="utf-8") as journal:
+            for ticket, member in pending.items():
+                journal.write(json.dumps({"ticket": ticket, "member": member}) + "\n")
+        compacted.replace(self.journal_path)
+        self._compacted_bytes = self.journal_path.stat().st_size
+        return list(pending.items())
+
+    def _mark_done(self, tickets: List[str]) -> None:
+        self._append({"done": tickets})
+        for ticket in tickets:
+            self._attempts.pop(ticket, None)
+        # Compacting also rewrites the pending members, so a large backlog
+        # waits until the journal has doubled.
+        size = self._journal.tell()
+        if size >= max(self.compact_bytes, 2 * self._compacted_bytes):
+            self._journal.close()
+            self._compact()
+            self._journal = self.journal_path.open("a", encoding="utf-8")
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        recovered = self._compact()
+        self._journal = self.journal_path.open("a", encoding="utf-8")
+        for ticket, member in recovered:
+            self.tickets.set(
+                ticket, RegistrationTicket(ticket=ticket, status="pending")
+            )
+            self._queue.put_nowait((ticket, member))
+        if recovered:
+            logger.warning("Requeued %d registrations from journal", len(recovered))
+        self._worker = asyncio.create_task(self._run(), name="registration-queue")
+
+    async def stop(self) -> None:
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        # Whatever is left stays pending in the journal for the next start.
+        self._journal.close()
+        self._worker = None
+
+    async def submit(
+        self, member: YouthMemberCreate, username: Optional[str] = None
+    ) -> RegistrationTicket:
+        if self._queue is None:
+            raise RuntimeError("Registration queue is not running")
+
+        ticket = uuid.uuid4().hex
+        # The submitting user rides along for the audit log.
+        payload = {**member.model_dump(mode="json"), "_username": username}
+        self._append({"ticket": ticket, "member": payload})
+        status = RegistrationTicket(ticket=ticket, status="pending")
+        self.tickets.set(ticket, status)
+        self._queue.put_nowait((ticket, payload))
+        return status
+
+    def get_ticket(self, ticket: str) -> Optional[RegistrationTicket]:
+        return self.tickets.get(ticket)
+
+    async def _next_batch(self) -> List[tuple[str, dict[str, Any]]]:
+        batch = [await self._queue.get()]  # type: ignore
+        deadline = time.monotonic() + self.flush_seconds
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))  # type: ignore
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            start = time.perf_counter()
+            try:
+                written = await self._write(batch)
+            except Exception as e:
+                logger.exception("Registration batch of %d failed", len(batch))
+                if not isinstance(e, UNAVAILABLE_ERRORS) and self._count_attempt(batch):
+                    await self._write_one_by_one(batch)
+                else:
+                    await self._retry_later(batch)
+                continue
+            batch_rows.observe(len(batch))
+            batch_duration.observe(time.perf_counter() - start)
+            await self._finish(batch, *written)
+
+    def _count_attempt(self, batch: List[tuple[str, dict[str, Any]]]) -> bool:
+        """Count a failed write; True once a member has used its attempts."""
+        exhausted = False
+        for ticket, _ in batch:
+            self._attempts[ticket] = self._attempts.get(ticket, 0) + 1
+            exhausted = exhausted or self._attempts[ticket] >= self.max_attempts
+        return exhausted
+
+    async def _retry_later(self, batch: List[tuple[str, dict[str, Any]]]) -> None:
+        # The batch stays pending in the journal; retry after a pause instead
+        # of dropping sign-ups while the database is down.
+        await asyncio.sleep(self.retry_seconds)
+        for item in batch:
+            self._queue.put_nowait(item)  # type: ignore
+
+    async def _write_one_by_one(self, batch: List[tuple[str, dict[str, Any]]]) -> None:
+        for position, item in enumerate(batch):
+            ticket = item[0]
+            try:
+                written = await self._write([item])
+            except UNAVAILABLE_ERRORS:
+                logger.exception("Registration %s failed", ticket)
+                await self._retry_later(batch[position:])
+                return
+            except Exception:
+                logger.exception("Registration %s given up", ticket)
+                self.tickets.set(
+                    ticket,
+                    RegistrationTicket(
+                        ticket=ticket, status="failed", detail=REJECTED_DETAIL
+                    ),
+                )
+                self._mark_done([ticket])
+                continue
+            await self._finish([item], *written)
+
+    async def _finish(
+        self,
+        batch: List[tuple[str, dict[str, Any]]],
+        rows: List[dict[str, Any]],
+        failed: dict[int, str],
+        ids: dict[tuple, int],
+    ) -> None:
+        # Committed: nothing below may put the batch back on the queue.
+        self._mark_done([ticket for ticket, _ in batch])
+        await self._settle(batch, rows, failed, ids)
+
+    async def _write(
+        self, batch: List[tuple[str, dict[str, Any]]]
+    ) -> tuple[List[dict[str, Any]], dict[int, str], dict[tuple, int]]:
+        """Insert the batch; the commit is the last database statement."""
+        rows = [
+            YouthMemberCreate.model_validate(member).model_dump() for _, member in batch
+        ]
+        failed: dict[int, str] = {}
+        async with SessionLocal() as db:
+            try:
+                await db.execute(insert(YouthMembersSchema), rows)
+            except IntegrityError:
+                # One duplicate fails the whole statement, so fall back to
+                # row-by-row savepoints to find which members were rejected.
+                await db.rollback()
+                for index, row in enumerate(rows):
+                    try:
+                        async with db.begin_nested():
+                            await db.execute(insert(YouthMembersSchema), [row])
+                    except IntegrityError as e:
+                        failed[index] = (
+                            DUPLICATE_DETAIL
+                            if is_duplicate_member(e)
+                            else REJECTED_DETAIL
+                        )
+
+            # id_member is not returned by every dialect (SQLite fills it in a
+            # trigger), so it is read back through the composite primary key.
+            key = tuple_(
+                YouthMembersSchema.member_name,
+                YouthMembersSchema.phone_number,
+                YouthMembersSchema.t_shirt,
+            )
+            result = await db.execute(
+                select(
+                    YouthMembersSchema.member_name,
+                    YouthMembersSchema.phone_number,
+                    YouthMembersSchema.t_shirt,
+                    YouthMembersSchema.id_member,
+                ).where(
+                    key.in_(
+                        [
+                            (row["member_name"], row["phone_number"], row["t_shirt"])
+                            for row in rows
+                        ]
+                    )
+                )
+            )
+            ids = {
+                (name, phone, t_shirt.strip()): id_member
+                for name, phone, t_shirt, id_member in result
+            }
+            await db.commit()
+        return rows, failed, ids
+
+    async def _settle(
+        self,
+        batch: List[tuple[str, dict[str, Any]]],
+        rows: List[dict[str, Any]],
+        failed: dict[int, str],
+        ids: dict[tuple, int],
+    ) -> None:
+        """Record each ticket's outcome, then audit and publish the inserts.
+
+        The rows are already committed, so a failing side effect is logged
+        and skipped rather than retried.
+        """
+        for index, (ticket, member) in enumerate(batch):
+            row = rows[index]
+            if index in failed:
+                self.tickets.set(
+                    ticket,
+                    RegistrationTicket(
+                        ticket=ticket, status="failed", detail=failed[index]
+                    ),
+                )
+                continue
+            id_member = ids.get(
+                (row["member_name"], row["phone_number"], row["t_shirt"])
+            )
+            self.tickets.set(
+                ticket,
+                RegistrationTicket(ticket=ticket, status="done", id_member=id_member),
+            )
+            if id_member is None:
+                continue
+            try:
+                audit_log.record(
+                    "insert",
+                    id_member,
+                    member.get("_username"),
+                    new_values=audit_values(row),
+                )
+                await member_events.publish(
+                    "insert",
+                    YouthMemberResponse(**row, id_member=id_member).model_dump(
+                        mode="json"
+                    ),
+                )
+            except Exception:
+                logger.exception(
+                    "Audit/event for registered member %s failed", id_member
+                )
+
+
+registration_queue = RegistrationQueue(REGISTRATION_JOURNAL_PATH)
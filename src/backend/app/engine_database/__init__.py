@@ -1,3 +1,16 @@
-from .database import get_db as get_db, engine as engine, SessionLocal as SessionLocal
+from .database import (
+    get_db as get_db,
+    engine as engine,
+    read_engine as read_engine,
+    SessionLocal as SessionLocal,
+)
+from .replica import (
+    READ_PRIMARY_COOKIE as READ_PRIMARY_COOKIE,
+    READ_PRIMARY_HEADER as READ_PRIMARY_HEADER,
+    DB_REPLICA_STICKY_SECONDS as DB_REPLICA_STICKY_SECONDS,
+    get_read_db as get_read_db,
+    read_sessionmaker as read_sessionmaker,
+    replica_monitor as replica_monitor,
+)
 
 from .base import Base as Base
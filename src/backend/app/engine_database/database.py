@@ -1,5 +1,5 @@
-from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncGenerator, Optional
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
 from ....utils import ConnectionDatabase
@@ -14,6 +14,17 @@ SessionLocal: sessionmaker[AsyncSession] = sessionmaker(  # type: ignore
     bind=engine,  # type: ignore
 )  # type: ignore
 
+# Optional read replica; without one, reads use the primary.
+read_engine: Optional[AsyncEngine] = None
+ReadSessionLocal: sessionmaker[AsyncSession] = SessionLocal  # type: ignore
+if connection.replica_configured():
+    read_engine = ConnectionDatabase(replica=True).connect()
+    ReadSessionLocal = sessionmaker(  # type: ignore
+        class_=AsyncSession,
+        expire_on_commit=False,
+        bind=read_engine,  # type: ignore
+    )  # type: ignore
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with SessionLocal() as session:
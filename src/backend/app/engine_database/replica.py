@@ -0,0 +1,169 @@
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, AsyncGenerator, Optional
+
+from dotenv import load_dotenv
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from .database import ReadSessionLocal, SessionLocal, engine, read_engine
+from ....utils import SqlReadFile, registry
+
+load_dotenv()
+DB_REPLICA_MAX_LAG_SECONDS = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", 5))
+DB_REPLICA_CHECK_SECONDS = float(os.getenv("DB_REPLICA_CHECK_SECONDS", 1))
+DB_REPLICA_STICKY_SECONDS = int(os.getenv("DB_REPLICA_STICKY_SECONDS", 5))
+# Set after a write; until it expires the client reads from the primary.
+# Browsers keep the cookie; the Streamlit server shares one HTTP client
+# between its users, so it echoes the header back per user session instead.
+READ_PRIMARY_COOKIE = "read_primary_until"
+READ_PRIMARY_HEADER = "Read-Primary-Until"
+
+logger = logging.getLogger(__name__)
+
+routed_reads = registry.counter(
+    "db_reads_routed_total", "Read sessions opened, by target and reason."
+)
+
+
+class ReplicaMonitor:
+    """Track how far the read replica is behind the primary.
+
+    Every ``check_seconds`` the latest member change (insert, update or
+    delete) is read on both databases. Primary watermarks the replica has
+    not reached yet are kept with the time they were first seen; the lag is
+    the age of the oldest one, so it is measured to within one check
+    interval and does not depend on the replication technology. The
+    replica serves reads while the lag stays under ``max_lag_seconds`` and
+    its check succeeds.
+    """
+
+    def __init__(
+        self,
+        replica: Optional[AsyncEngine],
+        max_lag_seconds: float = DB_REPLICA_MAX_LAG_SECONDS,
+        check_seconds: float = DB_REPLICA_CHECK_SECONDS,
+    ) -> None:
+        self.replica = replica
+        self.max_lag_seconds = max_lag_seconds
+        self.check_seconds = check_seconds
+        self.lag_seconds: float = math.inf
+        self._pending: deque[tuple[float, Any]] = deque()
+        self._worker: Optional[asyncio.Task] = None
+
+        registry.gauge(
+            "db_replica_lag_seconds",
+            "Seconds the read replica is behind the primary.",
+            lambda: self.lag_seconds if self.replica is not None else 0.0,
+        )
+
+    @property
+    def healthy(self) -> bool:
+        return self.replica is not None and self.lag_seconds <= self.max_lag_seconds
+
+    async def start(self) -> None:
+        if self.replica is None:
+            return
+        await self.check()
+        self._worker = asyncio.create_task(self._run(), name="replica-monitor")
+
+    async def stop(self) -> None:
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    async def _watermark(self, target: AsyncEngine) -> Any:
+        query = SqlReadFile(
+            sql_file="get_replication_watermark",
+            engine=target,
+            current_dir=Path(__file__).parent,
+        ).statement()
+        async with target.connect() as conn:
+            return (await conn.execute(query)).scalar()
+
+    async def check(self) -> None:
+        was_healthy = self.healthy
+        try:
+            primary = await self._watermark(engine)  # type: ignore
+            replica = await self._watermark(self.replica)  # type: ignore
+        except Exception:
+            if was_healthy:
+                logger.exception("Replica lag check failed; reading from primary")
+            self.lag_seconds = math.inf
+            return
+
+        now = time.monotonic()
+        if primary is not None and (replica is None or primary > replica):
+            if not self._pending or self._pending[-1][1] != primary:
+                # After a failed or first check there is no telling how long
+                # the replica has been behind, so it counts as too long.
+                first_seen = now if self.lag_seconds != math.inf else -math.inf
+                self._pending.append((first_seen, primary))
+        while self._pending and replica is not None and self._pending[0][1] <= replica:
+            self._pending.popleft()
+        self.lag_seconds = now - self._pending[0][0] if self._pending else 0.0
+
+        if was_healthy and not self.healthy:
+            logger.warning("Replica is lagging; reading from primary")
+        elif self.healthy and not was_healthy:
+            logger.info("Replica caught up; reading from replica")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_seconds)
+            await self.check()
+
+
+replica_monitor = ReplicaMonitor(read_engine)
+
+
+def read_sessionmaker(request: Request) -> sessionmaker[AsyncSession]:
+    """The session factory a read for ``request`` should use.
+
+    Reads go to the replica unless the client wrote within the last
+    ``DB_REPLICA_STICKY_SECONDS`` (so it sees its own writes) or the
+    replica is lagging or unreachable. The write time comes from the
+    ``Read-Primary-Until`` header or, for browsers, the cookie.
+    """
+    if read_engine is None:
+        return SessionLocal
+    if _read_primary_pending(request):
+        routed_reads.inc(target="primary", reason="recent_write")
+        return SessionLocal
+    if not replica_monitor.healthy:
+        routed_reads.inc(target="primary", reason="replica_lag")
+        return SessionLocal
+    routed_reads.inc(target="replica", reason="ok")
+    return ReadSessionLocal
+
+
+def _read_primary_pending(request: Request) -> bool:
+    now = time.time()
+    for value in (
+        request.headers.get(READ_PRIMARY_HEADER),
+        request.cookies.get(READ_PRIMARY_COOKIE),
+    ):
+        try:
+            until = float(value or 0)
+        except ValueError:
+            continue
+        # Deadlines further out than one sticky period were not issued here.
+        if now < until <= now + DB_REPLICA_STICKY_SECONDS:
+            return True
+    return False
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with read_sessionmaker(request)() as session:
+        yield session
@@ -1,6 +1,23 @@
 from fastapi import FastAPI
-from .engine_database import engine, Base
+from fastapi.responses import PlainTextResponse
+from .crud import (
+    REGISTRATION_MODE,
+    audit_log,
+    member_events,
+    member_purge_job,
+    registration_queue,
+)
+from .engine_database import engine, read_engine, replica_monitor, Base
+from .middleware import (
+    admission_middleware,
+    compression_middleware,
+    idempotency_middleware,
+    instrument_engine,
+    instrumentation_middleware,
+    read_your_writes_middleware,
+)
 from .routes import router_register_members, router_auth
+from ...utils import registry
 from dotenv import load_dotenv
 import os
 
@@ -18,11 +35,40 @@ app = FastAPI(
     openapi_url="/openapi.json" if ENV != "PRD" else None,
 )
 
+instrument_engine(engine)  # type: ignore
+if read_engine is not None:
+    instrument_engine(read_engine)
+# Starlette runs the last registered middleware first: instrumentation times
+# everything, compression sits outside the idempotency store so it keeps
+# plain bodies, idempotent replays skip admission but still pin the client's
+# reads to the primary, and admission wraps the routes.
+app.middleware("http")(admission_middleware)
+app.middleware("http")(idempotency_middleware)
+app.middleware("http")(read_your_writes_middleware)
+app.middleware("http")(compression_middleware)
+app.middleware("http")(instrumentation_middleware)
+
 
 @app.on_event("startup")
 async def on_startup():
     async with engine.begin() as conn:  # type: ignore
         await conn.run_sync(Base.metadata.create_all)
+    await audit_log.start()
+    if REGISTRATION_MODE == "queued":
+        await registration_queue.start()
+    await member_events.start()
+    await member_purge_job.start()
+    await replica_monitor.start()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await replica_monitor.stop()
+    await member_purge_job.stop()
+    await registration_queue.stop()
+    await member_events.stop()
+    # Last, so it also flushes records from the queue's final batch.
+    await audit_log.stop()
 
 
 @app.get("/")
@@ -30,6 +76,11 @@ async def read_root():
     return {"status": "online", "message": "API is up and running"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
 app.include_router(router_register_members, prefix="/registered", tags=["members"])
 
 
@@ -0,0 +1,20 @@
+from .admission import (
+    admission_controller as admission_controller,
+    admission_middleware as admission_middleware,
+)
+from .compression import (
+    compression_middleware as compression_middleware,
+    encoded_etag as encoded_etag,
+    matching_etag as matching_etag,
+)
+from .idempotency import (
+    idempotency_middleware as idempotency_middleware,
+    idempotency_store as idempotency_store,
+)
+from .instrumentation import (
+    instrument_engine as instrument_engine,
+    instrumentation_middleware as instrumentation_middleware,
+)
+from .read_your_writes import (
+    read_your_writes_middleware as read_your_writes_middleware,
+)
@@ -0,0 +1,199 @@
+import asyncio
+import math
+import os
+import time
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from dotenv import load_dotenv
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from sqlalchemy.pool import Pool
+from starlette.routing import Match
+
+from ..engine_database import engine
+from ....utils import registry
+
+
+def pool_capacity(pool: Pool) -> Optional[int]:
+    """Connections ``pool`` can hand out at once, if it has a fixed bound."""
+    size = getattr(pool, "size", None)
+    max_overflow = getattr(pool, "_max_overflow", None)
+    if not callable(size) or max_overflow is None or max_overflow < 0:
+        return None
+    return size() + max_overflow
+
+
+load_dotenv()
+ADMISSION_HEAVY_LIMIT = int(os.getenv("ADMISSION_HEAVY_LIMIT", 4))
+ADMISSION_DEFAULT_LIMIT = int(os.getenv("ADMISSION_DEFAULT_LIMIT", 32))
+ADMISSION_MAX_WAIT_MS = int(os.getenv("ADMISSION_MAX_WAIT_MS", 2000))
+# Requests admitted at once across all routes. By default it is the primary
+# pool's pool_size + max_overflow, so admitted requests never queue inside
+# SQLAlchemy for a connection.
+ADMISSION_GLOBAL_LIMIT = (
+    int(os.getenv("ADMISSION_GLOBAL_LIMIT", 0))
+    or pool_capacity(engine.pool)
+    or ADMISSION_DEFAULT_LIMIT
+)
+
+# Routes that read or write many rows, hold big responses in memory or
+# stream for a long time get the low limit; everything else the default.
+HEAVY_ROUTES = {
+    ("GET", "/registered/"),
+    ("GET", "/registered/export"),
+    ("POST", "/auth/bulk-delete"),
+    ("POST", "/auth/bulk-reset-password"),
+}
+# Health and metrics must answer even when the API is saturated. The event
+# stream stays open for as long as a dashboard does and never touches the
+# database, so it would only starve its own slots.
+EXEMPT_PATHS = {"/", "/metrics", "/registered/events"}
+
+admission_wait = registry.histogram(
+    "admission_wait_seconds", "Time requests waited for an admission slot."
+)
+admission_rejected = registry.counter(
+    "admission_rejected_total", "Requests shed with 503 after waiting too long."
+)
+
+
+class RouteLimiter:
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.semaphore = asyncio.Semaphore(limit)
+        self.waiting = 0
+        self.active = 0
+
+
+class AdmissionController:
+    """Per-route and global concurrency limits with a bounded wait.
+
+    A request first takes a slot on its route's semaphore, so a burst on a
+    heavy route queues behind that route's slots only, then a slot on the
+    global semaphore sized to the connection pool. Heavy routes can never
+    hold more than ``heavy_limit`` global slots, which leaves the rest to
+    cheap routes. A request that cannot get both slots within
+    ``max_wait_seconds`` is shed.
+    """
+
+    def __init__(
+        self,
+        heavy_limit: int,
+        default_limit: int,
+        max_wait_seconds: float,
+        global_limit: int,
+    ) -> None:
+        self.heavy_limit = min(heavy_limit, global_limit)
+        self.default_limit = min(default_limit, global_limit)
+        self.max_wait_seconds = max_wait_seconds
+        self.global_limit = global_limit
+        self.global_semaphore = asyncio.Semaphore(global_limit)
+        self.routes: dict[str, RouteLimiter] = {}
+
+    def limiter(self, method: str, path: str) -> RouteLimiter:
+        key = f"{method} {path}"
+        limiter = self.routes.get(key)
+        if limiter is None:
+            limit = (
+                self.heavy_limit
+                if (method, path) in HEAVY_ROUTES
+                else self.default_limit
+            )
+            limiter = self.routes[key] = RouteLimiter(limit)
+        return limiter
+
+    async def acquire(self, limiter: RouteLimiter, route: str) -> bool:
+        start = time.perf_counter()
+        deadline = time.monotonic() + self.max_wait_seconds
+        limiter.waiting += 1
+        try:
+            await asyncio.wait_for(
+                limiter.semaphore.acquire(), timeout=self.max_wait_seconds
+            )
+            try:
+                await asyncio.wait_for(
+                    self.global_semaphore.acquire(),
+                    timeout=max(deadline - time.monotonic(), 0),
+                )
+            except BaseException:
+                limiter.semaphore.release()
+                raise
+        except asyncio.TimeoutError:
+            admission_rejected.inc(route=route)
+            return False
+        finally:
+            limiter.waiting -= 1
+            admission_wait.observe(time.perf_counter() - start, route=route)
+        limiter.active += 1
+        return True
+
+    def release(self, limiter: RouteLimiter) -> None:
+        limiter.active -= 1
+        self.global_semaphore.release()
+        limiter.semaphore.release()
+
+    def queue_depth(self) -> dict[tuple[tuple[str, str], ...], float]:
+        return {
+            (("route", key),): float(limiter.waiting)
+            for key, limiter in self.routes.items()
+        }
+
+
+admission_controller = AdmissionController(
+    ADMISSION_HEAVY_LIMIT,
+    ADMISSION_DEFAULT_LIMIT,
+    ADMISSION_MAX_WAIT_MS / 1000,
+    ADMISSION_GLOBAL_LIMIT,
+)
+registry.gauge(
+    "admission_queue_depth",
+    "Requests waiting for an admission slot, by route.",
+    admission_controller.queue_depth,
+)
+
+
+def _route_path(request: Request) -> Optional[str]:
+    # Routing has not run yet at this point, so match the same way it will.
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return getattr(route, "path", None)
+    return None
+
+
+async def admission_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    path = _route_path(request)
+    if path is None or path in EXEMPT_PATHS:
+        return await call_next(request)
+
+    controller = admission_controller
+    limiter = controller.limiter(request.method, path)
+    route = f"{request.method} {path}"
+    if not await controller.acquire(limiter, route):
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "Servidor sobrecarregado, tente novamente em instantes"},
+            headers={"Retry-After": str(math.ceil(controller.max_wait_seconds))},
+        )
+
+    try:
+        response = await call_next(request)
+    except BaseException:
+        controller.release(limiter)
+        raise
+
+    # The slot is held until the body is fully sent, so streamed exports
+    # count against the limit for their whole duration.
+    body_iterator = response.body_iterator  # type: ignore
+
+    async def release_after_body() -> AsyncIterator[bytes]:
+        try:
+            async for chunk in body_iterator:
+                yield chunk
+        finally:
+            controller.release(limiter)
+
+    response.body_iterator = release_after_body()  # type: ignore
+    return response
@@ -0,0 +1,128 @@
+import gzip
+import os
+from typing import Awaitable, Callable, Optional
+
+from dotenv import load_dotenv
+from fastapi import Request, Response
+from starlette.concurrency import run_in_threadpool
+
+from ....utils import registry
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - gzip still works without it
+    brotli = None
+
+load_dotenv()
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", 1024))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 4))
+
+# Bodies this large are compressed off the event loop.
+THREADED_COMPRESSION_SIZE = 64 * 1024
+
+compressed_bytes = registry.counter(
+    "http_compressed_bytes_total", "Response bytes before and after compression."
+)
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Brotli when the client takes it and the module is installed, else gzip."""
+    accepted = _accepted_encodings(accept_encoding)
+    if brotli is not None and ("br" in accepted or "*" in accepted):
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """Suffix ``etag`` with the content coding, e.g. ``"abc"`` -> ``"abc-br"``.
+
+    A strong ETag names exact bytes, so the gzip and brotli bodies can't
+    share the identity body's tag.
+    """
+    return f'{etag[:-1]}-{encoding}"' if etag.endswith('"') else etag
+
+
+def matching_etag(etag: str, if_none_match: str) -> Optional[str]:
+    """Return the tag in ``If-None-Match`` that names ``etag`` in any encoding."""
+    for tag in (tag.strip() for tag in if_none_match.split(",")):
+        if tag == "*":
+            return etag
+        opaque = tag.removeprefix("W/")
+        if opaque == etag or any(
+            opaque == encoded_etag(etag, encoding) for encoding in ("br", "gzip")
+        ):
+            return tag
+    return None
+
+
+def _add_vary(headers, field: str) -> None:
+    vary = headers.get("vary")
+    if vary is None:
+        headers["vary"] = field
+    elif field.lower() not in vary.lower():
+        headers["vary"] = f"{vary}, {field}"
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)  # type: ignore
+    return gzip.compress(body, compresslevel=COMPRESSION_GZIP_LEVEL)
+
+
+async def compression_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Compress responses of ``COMPRESSION_MINIMUM_SIZE`` bytes or more.
+
+    Only responses with a known length are compressed. Streams (exports and
+    the event stream) go out as they are produced, since buffering them to
+    compress would hold the whole export in memory or delay events.
+    """
+    response = await call_next(request)
+    content_length = int(response.headers.get("content-length", 0))
+    if "content-encoding" in response.headers or (
+        content_length < COMPRESSION_MINIMUM_SIZE and response.status_code != 304
+    ):
+        return response
+
+    # Caches must key these on Accept-Encoding even when this client got
+    # the identity body, or a later gzip/br client would be served it.
+    _add_vary(response.headers, "Accept-Encoding")
+    encoding = choose_encoding(request.headers.get("accept-encoding", ""))
+    if encoding is None or response.status_code == 304:
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])  # type: ignore
+    if len(body) >= THREADED_COMPRESSION_SIZE:
+        compressed = await run_in_threadpool(_compress, body, encoding)
+    else:
+        compressed = _compress(body, encoding)
+    compressed_bytes.inc(len(body), stage="identity")
+    compressed_bytes.inc(len(compressed), stage=encoding)
+
+    headers = dict(response.headers)
+    headers["content-encoding"] = encoding
+    headers["content-length"] = str(len(compressed))
+    if "etag" in headers:
+        headers["etag"] = encoded_etag(headers["etag"], encoding)
+    return Response(
+        content=compressed, status_code=response.status_code, headers=headers
+    )
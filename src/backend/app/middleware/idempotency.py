@@ -0,0 +1,202 @@
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from hashlib import sha256
+from typing import Awaitable, Callable, Optional
+
+from dotenv import load_dotenv
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+
+from ..engine_database import SessionLocal
+from ..schemas import IdempotencyKeySchema
+from ....utils import TTLCache, registry
+
+load_dotenv()
+IDEMPOTENCY_STORE = os.getenv("IDEMPOTENCY_STORE", "memory").lower()
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", 86400))
+IDEMPOTENCY_MAX_KEYS = int(os.getenv("IDEMPOTENCY_MAX_KEYS", 10000))
+
+IDEMPOTENT_METHODS = frozenset({"POST", "PUT", "PATCH"})
+# Member writes only: auth responses carry tokens, which must not be stored,
+# and a replayed /auth/refresh would get around refresh-token rotation.
+IDEMPOTENT_PREFIX = "/registered"
+MAX_KEY_LENGTH = 255
+REPLAYED_HEADERS = ("content-type", "etag", "location")
+
+replayed_requests = registry.counter(
+    "idempotency_replayed_total",
+    "Requests answered from the idempotency store without running the route.",
+)
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    fingerprint: str
+    status_code: int
+    headers: dict[str, str]
+    body: bytes
+
+
+class MemoryIdempotencyStore:
+    """Responses kept in a bounded in-process LRU until their TTL expires."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._cache: TTLCache[StoredResponse] = TTLCache(max_entries, ttl_seconds)
+
+    async def get(self, key: str) -> Optional[StoredResponse]:
+        return self._cache.get(key)
+
+    async def put(self, key: str, stored: StoredResponse) -> None:
+        self._cache.set(key, stored)
+
+
+class DatabaseIdempotencyStore(MemoryIdempotencyStore):
+    """Memory LRU in front of the ``idempotency_keys`` table.
+
+    The table lets replays survive restarts and be shared between workers;
+    expired rows are purged on each write.
+    """
+
+    async def get(self, key: str) -> Optional[StoredResponse]:
+        stored = await super().get(key)
+        if stored is not None:
+            return stored
+
+        async with SessionLocal() as db:
+            row = await db.get(IdempotencyKeySchema, key)
+        if row is None or row.expire_date <= datetime.utcnow():  # type: ignore
+            return None
+
+        stored = StoredResponse(
+            fingerprint=row.fingerprint,  # type: ignore
+            status_code=row.status_code,  # type: ignore
+            headers=json.loads(row.headers),  # type: ignore
+            body=row.body,  # type: ignore
+        )
+        await super().put(key, stored)
+        return stored
+
+    async def put(self, key: str, stored: StoredResponse) -> None:
+        await super().put(key, stored)
+
+        now = datetime.utcnow()
+        async with SessionLocal() as db:
+            await db.execute(
+                delete(IdempotencyKeySchema).where(
+                    IdempotencyKeySchema.expire_date <= now
+                )
+            )
+            db.add(
+                IdempotencyKeySchema(
+                    idempotency_key=key,
+                    fingerprint=stored.fingerprint,
+                    status_code=stored.status_code,
+                    headers=json.dumps(stored.headers),
+                    body=stored.body,
+                    expire_date=now + timedelta(seconds=self.ttl_seconds),
+                )
+            )
+            try:
+                await db.commit()
+            except IntegrityError:
+                # Another worker stored the same key first; its copy wins.
+                await db.rollback()
+
+
+def build_idempotency_store() -> MemoryIdempotencyStore:
+    if IDEMPOTENCY_STORE == "memory":
+        return MemoryIdempotencyStore(IDEMPOTENCY_MAX_KEYS, IDEMPOTENCY_TTL_SECONDS)
+    if IDEMPOTENCY_STORE == "database":
+        return DatabaseIdempotencyStore(IDEMPOTENCY_MAX_KEYS, IDEMPOTENCY_TTL_SECONDS)
+    raise ValueError(
+        f"Unsupported IDEMPOTENCY_STORE '{IDEMPOTENCY_STORE}', "
+        "expected 'memory' or 'database'"
+    )
+
+
+idempotency_store = build_idempotency_store()
+_in_flight: set[str] = set()
+
+
+async def idempotency_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Replay the first response to any write retried with the same ``Idempotency-Key``.
+
+    Only member writes under ``/registered`` take part. Keys are scoped by
+    method and path. A replay never reaches the route, so
+    a retried create costs no insert and no rollback on the primary key.
+    Server errors are not stored, so those requests can be retried for real.
+    """
+    key = request.headers.get("idempotency-key")
+    path = request.url.path
+    if (
+        request.method not in IDEMPOTENT_METHODS
+        or not key
+        or not (path == IDEMPOTENT_PREFIX or path.startswith(f"{IDEMPOTENT_PREFIX}/"))
+    ):
+        return await call_next(request)
+
+    if len(key) > MAX_KEY_LENGTH:
+        return JSONResponse(
+            status_code=400,
+            content={
+                "detail": f"Idempotency-Key maior que {MAX_KEY_LENGTH} caracteres"
+            },
+        )
+
+    scoped_key = f"{request.method} {request.url.path} {key}"
+    fingerprint = sha256(await request.body()).hexdigest()
+
+    stored = await idempotency_store.get(scoped_key)
+    if stored is not None:
+        if stored.fingerprint != fingerprint:
+            return JSONResponse(
+                status_code=422,
+                content={"detail": "Idempotency-Key já usada com outro conteúdo"},
+            )
+        replayed_requests.inc(route=request.url.path)
+        return Response(
+            content=stored.body,
+            status_code=stored.status_code,
+            headers={**stored.headers, "Idempotent-Replayed": "true"},
+        )
+
+    if scoped_key in _in_flight:
+        return JSONResponse(
+            status_code=409,
+            content={"detail": "Requisição com esta Idempotency-Key em andamento"},
+        )
+
+    _in_flight.add(scoped_key)
+    try:
+        response = await call_next(request)
+        if response.status_code >= 500:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])  # type: ignore
+        await idempotency_store.put(
+            scoped_key,
+            StoredResponse(
+                fingerprint=fingerprint,
+                status_code=response.status_code,
+                headers={
+                    name: value
+                    for name, value in response.headers.items()
+                    if name in REPLAYED_HEADERS
+                },
+                body=body,
+            ),
+        )
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+        )
+    finally:
+        _in_flight.discard(scoped_key)
@@ -0,0 +1,121 @@
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable
+
+from dotenv import load_dotenv
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ....utils import RequestStats, registry, request_stats
+from ....utils.sql_read_file import SQL_FILE_TAG
+
+load_dotenv()
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", 500))
+
+logger = logging.getLogger(__name__)
+
+request_duration = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route."
+)
+request_db_duration = registry.histogram(
+    "http_request_db_seconds", "Time spent executing SQL per HTTP request."
+)
+request_db_queries = registry.histogram(
+    "http_request_db_queries",
+    "Number of SQL statements executed per HTTP request.",
+    buckets=(0, 1, 2, 3, 5, 10, 25, 50, 100),
+)
+query_duration = registry.histogram(
+    "db_query_duration_seconds", "SQL statement latency by source file."
+)
+pool_wait = registry.histogram(
+    "db_pool_wait_seconds", "Time spent waiting for a pooled connection."
+)
+slow_queries = registry.counter(
+    "db_slow_queries_total", "SQL statements slower than SLOW_QUERY_MS."
+)
+
+
+def _sql_file(statement: str) -> str:
+    if statement.startswith(SQL_FILE_TAG):
+        return statement[len(SQL_FILE_TAG) : statement.find("\n")]
+    return "orm"
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Attach query timing and pool wait hooks to ``engine``."""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        sql_file = _sql_file(statement)
+        query_duration.observe(elapsed, sql_file=sql_file)
+
+        stats = request_stats.get()
+        if stats is not None:
+            stats.db_seconds += elapsed
+            stats.db_queries += 1
+
+        if elapsed * 1000 >= SLOW_QUERY_MS:
+            slow_queries.inc(sql_file=sql_file)
+            logger.warning(
+                "Slow query (%.1f ms) from %s: %s",
+                elapsed * 1000,
+                sql_file,
+                " ".join(statement.split())[:300],
+            )
+
+    # The pool has no "before checkout" event, so the blocking _do_get call
+    # is wrapped to measure how long requests wait for a free connection.
+    pool: Any = sync_engine.pool
+    do_get = pool._do_get
+
+    def timed_do_get():
+        start = time.perf_counter()
+        try:
+            return do_get()
+        finally:
+            elapsed = time.perf_counter() - start
+            pool_wait.observe(elapsed)
+            stats = request_stats.get()
+            if stats is not None:
+                stats.pool_wait_seconds += elapsed
+
+    pool._do_get = timed_do_get
+
+    registry.gauge(
+        "db_pool_checked_out",
+        "Connections currently checked out of the pool.",
+        lambda: float(pool.checkedout()) if hasattr(pool, "checkedout") else 0.0,
+    )
+
+
+async def instrumentation_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    stats = RequestStats()
+    token = request_stats.set(stats)
+    start = time.perf_counter()
+    status_code = "500"
+    try:
+        response = await call_next(request)
+        status_code = str(response.status_code)
+        return response
+    finally:
+        elapsed = time.perf_counter() - start
+        request_stats.reset(token)
+
+        route = request.scope.get("route")
+        path = getattr(route, "path", "unmatched")
+        request_duration.observe(
+            elapsed, method=request.method, route=path, status=status_code
+        )
+        request_db_duration.observe(stats.db_seconds, route=path)
+        request_db_queries.observe(stats.db_queries, route=path)
@@ -0,0 +1,45 @@
+import time
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+
+from ..engine_database import (
+    DB_REPLICA_STICKY_SECONDS,
+    READ_PRIMARY_COOKIE,
+    READ_PRIMARY_HEADER,
+    read_engine,
+)
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+MEMBER_PREFIX = "/registered"
+
+
+async def read_your_writes_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Pin a client's reads to the primary for a moment after it writes.
+
+    Successful member writes return the deadline in the
+    ``Read-Primary-Until`` header and a short-lived cookie. ``get_read_db``
+    honours either one, so the client's next reads see its change even
+    before the replica has it. Browsers send the cookie back on their own;
+    the Streamlit server keeps no cookies and echoes the header for the user
+    who wrote. Without a replica there is nothing to pin.
+    """
+    response = await call_next(request)
+    if (
+        read_engine is not None
+        and request.method in WRITE_METHODS
+        and request.url.path.startswith(MEMBER_PREFIX)
+        and response.status_code < 400
+    ):
+        until = f"{time.time() + DB_REPLICA_STICKY_SECONDS:.3f}"
+        response.headers[READ_PRIMARY_HEADER] = until
+        response.set_cookie(
+            READ_PRIMARY_COOKIE,
+            until,
+            max_age=DB_REPLICA_STICKY_SECONDS,
+            httponly=True,
+            samesite="lax",
+        )
+    return response
@@ -1,27 +1,64 @@
 from datetime import timedelta
-from typing import List
-
-from fastapi import APIRouter, Depends, HTTPException, Path, status
+from typing import Any, List
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..engine_database import get_db
 from ..schemas import User
-from ..validator import UserCreate, UserResponse, UserUpdatePassword
+from ..validator import (
+    RefreshTokenRequest,
+    UserBulkDelete,
+    UserBulkResult,
+    UserBulkUpdatePassword,
+    UserCreate,
+    UserResponse,
+    UserUpdatePassword,
+)
 from ..crud.create_crud_auth import (
     create_access_token,
     ACCESS_TOKEN_EXPIRE_MINUTES,
     authenticate_user,
+    check_login_rate_limit,
+    create_refresh_token,
+    rotate_refresh_token,
     get_user,
     create_user,
     delete_user,
+    delete_users,
     get_all_users,
     reset_user_password,
+    reset_users_passwords,
+    TRUSTED_PROXIES,
 )
+from ....utils import client_address
 
 router_auth = APIRouter()
 
 
+def issue_tokens(user: User, refresh_token: str) -> dict[str, Any]:
+    access_token = create_access_token(
+        data={"sub": user.username},
+        expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
+    )
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "expires_in": ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        "refresh_token": refresh_token,
+    }
+
+
 @router_auth.post("/register", response_model=UserResponse)
 async def register_endpoint(
     user: UserCreate, db: AsyncSession = Depends(get_db)
@@ -36,8 +73,17 @@ async def register_endpoint(
 
 @router_auth.post("/login")
 async def login_endpoint(
-    from_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)
-) -> dict[str, str]:
+    request: Request,
+    from_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, Any]:
+    client_ip = client_address(
+        request.client.host if request.client else None,
+        request.headers,
+        TRUSTED_PROXIES,
+    )
+    await check_login_rate_limit(client_ip, from_data.username)
+
     user = await authenticate_user(db, from_data.username, from_data.password)
     if not user:
         raise HTTPException(
@@ -45,11 +91,23 @@ async def login_endpoint(
             detail="Usuário ou senha incorretos",
         )
 
-    access_token = create_access_token(
-        data={"sub": user.username},  # type: ignore
-        expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
-    )
-    return {"access_token": access_token, "token_type": "bearer"}
+    refresh_token = await create_refresh_token(db, user.id)  # type: ignore
+    return issue_tokens(user, refresh_token)  # type: ignore
+
+
+@router_auth.post("/refresh")
+async def refresh_endpoint(
+    data: RefreshTokenRequest, db: AsyncSession = Depends(get_db)
+) -> dict[str, Any]:
+    rotated = await rotate_refresh_token(db, data.refresh_token)
+    if rotated is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Sessão expirada, faça login novamente",
+        )
+
+    user, refresh_token = rotated
+    return issue_tokens(user, refresh_token)
 
 
 @router_auth.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -67,10 +125,37 @@ async def delete_user_endpoint(
 
 @router_auth.get("/", response_model=List[UserResponse])
 async def get_all_users_endpoint(
+    response: Response,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(100, ge=1, le=500),
     db: AsyncSession = Depends(get_db),
 ) -> List[UserResponse]:
-    users = await get_all_users(db)
-    return users
+    users, total = await get_all_users(db, page, page_size)
+    response.headers["X-Total-Count"] = str(total)
+    return users  # type: ignore
+
+
+@router_auth.post("/bulk-delete", response_model=UserBulkResult)
+async def bulk_delete_users_endpoint(
+    data: UserBulkDelete, db: AsyncSession = Depends(get_db)
+) -> UserBulkResult:
+    deleted = await delete_users(db, data.user_ids)
+    return UserBulkResult(
+        affected=deleted,
+        not_found=sorted(set(data.user_ids) - set(deleted)),
+    )
+
+
+@router_auth.post("/bulk-reset-password", response_model=UserBulkResult)
+async def bulk_reset_password_endpoint(
+    data: UserBulkUpdatePassword, db: AsyncSession = Depends(get_db)
+) -> UserBulkResult:
+    new_passwords = {item.user_id: item.new_password for item in data.items}
+    updated = await reset_users_passwords(db, new_passwords)
+    return UserBulkResult(
+        affected=updated,
+        not_found=sorted(set(new_passwords) - set(updated)),
+    )
 
 
 @router_auth.post("/reset-password")
@@ -1,37 +1,279 @@
-from typing import Any, List
+from datetime import date, datetime, timedelta
+from typing import Any, List, Literal, Optional
 
-from fastapi import APIRouter, Depends, Path
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from ..engine_database import get_db
-from ..validator import YouthMemberCreate, YouthMemberResponse, YouthMemberUpdate
+from ..engine_database import get_db, get_read_db, read_sessionmaker
+from ..validator import (
+    AgeBracketCount,
+    MemberAuditEntry,
+    MemberRestore,
+    MemberRestoreResult,
+    RegistrationTicket,
+    YouthMemberBirthday,
+    YouthMemberCreate,
+    YouthMemberDeleted,
+    YouthMemberFilters,
+    YouthMemberPage,
+    YouthMemberResponse,
+    YouthMemberResponseList,
+    YouthMemberUpdate,
+)
+from ....utils import observe_section
 from ..crud import (
+    EXPORT_FORMATS,
+    REGISTRATION_MODE,
     create_member,
     delete_member,
+    get_age_brackets,
     get_all_members,
+    get_birthdays,
+    get_deleted_members,
+    get_member_audit,
     get_member_by_id,
+    get_members_version,
+    member_events,
+    parse_export_columns,
+    parse_member_fields,
+    registration_queue,
+    restore_members,
+    search_members,
+    stream_members_export,
     update_member,
 )
+from ..crud.create_crud_auth import get_user, username_from_token
+from ..middleware import matching_etag
 
 router_register_members = APIRouter()
 
 
+async def get_request_username(
+    authorization: Optional[str] = Header(None),
+) -> Optional[str]:
+    # Member routes accept anonymous writes; a bearer token, when sent,
+    # names the user in the audit log.
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return username_from_token(token)
+
+
+async def get_current_user(
+    username: Optional[str] = Depends(get_request_username),
+    db: AsyncSession = Depends(get_db),
+) -> str:
+    # The audit log and the deleted members expose personal data, so these
+    # reads need a valid token of a user that still exists.
+    if username is None or await get_user(db, username) is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Não autenticado",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return username
+
+
 @router_register_members.get("/", response_model=List[YouthMemberResponse])
 async def get_all_members_endpoint(
+    request: Request,
+    fields: Optional[str] = Query(None, description="Campos separados por vírgula"),
+    filters: YouthMemberFilters = Depends(),
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    selected_fields = parse_member_fields(fields)
+    # The version probe is a single aggregate query, so clients holding a
+    # current copy get a 304 without the list being read or serialized.
+    etag = await get_members_version(db, filters, selected_fields)
+    # The client may hold a gzip or brotli copy, tagged by the compression
+    # middleware; the 304 confirms the tag it sent.
+    cached = matching_etag(etag, request.headers.get("if-none-match", ""))
+    if cached is not None:
+        return Response(status_code=304, headers={"ETag": cached})
+
+    # Members are already validated in the CRUD layer; returning a Response
+    # skips the response_model re-validation and serializes in one pass.
+    members = await get_all_members(db, filters, selected_fields)
+    with observe_section("serialize_members"):
+        content = YouthMemberResponseList.dump_json(
+            members,
+            include={"__all__": set(selected_fields)} if selected_fields else None,
+        )
+    return Response(
+        content=content, media_type="application/json", headers={"ETag": etag}
+    )
+
+
+@router_register_members.get("/page", response_model=YouthMemberPage)
+async def search_members_endpoint(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=500),
+    search: Optional[str] = Query(None, max_length=100),
+    fields: Optional[str] = Query(None, description="Campos separados por vírgula"),
+    filters: YouthMemberFilters = Depends(),
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    selected_fields = parse_member_fields(fields)
+    members_page = await search_members(
+        db, page, page_size, search, filters, selected_fields
+    )
+    with observe_section("serialize_members"):
+        content = members_page.model_dump_json(
+            include=(
+                {
+                    "items": {"__all__": set(selected_fields)},
+                    "total": True,
+                    "page": True,
+                    "page_size": True,
+                }
+                if selected_fields
+                else None
+            )
+        )
+    return Response(content=content, media_type="application/json")
+
+
+@router_register_members.get("/birthdays", response_model=List[YouthMemberBirthday])
+async def get_birthdays_endpoint(
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    db: AsyncSession = Depends(get_read_db),
+) -> List[YouthMemberBirthday]:
+    # Defaults to the next 30 days.
+    date_from = date_from or date.today()
+    date_to = date_to or date_from + timedelta(days=30)
+    return await get_birthdays(db, date_from, date_to)
+
+
+@router_register_members.get(
+    "/stats/age-brackets", response_model=List[AgeBracketCount]
+)
+async def get_age_brackets_endpoint(
+    db: AsyncSession = Depends(get_read_db),
+) -> List[AgeBracketCount]:
+    return await get_age_brackets(db)
+
+
+@router_register_members.get("/export")
+async def export_members_endpoint(
+    request: Request,
+    export_format: Literal["csv", "parquet", "arrow"] = Query("csv", alias="format"),
+    columns: Optional[str] = Query(None, description="Colunas separadas por vírgula"),
+    filters: YouthMemberFilters = Depends(),
+) -> StreamingResponse:
+    selected_columns = parse_export_columns(columns)
+    return StreamingResponse(
+        stream_members_export(
+            export_format, selected_columns, filters, read_sessionmaker(request)
+        ),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="members.{export_format}"'
+        },
+    )
+
+
+@router_register_members.get("/events")
+async def member_events_endpoint(
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+) -> StreamingResponse:
+    # Server-sent events: ``insert`` and ``update`` carry the member,
+    # ``delete`` its id and ``reset`` means the list must be reloaded.
+    return StreamingResponse(
+        member_events.stream(last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router_register_members.get("/audit", response_model=List[MemberAuditEntry])
+async def get_member_audit_endpoint(
+    response: Response,
+    id_member: Optional[int] = Query(None),
+    since: Optional[datetime] = Query(None),
+    until: Optional[datetime] = Query(None),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=500),
     db: AsyncSession = Depends(get_db),
-) -> List[YouthMemberResponse]:
-    return await get_all_members(db)
+    _: str = Depends(get_current_user),
+) -> List[MemberAuditEntry]:
+    entries, total = await get_member_audit(
+        db, id_member, since, until, page, page_size
+    )
+    response.headers["X-Total-Count"] = str(total)
+    return entries
 
 
-@router_register_members.post("/", response_model=YouthMemberResponse)
+@router_register_members.get("/deleted", response_model=List[YouthMemberDeleted])
+async def get_deleted_members_endpoint(
+    since: Optional[datetime] = Query(None),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_db),
+    _: str = Depends(get_current_user),
+) -> List[YouthMemberDeleted]:
+    return await get_deleted_members(db, page, page_size, since)
+
+
+@router_register_members.post("/restore", response_model=MemberRestoreResult)
+async def restore_members_endpoint(
+    data: MemberRestore,
+    db: AsyncSession = Depends(get_db),
+    username: Optional[str] = Depends(get_request_username),
+) -> MemberRestoreResult:
+    restored = await restore_members(db, data.id_members, username)
+    return MemberRestoreResult(
+        restored=restored,
+        not_found=sorted(
+            set(data.id_members) - {member.id_member for member in restored}
+        ),
+    )
+
+
+@router_register_members.post(
+    "/",
+    response_model=YouthMemberResponse,
+    responses={202: {"model": RegistrationTicket}},
+)
 async def create_member_endpoint(
-    member: YouthMemberCreate, db: AsyncSession = Depends(get_db)
-) -> YouthMemberResponse:
-    return await create_member(db, member)
+    member: YouthMemberCreate,
+    db: AsyncSession = Depends(get_db),
+    username: Optional[str] = Depends(get_request_username),
+) -> Any:
+    if REGISTRATION_MODE != "queued":
+        return await create_member(db, member, username=username)
+
+    # Validate now so bad input still fails fast, then leave the insert to
+    # the write-behind queue.
+    await create_member(db, member, commit=False)
+    ticket = await registration_queue.submit(member, username)
+    return JSONResponse(
+        status_code=202,
+        content=ticket.model_dump(),
+        headers={"Location": f"/registered/tickets/{ticket.ticket}"},
+    )
+
+
+@router_register_members.get("/tickets/{ticket}", response_model=RegistrationTicket)
+async def get_registration_ticket_endpoint(ticket: str) -> RegistrationTicket:
+    status = registration_queue.get_ticket(ticket)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Ticket não encontrado")
+    return status
 
 
 @router_register_members.get("/{id_member}", response_model=YouthMemberResponse)
 async def get_member_by_id_endpoint(
-    id_member: int = Path(...), db: AsyncSession = Depends(get_db)
+    id_member: int = Path(...), db: AsyncSession = Depends(get_read_db)
 ) -> dict[str, Any]:
     return await get_member_by_id(db, id_member)
 
@@ -41,12 +283,31 @@ async def update_member_endpoint(
     id_member: int,
     member_update: YouthMemberUpdate,
     db: AsyncSession = Depends(get_db),
+    username: Optional[str] = Depends(get_request_username),
 ) -> dict[str, Any]:
-    return await update_member(db, id_member, member_update)
+    return await update_member(db, id_member, member_update, username=username)
+
+
+@router_register_members.post(
+    "/{id_member}/restore", response_model=YouthMemberResponse
+)
+async def restore_member_endpoint(
+    id_member: int,
+    db: AsyncSession = Depends(get_db),
+    username: Optional[str] = Depends(get_request_username),
+) -> YouthMemberResponse:
+    restored = await restore_members(db, [id_member], username)
+    if not restored:
+        raise HTTPException(
+            status_code=404, detail="Membro não encontrado entre os excluídos"
+        )
+    return restored[0]
 
 
 @router_register_members.delete("/{id_member}")
 async def delete_member_endpoint(
-    id_member: int, db: AsyncSession = Depends(get_db)
+    id_member: int,
+    db: AsyncSession = Depends(get_db),
+    username: Optional[str] = Depends(get_request_username),
 ) -> dict[str, str]:
-    return await delete_member(db, id_member)
+    return await delete_member(db, id_member, username=username)
@@ -1,2 +1,5 @@
 from .youth_members_schema import YouthMembersSchema as YouthMembersSchema
 from .schema_user import User as User
+from .idempotency_key_schema import IdempotencyKeySchema as IdempotencyKeySchema
+from .schema_refresh_token import RefreshToken as RefreshToken
+from .schema_member_audit import MemberAudit as MemberAudit
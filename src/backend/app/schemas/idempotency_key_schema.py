@@ -0,0 +1,16 @@
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, String, Text
+
+from ..engine_database.base import Base
+
+
+class IdempotencyKeySchema(Base):
+    __tablename__ = "idempotency_keys"
+
+    idempotency_key: Column[str] = Column(String(300), primary_key=True)
+    fingerprint: Column[str] = Column(String(64), nullable=False)
+    status_code: Column[int] = Column(Integer, nullable=False)
+    headers: Column[str] = Column(Text, nullable=False)
+    body: Column[bytes] = Column(LargeBinary, nullable=False)
+    # Naive UTC, compared against datetime.utcnow() on every dialect.
+    expire_date: Column[datetime] = Column(DateTime, nullable=False, index=True)
@@ -0,0 +1,23 @@
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String
+
+from ..engine_database.base import Base
+
+
+class MemberAudit(Base):
+    """Append-only history of member inserts, updates and deletes."""
+
+    __tablename__ = "member_audit"
+    id = Column(Integer, primary_key=True)
+    # No foreign key: the history outlives the member it describes.
+    id_member = Column(Integer, nullable=False)
+    operation = Column(String(10), nullable=False)
+    # Username from the request's access token, NULL for anonymous writes.
+    username = Column(String(50))
+    old_values = Column(JSON)
+    new_values = Column(JSON)
+    # Naive UTC, like the other timestamp columns written by the API.
+    changed_at = Column(DateTime, nullable=False, index=True)
+
+    __table_args__ = (
+        Index("ix_member_audit_member_changed_at", "id_member", "changed_at"),
+    )
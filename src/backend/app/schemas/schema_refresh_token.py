@@ -0,0 +1,17 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from ..engine_database.base import Base
+
+
+class RefreshToken(Base):
+    __tablename__ = "refresh_tokens"
+    id = Column(Integer, primary_key=True)
+    user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    # HMAC-SHA256 of the opaque token; the token itself is never stored.
+    token_hash = Column(String(64), unique=True, index=True, nullable=False)
+    # Naive UTC, like the other expiry columns.
+    expire_date = Column(DateTime, nullable=False)
@@ -1,6 +1,8 @@
 from datetime import date, datetime
 from sqlalchemy import (
+    DDL,
     Column,
+    inspect,
     Integer,
     String,
     Date,
@@ -8,7 +10,10 @@ from sqlalchemy import (
     DateTime,
     PrimaryKeyConstraint,
     Identity,
+    event,
 )
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import CreateColumn
 from sqlalchemy.sql import func
 
 from ..engine_database.base import Base
@@ -31,16 +36,162 @@ class YouthMembersSchema(Base):
     sower: Column[str] = Column(CHAR(3), nullable=False)
     ministry_position: Column[str] = Column(CHAR(3), nullable=False)
     date_birth: Column[date] = Column(Date, nullable=False)
-    email: Column[str] = Column(CHAR(50))
+    email: Column[str] = Column(String(50))
     create_date: Column[datetime] = Column(
         DateTime(timezone=True), default=func.now(), index=True
     )
     update_date: Column[datetime] = Column(
         DateTime(timezone=True), default=func.now(), onupdate=func.now(), index=True
     )
+    # Set by delete_member; the row is purged once the retention period ends.
+    deleted_at: Column[datetime] = Column(DateTime(timezone=True))
 
     __table_args__ = (
         PrimaryKeyConstraint(
             "member_name", "phone_number", "t_shirt", name="pk_member_composite"
         ),
     )
+
+
+@compiles(CreateColumn, "sqlite")
+def _sqlite_identity_column(element, compiler, **kw):
+    # SQLite only auto-increments INTEGER PRIMARY KEY columns, so identity
+    # columns are left nullable there and filled in by the trigger below.
+    column = element.element
+    ddl = compiler.visit_create_column(element, **kw)
+    if column.identity is not None:
+        ddl = ddl.replace(" NOT NULL", "")
+    return ddl
+
+
+event.listen(
+    YouthMembersSchema.__table__,
+    "after_create",
+    DDL("""
+        CREATE TRIGGER IF NOT EXISTS trg_youth_members_id_member
+        AFTER INSERT ON youth_members
+        WHEN NEW.id_member IS NULL
+        BEGIN
+            UPDATE youth_members
+            SET id_member = (SELECT COALESCE(MAX(id_member), 0) + 1 FROM youth_members)
+            WHERE rowid = NEW.rowid;
+        END
+        """).execute_if(dialect="sqlite"),
+)
+
+
+def _add_deleted_at_column(target, connection, **kw):
+    # create_all never alters existing tables, so databases created before
+    # soft delete get the column here. It runs before the index DDL below,
+    # which the partial indexes depend on.
+    columns = {
+        column["name"] for column in inspect(connection).get_columns("youth_members")
+    }
+    if "deleted_at" not in columns:
+        connection.exec_driver_sql(
+            "ALTER TABLE youth_members ADD COLUMN deleted_at TIMESTAMP"
+            + (" WITH TIME ZONE" if connection.dialect.name == "postgresql" else "")
+        )
+
+
+event.listen(Base.metadata, "after_create", _add_deleted_at_column)
+
+
+def _email_to_varchar(target, connection, **kw):
+    # email used to be CHAR(50), which Postgres pads with spaces on the way
+    # in and out. SQLite never pads, so only Postgres needs the conversion.
+    if connection.dialect.name != "postgresql":
+        return
+    email = next(
+        column
+        for column in inspect(connection).get_columns("youth_members")
+        if column["name"] == "email"
+    )
+    if isinstance(email["type"], CHAR):
+        connection.exec_driver_sql(
+            "ALTER TABLE youth_members "
+            "ALTER COLUMN email TYPE VARCHAR(50) USING RTRIM(email)"
+        )
+
+
+event.listen(Base.metadata, "after_create", _email_to_varchar)
+
+
+# Live-row queries filter and sort on these columns, so they get partial
+# indexes over the rows that are not deleted; a query uses them only when it
+# also says ``deleted_at IS NULL``. They are attached to the metadata rather
+# than the table, with IF NOT EXISTS, so existing databases pick them up on
+# startup. The full indexes they replace are dropped.
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL("""
+        DROP INDEX IF EXISTS ix_youth_members_date_birth
+        """),
+)
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL("""
+        DROP INDEX IF EXISTS ix_youth_members_birth_month_day
+        """),
+)
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL("""
+        CREATE INDEX IF NOT EXISTS ix_youth_members_live_name
+        ON youth_members (member_name, id_member)
+        WHERE deleted_at IS NULL
+        """),
+)
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL("""
+        CREATE INDEX IF NOT EXISTS ix_youth_members_live_update_date
+        ON youth_members (update_date)
+        WHERE deleted_at IS NULL
+        """),
+)
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL("""
+        CREATE INDEX IF NOT EXISTS ix_youth_members_live_date_birth
+        ON youth_members (date_birth)
+        WHERE deleted_at IS NULL
+        """),
+)
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL("""
+        CREATE INDEX IF NOT EXISTS ix_youth_members_live_birth_month_day
+        ON youth_members (
+            (CAST(EXTRACT(MONTH FROM date_birth) AS INTEGER) * 100
+            + CAST(EXTRACT(DAY FROM date_birth) AS INTEGER))
+        )
+        WHERE deleted_at IS NULL
+        """).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Base.metadata,
+    "after_create",
+    # DDL statements are %-formatted, hence the doubled percent signs.
+    DDL("""
+        CREATE INDEX IF NOT EXISTS ix_youth_members_live_birth_month_day
+        ON youth_members (CAST(strftime('%%m%%d', date_birth) AS INTEGER))
+        WHERE deleted_at IS NULL
+        """).execute_if(dialect="sqlite"),
+)
+# The purge job scans deleted rows by age.
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL("""
+        CREATE INDEX IF NOT EXISTS ix_youth_members_deleted_at
+        ON youth_members (deleted_at)
+        WHERE deleted_at IS NOT NULL
+        """),
+)
@@ -0,0 +1,14 @@
+SELECT COUNT(*) AS total
+FROM youth_members
+WHERE deleted_at IS NULL
+    AND (CAST(:gender AS VARCHAR) IS NULL OR gender = :gender)
+    AND (CAST(:t_shirt AS VARCHAR) IS NULL OR t_shirt = :t_shirt)
+    AND (CAST(:food_allergy AS VARCHAR) IS NULL OR food_allergy = :food_allergy)
+    AND (CAST(:sower AS VARCHAR) IS NULL OR sower = :sower)
+    AND (CAST(:ministry_position AS VARCHAR) IS NULL OR ministry_position = :ministry_position)
+    AND (
+        CAST(:search AS VARCHAR) IS NULL
+        OR LOWER(member_name) LIKE :search ESCAPE '\'
+        OR phone_number LIKE :search ESCAPE '\'
+        OR LOWER(email) LIKE :search ESCAPE '\'
+    );
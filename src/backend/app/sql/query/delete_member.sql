@@ -1,3 +1,15 @@
-DELETE FROM youth_members
+UPDATE youth_members
+SET deleted_at = NOW()
 WHERE id_member = :id_member
-RETURNING id_member;
+    AND deleted_at IS NULL
+RETURNING
+    id_member,
+    member_name,
+    gender,
+    phone_number,
+    t_shirt,
+    food_allergy,
+    sower,
+    ministry_position,
+    date_birth,
+    email;
@@ -0,0 +1,15 @@
+UPDATE youth_members
+SET deleted_at = CURRENT_TIMESTAMP
+WHERE id_member = :id_member
+    AND deleted_at IS NULL
+RETURNING
+    id_member,
+    member_name,
+    gender,
+    phone_number,
+    t_shirt,
+    food_allergy,
+    sower,
+    ministry_position,
+    date_birth,
+    email;
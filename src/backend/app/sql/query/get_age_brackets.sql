@@ -0,0 +1,13 @@
+SELECT
+    CASE
+        WHEN date_birth > :cutoff_12 THEN '0-11'
+        WHEN date_birth > :cutoff_15 THEN '12-14'
+        WHEN date_birth > :cutoff_18 THEN '15-17'
+        WHEN date_birth > :cutoff_25 THEN '18-24'
+        WHEN date_birth > :cutoff_30 THEN '25-29'
+        ELSE '30+'
+    END AS bracket,
+    COUNT(*) AS total
+FROM youth_members
+WHERE deleted_at IS NULL
+GROUP BY 1;
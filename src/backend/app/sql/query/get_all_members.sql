@@ -1,15 +1,9 @@
-SELECT
-    id_member,
-    member_name,
-    gender,
-    phone_number,
-    t_shirt,
-    food_allergy,
-    sower,
-    ministry_position,
-    date_birth,
-    email,
-    create_date,
-    update_date
+SELECT {columns}
 FROM youth_members
+WHERE deleted_at IS NULL
+    AND (CAST(:gender AS VARCHAR) IS NULL OR gender = :gender)
+    AND (CAST(:t_shirt AS VARCHAR) IS NULL OR t_shirt = :t_shirt)
+    AND (CAST(:food_allergy AS VARCHAR) IS NULL OR food_allergy = :food_allergy)
+    AND (CAST(:sower AS VARCHAR) IS NULL OR sower = :sower)
+    AND (CAST(:ministry_position AS VARCHAR) IS NULL OR ministry_position = :ministry_position)
 ORDER BY member_name;
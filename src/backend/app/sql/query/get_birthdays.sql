@@ -0,0 +1,16 @@
+SELECT
+    id_member,
+    member_name,
+    date_birth
+FROM youth_members
+WHERE deleted_at IS NULL
+    AND (
+        (
+            CAST(EXTRACT(MONTH FROM date_birth) AS INTEGER) * 100
+            + CAST(EXTRACT(DAY FROM date_birth) AS INTEGER)
+        ) BETWEEN :start_a AND :end_a
+        OR (
+            CAST(EXTRACT(MONTH FROM date_birth) AS INTEGER) * 100
+            + CAST(EXTRACT(DAY FROM date_birth) AS INTEGER)
+        ) BETWEEN :start_b AND :end_b
+    );
@@ -0,0 +1,10 @@
+SELECT
+    id_member,
+    member_name,
+    date_birth
+FROM youth_members
+WHERE deleted_at IS NULL
+    AND (
+        CAST(strftime('%m%d', date_birth) AS INTEGER) BETWEEN :start_a AND :end_a
+        OR CAST(strftime('%m%d', date_birth) AS INTEGER) BETWEEN :start_b AND :end_b
+    );
@@ -0,0 +1,9 @@
+SELECT
+    id_member,
+    member_name,
+    deleted_at
+FROM youth_members
+WHERE deleted_at IS NOT NULL
+    AND (CAST(:since AS TIMESTAMP) IS NULL OR deleted_at >= :since)
+ORDER BY deleted_at DESC, id_member DESC
+LIMIT :limit OFFSET :offset;
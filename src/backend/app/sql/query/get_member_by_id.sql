@@ -11,4 +11,5 @@ SELECT id_member,
     create_date,
     update_date
 FROM youth_members
-WHERE id_member = :id_member;
+WHERE id_member = :id_member
+    AND deleted_at IS NULL;
@@ -0,0 +1,6 @@
+SELECT
+    COUNT(*) AS total,
+    MAX(id_member) AS last_id,
+    MAX(update_date) AS last_update
+FROM youth_members
+WHERE deleted_at IS NULL;
@@ -0,0 +1,10 @@
+SELECT MAX(changed_at) AS watermark
+FROM (
+    SELECT MAX(update_date) AS changed_at
+    FROM youth_members
+    WHERE deleted_at IS NULL
+    UNION ALL
+    SELECT MAX(deleted_at) AS changed_at
+    FROM youth_members
+    WHERE deleted_at IS NOT NULL
+) AS changes;
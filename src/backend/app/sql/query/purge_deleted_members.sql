@@ -0,0 +1,10 @@
+DELETE FROM youth_members
+WHERE id_member IN (
+    SELECT id_member
+    FROM youth_members
+    WHERE deleted_at IS NOT NULL
+        AND deleted_at < :cutoff
+    ORDER BY deleted_at
+    LIMIT :batch_size
+)
+RETURNING id_member;
@@ -0,0 +1,19 @@
+UPDATE youth_members
+SET
+    deleted_at  = NULL,
+    update_date = NOW()
+WHERE id_member IN :ids
+    AND deleted_at IS NOT NULL
+RETURNING
+    id_member,
+    member_name,
+    gender,
+    phone_number,
+    t_shirt,
+    food_allergy,
+    sower,
+    ministry_position,
+    date_birth,
+    email,
+    create_date,
+    update_date;
@@ -1,26 +1,42 @@
-UPDATE youth_members
+UPDATE youth_members AS m
 SET
-    member_name      = COALESCE(:member_name, member_name),
-    gender           = COALESCE(:gender, gender),
-    phone_number     = COALESCE(:phone_number, phone_number),
-    t_shirt          = COALESCE(:t_shirt, t_shirt),
-    food_allergy     = COALESCE(:food_allergy, food_allergy),
-    sower            = COALESCE(:sower, sower),
-    ministry_position= COALESCE(:ministry_position, ministry_position),
-    date_birth       = COALESCE(:date_birth, date_birth),
-    email            = COALESCE(:email, email),
+    member_name      = COALESCE(:member_name, m.member_name),
+    gender           = COALESCE(:gender, m.gender),
+    phone_number     = COALESCE(:phone_number, m.phone_number),
+    t_shirt          = COALESCE(:t_shirt, m.t_shirt),
+    food_allergy     = COALESCE(:food_allergy, m.food_allergy),
+    sower            = COALESCE(:sower, m.sower),
+    ministry_position= COALESCE(:ministry_position, m.ministry_position),
+    date_birth       = COALESCE(:date_birth, m.date_birth),
+    email            = COALESCE(:email, m.email),
     update_date      = NOW()
-WHERE id_member = :id_member
+FROM (
+    SELECT *
+    FROM youth_members
+    WHERE id_member = :id_member
+        AND deleted_at IS NULL
+    FOR UPDATE
+) AS prev
+WHERE m.id_member = prev.id_member
 RETURNING
-    id_member,
-    member_name,
-    gender,
-    phone_number,
-    t_shirt,
-    food_allergy,
-    sower,
-    ministry_position,
-    date_birth,
-    email,
-    create_date,
-    update_date;
+    m.id_member,
+    m.member_name,
+    m.gender,
+    m.phone_number,
+    m.t_shirt,
+    m.food_allergy,
+    m.sower,
+    m.ministry_position,
+    m.date_birth,
+    m.email,
+    m.create_date,
+    m.update_date,
+    prev.member_name       AS old_member_name,
+    prev.gender            AS old_gender,
+    prev.phone_number      AS old_phone_number,
+    prev.t_shirt           AS old_t_shirt,
+    prev.food_allergy      AS old_food_allergy,
+    prev.sower             AS old_sower,
+    prev.ministry_position AS old_ministry_position,
+    prev.date_birth        AS old_date_birth,
+    prev.email             AS old_email;
@@ -0,0 +1,27 @@
+UPDATE youth_members
+SET
+    member_name      = COALESCE(:member_name, member_name),
+    gender           = COALESCE(:gender, gender),
+    phone_number     = COALESCE(:phone_number, phone_number),
+    t_shirt          = COALESCE(:t_shirt, t_shirt),
+    food_allergy     = COALESCE(:food_allergy, food_allergy),
+    sower            = COALESCE(:sower, sower),
+    ministry_position= COALESCE(:ministry_position, ministry_position),
+    date_birth       = COALESCE(:date_birth, date_birth),
+    email            = COALESCE(:email, email),
+    update_date      = CURRENT_TIMESTAMP
+WHERE id_member = :id_member
+    AND deleted_at IS NULL
+RETURNING
+    id_member,
+    member_name,
+    gender,
+    phone_number,
+    t_shirt,
+    food_allergy,
+    sower,
+    ministry_position,
+    date_birth,
+    email,
+    create_date,
+    update_date;
@@ -1 +0,0 @@
-SELECT id_member FROM youth_members WHERE id_member = :id_member;
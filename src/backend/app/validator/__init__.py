@@ -1,10 +1,24 @@
 from .youth_members_validator_schema import (
+    AgeBracketCount as AgeBracketCount,
+    MemberAuditEntry as MemberAuditEntry,
+    MemberRestore as MemberRestore,
+    MemberRestoreResult as MemberRestoreResult,
+    RegistrationTicket as RegistrationTicket,
+    YouthMemberBirthday as YouthMemberBirthday,
     YouthMemberCreate as YouthMemberCreate,
+    YouthMemberDeleted as YouthMemberDeleted,
+    YouthMemberFilters as YouthMemberFilters,
+    YouthMemberPage as YouthMemberPage,
     YouthMemberResponse as YouthMemberResponse,
+    YouthMemberResponseList as YouthMemberResponseList,
     YouthMembersBase as YouthMembersBase,
     YouthMemberUpdate as YouthMemberUpdate,
 )
 from .user_validator_schema import (
+    RefreshTokenRequest as RefreshTokenRequest,
+    UserBulkDelete as UserBulkDelete,
+    UserBulkResult as UserBulkResult,
+    UserBulkUpdatePassword as UserBulkUpdatePassword,
     UserCreate as UserCreate,
     UserResponse as UserResponse,
     UserUpdatePassword as UserUpdatePassword,
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import List
+
+from pydantic import BaseModel, Field
 
 
 class UserCreate(BaseModel):
@@ -17,3 +19,20 @@ class UserResponse(BaseModel):
 class UserUpdatePassword(BaseModel):
     user_id: int
     new_password: str
+
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
+
+
+class UserBulkDelete(BaseModel):
+    user_ids: List[int] = Field(..., min_length=1, max_length=500)
+
+
+class UserBulkUpdatePassword(BaseModel):
+    items: List[UserUpdatePassword] = Field(..., min_length=1, max_length=100)
+
+
+class UserBulkResult(BaseModel):
+    affected: List[int]
+    not_found: List[int]
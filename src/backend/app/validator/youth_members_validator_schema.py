@@ -1,6 +1,13 @@
-from datetime import date
-from typing import Optional
-from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
+from datetime import date, datetime
+from typing import Any, List, Literal, Optional
+from pydantic import (
+    BaseModel,
+    EmailStr,
+    Field,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
 
 
 class YouthMembersBase(BaseModel):
@@ -51,6 +58,74 @@ class YouthMemberResponse(YouthMembersBase):
         from_attributes = True
 
 
+class YouthMemberFilters(BaseModel):
+    gender: Optional[str] = None
+    t_shirt: Optional[str] = None
+    food_allergy: Optional[str] = None
+    sower: Optional[str] = None
+    ministry_position: Optional[str] = None
+
+
+class YouthMemberPage(BaseModel):
+    items: List[YouthMemberResponse]
+    total: int
+    page: int
+    page_size: int
+
+
+class YouthMemberBirthday(BaseModel):
+    id_member: int
+    member_name: str
+    date_birth: date
+    birthday: date
+    turning_age: int
+
+
+class AgeBracketCount(BaseModel):
+    bracket: str
+    total: int
+
+
+class RegistrationTicket(BaseModel):
+    ticket: str
+    status: Literal["pending", "done", "failed"]
+    id_member: Optional[int] = None
+    detail: Optional[str] = None
+
+
+class YouthMemberDeleted(BaseModel):
+    id_member: int
+    member_name: str
+    deleted_at: datetime
+
+
+class MemberRestore(BaseModel):
+    id_members: List[int] = Field(..., min_length=1, max_length=500)
+
+
+class MemberRestoreResult(BaseModel):
+    restored: List[YouthMemberResponse]
+    not_found: List[int]
+
+
+class MemberAuditEntry(BaseModel):
+    id: int
+    id_member: int
+    operation: Literal["insert", "update", "delete", "restore", "purge"]
+    username: Optional[str] = None
+    old_values: Optional[dict[str, Any]] = None
+    new_values: Optional[dict[str, Any]] = None
+    changed_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+YouthMemberResponseList: TypeAdapter[List[YouthMemberResponse]] = TypeAdapter(
+    List[YouthMemberResponse]
+)
+
+
 class YouthMemberUpdate(BaseModel):
     member_name: Optional[str] = Field(default=None, min_length=3, max_length=255)
     gender: Optional[str] = Field(default=None, min_length=1, max_length=10)
@@ -0,0 +1,140 @@
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Iterable, Optional, Union
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from urllib3.util.retry import Retry
+
+# (connect, read) timeouts in seconds.
+DEFAULT_TIMEOUT = (5, 30)
+POOL_SIZE = 10
+# Read by the API's per-client login limit; it only believes it from this
+# server's address (TRUSTED_PROXIES on the API side).
+END_USER_IP_HEADER = "X-End-User-IP"
+# Returned by the API after a member write; sent back on this user's reads
+# so they go to the primary until the replica has caught up.
+READ_PRIMARY_HEADER = "Read-Primary-Until"
+
+
+class ApiClient:
+    """Keep-alive HTTP client shared by every Streamlit session.
+
+    A single ``requests.Session`` keeps pooled connections to the API open, so
+    each action costs one round trip instead of a new TCP+TLS handshake.
+    Idempotent methods are retried on connection errors and 502/503/504.
+
+    The session keeps no cookies, since they would be shared by every user.
+    Per-user state (the read-your-writes deadline) lives in each Streamlit
+    session's ``st.session_state`` instead.
+    """
+
+    def __init__(self, base_url: str, pool_size: int = POOL_SIZE) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.session = requests.Session()
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "PUT", "DELETE"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.executor = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="api-client"
+        )
+
+    def _send(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        return self.session.request(method, f"{self.base_url}{path}", **kwargs)
+
+    def request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        response = self._send(method, path, **_with_read_primary(kwargs))
+        _remember_read_primary(response)
+        return response
+
+    def get(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("DELETE", path, **kwargs)
+
+    def bulk(
+        self, calls: Iterable[tuple[str, str, Optional[dict[str, Any]]]]
+    ) -> list[Union[requests.Response, Exception]]:
+        """Send ``(method, path, kwargs)`` calls concurrently over the pool.
+
+        Results keep the order of ``calls``; a failed call yields its
+        exception instead of aborting the others.
+        """
+        # Session state is only reachable from the script thread, so the
+        # read-your-writes header is handled here rather than in the pool.
+        futures = [
+            self.executor.submit(
+                self._send, method, path, **_with_read_primary(kwargs or {})
+            )
+            for method, path, kwargs in calls
+        ]
+        results: list[Union[requests.Response, Exception]] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+                _remember_read_primary(results[-1])  # type: ignore
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+def _user_state() -> Optional[Any]:
+    """This user's session state; None off the script thread (monitors)."""
+    return st.session_state if get_script_run_ctx() is not None else None
+
+
+def _with_read_primary(kwargs: dict[str, Any]) -> dict[str, Any]:
+    state = _user_state()
+    until = state.get(READ_PRIMARY_HEADER) if state is not None else None
+    if not until:
+        return kwargs
+    return {
+        **kwargs,
+        "headers": {**(kwargs.get("headers") or {}), READ_PRIMARY_HEADER: until},
+    }
+
+
+def _remember_read_primary(response: requests.Response) -> None:
+    until = response.headers.get(READ_PRIMARY_HEADER)
+    state = _user_state()
+    if until and state is not None:
+        state[READ_PRIMARY_HEADER] = until
+
+
+def end_user_headers() -> dict[str, str]:
+    """Identify the browser of the current session to the API.
+
+    The proxy in front of Streamlit appends the browser's address to
+    ``X-Forwarded-For``, so its last entry is the one that can be trusted.
+    """
+    hops = [
+        hop.strip()
+        for hop in st.context.headers.get("X-Forwarded-For", "").split(",")
+        if hop.strip()
+    ]
+    address = hops[-1] if hops else st.context.ip_address
+    return {END_USER_IP_HEADER: address} if address else {}
+
+
+@st.cache_resource
+def get_api_client() -> ApiClient:
+    return ApiClient(st.secrets["api_base_url"])
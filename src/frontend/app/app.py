@@ -1,14 +1,21 @@
-import time
 import streamlit as st
-import requests
 from requests.exceptions import ConnectionError
 import pandas as pd
+import base64
+import hashlib
+import json
 import re
-from datetime import date
-import plotly.express as px
+import time
+import uuid
+from datetime import date, datetime
 from streamlit_cookies_controller import CookieController
 import logging
 
+from api_client import end_user_headers, get_api_client
+from dashboard import cached_dashboard_view, cached_members_frame
+from health_monitor import get_health_monitor
+from member_store import MEMBERS_SCOPE, get_member_store
+
 controller = CookieController()
 # ==================== CONFIGURAÇÃO DA PÁGINA ====================
 st.set_page_config(page_title="Sistema de Cadastro", page_icon="📋", layout="wide")
@@ -18,14 +25,6 @@ API_URL = st.secrets["api_base_url"]
 st.header("📋 Sistema de Cadastro de Jovens AduPno")
 
 
-def get_api_url():
-    return f"{st.secrets['api_base_url']}/registered"
-
-
-def get_auth_url():
-    return f"{st.secrets['api_base_url']}/auth"
-
-
 # ==================== LOGIN =================================
 def login():
     with st.form("login_form"):
@@ -36,21 +35,13 @@ def login():
         if submit:
             payload = {"username": username, "password": password}
             try:
-                response = requests.post(
-                    f"{get_auth_url()}/login", data=payload, timeout=30
+                response = get_api_client().post(
+                    "/auth/login", data=payload, headers=end_user_headers()
                 )
 
                 if response.status_code == 200:
-                    token = response.json().get("access_token")
-                    st.session_state["token"] = token
-
-                    try:
-                        controller.set("auth_token", token, max_age=3600)
-                    except Exception as e:
-                        logging.warning(f"Aviso de Cookie (esperado no 1º login): {e}")
-
-                    st.success("Login realizado!")
-                    time.sleep(1)
+                    store_tokens(response.json())
+                    notify("Login realizado!")
                     st.rerun()
                 else:
                     st.error("Usuário ou senha inválidos.")
@@ -58,20 +49,137 @@ def login():
                 st.error(f"Erro ao conectar: {e}")
 
 
+# Renova o token de acesso quando faltar menos que isso para expirar.
+TOKEN_REFRESH_MARGIN_SECONDS = 60
+REFRESH_COOKIE_MAX_AGE = 14 * 24 * 3600
+
+
+def set_cookie(name, value, max_age):
+    try:
+        controller.set(name, value, max_age=max_age)
+    except Exception as e:
+        logging.warning(f"Aviso de Cookie (esperado no 1º login): {e}")
+
+
+def store_tokens(data):
+    st.session_state["token"] = data["access_token"]
+    st.session_state["refresh_token"] = data.get("refresh_token")
+    set_cookie("auth_token", data["access_token"], data.get("expires_in", 3600))
+    if data.get("refresh_token"):
+        set_cookie("refresh_token", data["refresh_token"], REFRESH_COOKIE_MAX_AGE)
+
+
+def token_expiry(token):
+    """Lê o ``exp`` do JWT sem validar; a API continua sendo quem valida."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload)).get("exp", 0)
+    except Exception:
+        return 0
+
+
+def refresh_session():
+    """Troca o refresh token por novos tokens, sem pedir a senha de novo."""
+    refresh_token = st.session_state.get("refresh_token")
+    if not refresh_token:
+        try:
+            refresh_token = controller.get("refresh_token")
+        except Exception:
+            refresh_token = None
+    if not refresh_token:
+        return False
+
+    try:
+        response = get_api_client().post(
+            "/auth/refresh", json={"refresh_token": refresh_token}
+        )
+    except ConnectionError:
+        return False
+
+    if response.status_code != 200:
+        st.session_state.pop("refresh_token", None)
+        return False
+
+    store_tokens(response.json())
+    return True
+
+
 # ==================== FUNÇÕES AUXILIARES ====================
-@st.cache_data(ttl=5)
 def list_all_members():
     try:
-        response = requests.get(
-            f"{get_api_url()}/", headers=get_auth_header(), timeout=30
+        return get_member_store().get(MEMBERS_SCOPE, get_auth_header())
+    except ConnectionError:
+        st.error("📡 Erro de conexão: O servidor está demorando para responder.")
+        return None
+
+
+def list_deleted_members():
+    """Cadastros excluídos que ainda podem ser restaurados (antes da purga)."""
+    try:
+        response = get_api_client().get(
+            "/registered/deleted",
+            params={"page_size": 500},
+            headers=get_auth_header(),
         )
-        if response.status_code == 200:
-            return response.json()
+    except ConnectionError:
         return []
+    return response.json() if response.status_code == 200 else []
+
+
+@st.fragment(run_every=2)
+def follow_member_changes(version: str):
+    # Only compares against the shared store, which the event stream keeps
+    # current; the API is not polled.
+    store = get_member_store()
+    if store.live and store.version(MEMBERS_SCOPE) != version:
+        st.rerun()
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def list_upcoming_birthdays(version, today, _headers):
+    """Aniversariantes dos próximos 30 dias, calculados pela API."""
+    response = get_api_client().get(
+        "/registered/birthdays", params={"from": today.isoformat()}, headers=_headers
+    )
+    if response.status_code != 200:
+        return []
+    return response.json()
+
+
+EDITOR_PAGE_SIZES = [25, 50, 100, 200]
+
+
+def fetch_members_page(page, page_size, search):
+    """Busca uma página do editor; só a página visível fica na sessão."""
+    key = (page, page_size, search)
+    cached = st.session_state.get("editor_page")
+    if cached is not None and cached["key"] == key:
+        return cached
+
+    params = {"page": page, "page_size": page_size}
+    if search:
+        params["search"] = search
+    try:
+        response = get_api_client().get(
+            "/registered/page", params=params, headers=get_auth_header()
+        )
     except ConnectionError:
         st.error("📡 Erro de conexão: O servidor está demorando para responder.")
         return None
 
+    if response.status_code != 200:
+        st.error(f"❌ Erro ao carregar os jovens: {response.status_code}")
+        return None
+
+    members_page = {"key": key, **response.json()}
+    st.session_state["editor_page"] = members_page
+    return members_page
+
+
+def reset_editor_page():
+    st.session_state["editor_page_number"] = 1
+
 
 def create_member_app(
     member_name,
@@ -96,8 +204,13 @@ def create_member_app(
             "date_birth": date_birth.isoformat(),
             "email": email,
         }
-        response = requests.post(
-            f"{get_api_url()}/", json=payload, headers=get_auth_header(), timeout=30
+        response = get_api_client().post(
+            "/registered/",
+            json=payload,
+            headers={
+                **get_auth_header(),
+                "Idempotency-Key": idempotency_key("create", payload),
+            },
         )
 
         return True, response
@@ -105,6 +218,23 @@ def create_member_app(
         return False, str(e)
 
 
+def idempotency_key(scope, payload):
+    """Chave que se repete enquanto o mesmo envio é refeito nesta sessão.
+
+    Cliques repetidos com a API lenta reenviam a mesma chave e recebem a
+    resposta original; ``reset_idempotency_key`` libera um novo envio.
+    """
+    nonce = st.session_state.setdefault(f"idempotency_{scope}", uuid.uuid4().hex)
+    digest = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return f"{nonce}-{digest[:32]}"
+
+
+def reset_idempotency_key(scope):
+    st.session_state.pop(f"idempotency_{scope}", None)
+
+
 def validate_phone(phone):
     pattern = re.compile(r"^\(?[1-9]{2}\)? ?(?:[2-8]|9[1-9])[0-9]{3}\-?[0-9]{4}$")
     return bool(pattern.match(phone))
@@ -115,66 +245,65 @@ def validate_email(email):
     return re.match(default, email) is not None
 
 
-def check_api_healt():
-    try:
-        base = st.secrets["api_base_url"]
-        response = requests.get(f"{base}/", timeout=15)
-        return response.status_code == 200, response
-    except Exception as e:
-        return False, e
+def notify(message, icon="✅"):
+    """Queue a toast shown at the start of the next run, so it survives st.rerun."""
+    st.session_state.setdefault("toasts", []).append((message, icon))
+
+
+def show_pending_toasts():
+    for message, icon in st.session_state.pop("toasts", []):
+        st.toast(message, icon=icon)
 
 
 def get_auth_header():
     """Retorna o cabeçalho com o token se o usuário estiver logado."""
     token = st.session_state.get("token")
+    if token and token_expiry(token) - TOKEN_REFRESH_MARGIN_SECONDS < time.time():
+        if refresh_session():
+            token = st.session_state["token"]
     if token:
         return {"Authorization": f"Bearer {token}"}
     return {}
 
 
 # ==================== VERIFICAÇÃO DE SAÚDE DA API ====================
+show_pending_toasts()
+health_monitor = get_health_monitor()
+
 if "api_awake" not in st.session_state:
-    st.session_state.api_awake = False
-if "api_attempts" not in st.session_state:
-    st.session_state.api_attempts = 0
+    st.session_state.api_awake = health_monitor.is_healthy
+
+
+@st.fragment(run_every=2)
+def wait_for_api():
+    if health_monitor.is_healthy:
+        st.session_state.api_awake = True
+        notify("Servidor Online!")
+        st.rerun()
+
+    with st.status(
+        f"🚀 Verificando API... (Tentativa {health_monitor.attempts + 1})",
+        expanded=True,
+    ) as status:
+        if health_monitor.attempts < 5:
+            st.warning("😴 A API está acordando, tentando novamente...")
+        else:
+            status.update(label="❌ Erro de Conexão", state="error")
+            st.error("Não foi possível conectar à API após várias tentativas.")
+            if health_monitor.last_error:
+                st.code(health_monitor.last_error)
 
-if not st.session_state.api_awake:
-    placeholder = st.empty()
-
-    with placeholder.container():
-        with st.status(
-            f"🚀 Verificando API... (Tentativa {st.session_state.api_attempts + 1})",
-            expanded=True,
-        ) as status:
-            awake, response = check_api_healt()
-
-            if awake:
-                st.session_state.api_awake = True
-                st.session_state.api_attempts = 0
-                status.update(
-                    label="✅ Servidor Online!", state="complete", expanded=False
-                )
-                time.sleep(0.5)
-                st.rerun()
-            else:
-                st.session_state.api_attempts += 1
-                if st.session_state.api_attempts < 5:
-                    st.warning("😴 A API está acordando, tentando novamente em 2s...")
-                    time.sleep(2)
-                    st.rerun()
-                else:
-                    status.update(label="❌ Erro de Conexão", state="error")
-                    st.error("Não foi possível conectar à API após várias tentativas.")
+            if st.button("🔄 Forçar Nova Tentativa"):
+                health_monitor.check_now()
 
-                    if hasattr(response, "status_code"):
-                        st.info(f"Resposta do Servidor: {response.status_code}")  # type: ignore
-                    else:
-                        st.code(f"Erro técnico: {response}")
+        if health_monitor.last_healthy:
+            last_seen = datetime.fromtimestamp(health_monitor.last_healthy)
+            st.caption(f"Último contato com a API: {last_seen:%d/%m/%Y %H:%M:%S}")
 
-                    if st.button("🔄 Forçar Nova Tentativa"):
-                        st.session_state.api_attempts = 0
-                        st.rerun()
-                    st.stop()
+
+if not st.session_state.api_awake:
+    wait_for_api()
+    st.stop()
 
 
 # ==================== INTERFACE STREAMLIT ====================
@@ -193,6 +322,9 @@ def main():
         if saved_token:
             st.session_state["token"] = saved_token
             st.rerun()
+        elif refresh_session():
+            # The access cookie expired but the session is still valid.
+            st.rerun()
 
     if "token" not in st.session_state:
         st.divider()
@@ -200,13 +332,6 @@ def main():
         login()
         st.stop()
 
-    if "members" not in st.session_state:
-        st.session_state.members = list_all_members()
-    members = st.session_state.members
-
-    if not isinstance(members, list):
-        members = []
-
     menu = st.sidebar.radio(
         "Selecione uma opção:",
         ["Cadastrar Jovem", "Editar Cadastro", "Indicadores de Cadastro"],
@@ -297,12 +422,15 @@ def main():
                         email,
                     )
                     if success and 200 <= result.status_code < 300:  # type: ignore
-                        st.success(
-                            f"✅ Jovem: **{member_name}** cadastrado com sucesso!"
-                        )
-                        st.cache_data.clear()
-                        st.session_state.members = list_all_members()
-                        time.sleep(3)
+                        reset_idempotency_key("create")
+                        if result.status_code == 202:  # type: ignore
+                            # The API queued the sign-up; it is written shortly.
+                            notify(
+                                f"Cadastro do jovem: **{member_name}** recebido e em processamento!"
+                            )
+                        else:
+                            notify(f"Jovem: **{member_name}** cadastrado com sucesso!")
+                        get_member_store().invalidate(MEMBERS_SCOPE)
                         st.rerun()
                     elif success and result.status_code == 400:  # type: ignore
                         try:
@@ -319,12 +447,41 @@ def main():
     elif menu == "Editar Cadastro":
         st.divider()
         st.subheader("✏️ Editar Cadastro de Jovens")
-        edited_members = members.copy() if members else []
 
-        if not edited_members:
+        col_search, col_size = st.columns([3, 1])
+        search = col_search.text_input(
+            "🔎 Buscar",
+            placeholder="Nome, telefone ou e-mail",
+            key="editor_search",
+            on_change=reset_editor_page,
+        ).strip()
+        page_size = col_size.selectbox(
+            "Jovens por página",
+            EDITOR_PAGE_SIZES,
+            index=1,
+            key="editor_page_size",
+            on_change=reset_editor_page,
+        )
+
+        page = st.session_state.setdefault("editor_page_number", 1)
+        members_page = fetch_members_page(page, page_size, search)
+        if members_page is None:
+            st.stop()
+
+        total_pages = max(1, -(-members_page["total"] // page_size))
+        if page > total_pages:
+            # The last page emptied out (deletes or a narrower search).
+            page = st.session_state["editor_page_number"] = total_pages
+            members_page = fetch_members_page(page, page_size, search)
+            if members_page is None:
+                st.stop()
+
+        if not members_page["items"] and search:
+            st.info("🔎 Nenhum jovem encontrado para a busca.")
+        elif not members_page["items"]:
             st.warning("⚠️ Nenhum jovem cadastrado ainda.")
         else:
-            df_edited = pd.DataFrame(edited_members)
+            df_edited = pd.DataFrame(members_page["items"])
             df_edited = df_edited.rename(
                 columns={
                     "id_member": "Código",
@@ -404,6 +561,15 @@ def main():
                 },
             )
 
+            st.number_input(
+                f"Página (de {total_pages})",
+                min_value=1,
+                max_value=total_pages,
+                step=1,
+                key="editor_page_number",
+            )
+            st.caption(f"{members_page['total']} jovens encontrados")
+
             with st.form("form_update_members"):
                 st.write("💾 Atualizar Cadastro Membro")
                 submit_update = st.form_submit_button("✅ Salvar alterações")
@@ -411,6 +577,7 @@ def main():
                 if submit_update:
                     errors = []
                     updated_members = []
+                    pending_updates = []
 
                     for idx, row in edited_df.iterrows():
                         id_member = row["Código"]
@@ -451,38 +618,51 @@ def main():
                                     changed = True
 
                         if changed:
-                            try:
-                                response = requests.put(
-                                    f"{get_api_url()}/{int(id_member)}",
-                                    json=payload,
-                                    headers=get_auth_header(),
-                                    timeout=30,
-                                )
-                                if response.status_code == 200:
-                                    updated_members.append(row["Nome"])
-                                else:
-                                    errors.append(f"{row['Nome']}: {response.text}")
-                            except Exception as e:
-                                errors.append(f"{row['Nome']}: {str(e)}")
-
-                    if errors:
+                            pending_updates.append((row["Nome"], id_member, payload))
+
+                    responses = get_api_client().bulk(
+                        (
+                            "PUT",
+                            f"/registered/{int(id_member)}",
+                            {
+                                "json": payload,
+                                "headers": {
+                                    **get_auth_header(),
+                                    "Idempotency-Key": idempotency_key(
+                                        "update",
+                                        {"id_member": int(id_member), **payload},
+                                    ),
+                                },
+                            },
+                        )
+                        for _, id_member, payload in pending_updates
+                    )
+                    for (name, _, _), response in zip(pending_updates, responses):
+                        if isinstance(response, Exception):
+                            errors.append(f"{name}: {str(response)}")
+                        elif response.status_code == 200:
+                            updated_members.append(name)
+                        else:
+                            errors.append(f"{name}: {response.text}")
+
+                    if errors and not updated_members:
                         st.error("❌ Erros ao atualizar membros:\n" + "\n".join(errors))
                     if updated_members:
+                        reset_idempotency_key("update")
+                        for error in errors:
+                            notify(error, icon="❌")
                         if len(updated_members) == 1:
-                            st.success(
-                                f"✅ Cadastro do jovem: **{updated_members[0]}** atualizado com sucesso!"
+                            notify(
+                                f"Cadastro do jovem: **{updated_members[0]}** atualizado com sucesso!"
                             )
-                            st.session_state.members = list_all_members()
-                            time.sleep(3)
-                            st.rerun()
                         else:
                             list_updated = ", ".join(updated_members)
-                            st.success(
-                                f"✅ Cadastro dos jovens: **{list_updated}** atualizados com sucesso!"
+                            notify(
+                                f"Cadastro dos jovens: **{list_updated}** atualizados com sucesso!"
                             )
-                            st.session_state.members = list_all_members()
-                            time.sleep(3)
-                            st.rerun()
+                        get_member_store().invalidate(MEMBERS_SCOPE)
+                        st.session_state.pop("editor_page", None)
+                        st.rerun()
 
             # ---------- Form para deletar ----------
             st.divider()
@@ -496,60 +676,112 @@ def main():
                 submit_delete = st.form_submit_button("✅ Deletar Selecionados")
 
                 members_deleted = []
+                errors = []
 
                 if submit_delete:
+                    names = {}
                     for id_member in rows_to_delete:
                         filtered = edited_df.loc[
                             edited_df["Código"] == id_member, "Nome"
                         ]
-                        if not filtered.empty:  # type: ignore
-                            members_deleted.append(filtered.values[0])  # type: ignore
-                        requests.delete(
-                            f"{get_api_url()}/{int(id_member)}",
-                            headers=get_auth_header(),
-                            timeout=30,
+                        names[id_member] = (
+                            filtered.values[0] if not filtered.empty else id_member  # type: ignore
                         )
 
+                    responses = get_api_client().bulk(
+                        (
+                            "DELETE",
+                            f"/registered/{int(id_member)}",
+                            {"headers": get_auth_header()},
+                        )
+                        for id_member in rows_to_delete
+                    )
+                    for id_member, response in zip(rows_to_delete, responses):
+                        name = names[id_member]
+                        if isinstance(response, Exception):
+                            errors.append(f"{name}: {str(response)}")
+                        elif response.status_code == 200:
+                            members_deleted.append(name)
+                        else:
+                            errors.append(f"{name}: {response.text}")
+
+                    if errors and not members_deleted:
+                        st.error("❌ Erros ao deletar membros:\n" + "\n".join(errors))
                     if members_deleted:
+                        for error in errors:
+                            notify(error, icon="❌")
                         if len(members_deleted) == 1:
-                            st.success(
-                                f"✅ Cadastro do jovem: **{members_deleted[0]}** deletado com sucesso!"
+                            notify(
+                                f"Cadastro do jovem: **{members_deleted[0]}** deletado com sucesso!"
                             )
                         else:
                             list_deleted = ", ".join(members_deleted)
-                            st.success(
-                                f"✅ Cadastro dos jovens: **{list_deleted}** deletados com sucesso!"
+                            notify(
+                                f"Cadastro dos jovens: **{list_deleted}** deletados com sucesso!"
                             )
+                        get_member_store().invalidate(MEMBERS_SCOPE)
+                        st.session_state.pop("editor_page", None)
+                        st.rerun()
 
-                    st.session_state.members = list_all_members()
-                    time.sleep(3)
-                    st.rerun()
+        # ---------- Form para restaurar ----------
+        deleted_members = list_deleted_members()
+        if deleted_members:
+            st.divider()
+            st.subheader("♻️ Restaurar Cadastros Excluídos")
+            with st.form("form_restore_members"):
+                names = {
+                    member[
+                        "id_member"
+                    ]: f"{member['id_member']} - {member['member_name']}"
+                    for member in deleted_members
+                }
+                rows_to_restore = st.multiselect(
+                    "Selecione os cadastros excluídos que deseja restaurar",
+                    list(names),
+                    format_func=names.get,
+                    placeholder="Escolha os jovens excluídos.",
+                )
+                submit_restore = st.form_submit_button("✅ Restaurar Selecionados")
+
+                if submit_restore and rows_to_restore:
+                    try:
+                        response = get_api_client().post(
+                            "/registered/restore",
+                            json={"id_members": rows_to_restore},
+                            headers=get_auth_header(),
+                        )
+                    except ConnectionError:
+                        st.error("📡 Erro de conexão ao restaurar os cadastros.")
+                    else:
+                        if response.status_code == 200:
+                            restored = [
+                                member["member_name"]
+                                for member in response.json()["restored"]
+                            ]
+                            notify(
+                                f"Cadastro(s) restaurado(s): **{', '.join(restored)}**"
+                            )
+                            get_member_store().invalidate(MEMBERS_SCOPE)
+                            st.session_state.pop("editor_page", None)
+                            st.rerun()
+                        else:
+                            st.error(
+                                f"❌ Erro ao restaurar: {response.json().get('detail')}"
+                            )
 
     # -------------------- TABELA DE JOVENS --------------------
     elif menu == "Indicadores de Cadastro":
         st.divider()
         st.subheader("📊 Dashboard de Jovens Cadastrados")
 
-        members = members if members is not None else []
+        members = list_all_members() or []
 
         if members:
-            df = pd.DataFrame(members)
-            if "member_name" in df.columns:
-                df = df.rename(
-                    columns={
-                        "id_member": "ID",
-                        "member_name": "Nome",
-                        "gender": "Gênero",
-                        "phone_number": "Telefone",
-                        "t_shirt": "Camiseta",
-                        "food_allergy": "Alergia",
-                        "sower": "Semeador",
-                        "ministry_position": "Cargo",
-                        "date_birth": "Nascimento",
-                        "email": "Email",
-                    }
-                )
-
+            version = get_member_store().version(MEMBERS_SCOPE)
+            follow_member_changes(version)
+            today = date.today()
+            df = cached_members_frame(version, today, members)
+            if "Nome" in df.columns:
                 st.divider()
                 st.markdown("### 🎛️ Filtros")
 
@@ -571,144 +803,73 @@ def main():
                     )
 
                 st.divider()
-                df["Nascimento"] = pd.to_datetime(df["Nascimento"], errors="coerce")
-                today = pd.Timestamp.today()
-                df["Idade"] = (today - df["Nascimento"]).dt.days // 365
-
-                df["Alergia"] = df["Alergia"].fillna("Nenhuma")
-                df["Cargo"] = df["Cargo"].fillna("Não informado")
-                df["Camiseta"] = df["Camiseta"].fillna("Não informado")
-
-                df_filtrado = df[
-                    (df["Semeador"].isin(semeador_sel))
-                    & (df["Gênero"].isin(gender_sel))
-                ]
-
-                col1, col2, col3, col4, col5, col6 = st.columns(6)
-
-                meninas = df_filtrado[df_filtrado["Gênero"] == "Feminino"]
-                col1.metric("👩 Meninas", len(meninas))
-
-                meninos = df_filtrado[df_filtrado["Gênero"] == "Masculino"]
-                col2.metric("👨 Meninos", len(meninos))
-
-                col3.metric("👥 Jovens Cadastrados", len(df_filtrado))
-
-                val_meninas = df_filtrado[df_filtrado["Gênero"] == "Feminino"][
-                    "Idade"
-                ].mean()
-                label_meninas = (
-                    f"{val_meninas:.1f} anos" if pd.notna(val_meninas) else "N/A"
-                )
-                col4.metric("👩 Idade Média Meninas", label_meninas)
-
-                val_meninos = df_filtrado[df_filtrado["Gênero"] == "Masculino"][
-                    "Idade"
-                ].mean()
-                label_meninos = (
-                    f"{val_meninos:.1f} anos" if pd.notna(val_meninos) else "N/A"
+                view = cached_dashboard_view(
+                    version,
+                    today,
+                    tuple(sorted(semeador_sel)),
+                    tuple(sorted(gender_sel)),
+                    members,
                 )
-                col5.metric("👨 Idade Média Meninos", label_meninos)
 
-                val_geral = df_filtrado["Idade"].mean()
-                label_geral = f"{val_geral:.1f} anos" if pd.notna(val_geral) else "N/A"
-                col6.metric("👥 Idade Média Mocidade", label_geral)
+                for col, (label, value) in zip(st.columns(6), view.metrics):
+                    col.metric(label, value)
 
                 col7, col8, col9 = st.columns(3)
 
-                with col7:
-                    semeadores = df_filtrado["Semeador"].value_counts().reset_index()
-                    semeadores.columns = ["Semeador", "Total"]
-
-                    fig3 = px.bar(
-                        semeadores,
-                        x="Semeador",
-                        y="Total",
-                        title="🌱 Semeadores",
-                        text="Total",
-                    )
-                    st.plotly_chart(
-                        fig3, width="stretch", config={"doubleClick": "False"}
-                    )
-
-                with col8:
-                    camisetas = df_filtrado["Camiseta"].value_counts().reset_index()
-                    camisetas.columns = ["Camiseta", "Total"]
-
-                    fig1 = px.bar(
-                        camisetas,
-                        x="Camiseta",
-                        y="Total",
-                        title="👕 Camisetas",
-                        text="Total",
-                    )
-                    st.plotly_chart(
-                        fig1, width="stretch", config={"doubleClick": "False"}
-                    )
-
-                with col9:
-                    cargos = df_filtrado["Cargo"].value_counts().reset_index()
-                    cargos.columns = ["Cargo", "Total"]
-
-                    fig3 = px.bar(
-                        cargos,
-                        x="Cargo",
-                        y="Total",
-                        title="⛪ Cargo Ministerial",
-                        text="Total",
-                    )
-                    st.plotly_chart(
-                        fig3, width="stretch", config={"doubleClick": "False"}
-                    )
+                for col, name in zip(
+                    (col7, col8, col9), ("semeadores", "camisetas", "cargos")
+                ):
+                    with col:
+                        st.plotly_chart(
+                            view.figures[name],
+                            width="stretch",
+                            config={"doubleClick": "False"},
+                            key=f"dashboard_{name}",
+                        )
 
                 col10, col11 = st.columns(2)
 
                 with col10:
-                    alergias = df_filtrado["Alergia"].value_counts().reset_index()
-                    alergias.columns = ["Alergia", "Total"]
-
-                    fig3 = px.bar(
-                        alergias,
-                        x="Alergia",
-                        y="Total",
-                        title="🥗 Jovens com Alergia a Alimento",
-                        text="Total",
-                    )
                     st.plotly_chart(
-                        fig3, width="stretch", config={"doubleClick": "False"}
+                        view.figures["alergias"],
+                        width="stretch",
+                        config={"doubleClick": "False"},
+                        key="dashboard_alergias",
                     )
 
                 with col11:
-                    fig4 = px.histogram(
-                        df_filtrado,
-                        x="Idade",
-                        nbins=10,
-                        title="📅 Faixa Etária",
-                    )
-
-                    fig4.update_traces(
-                        texttemplate="%{y}",
-                        textposition="inside",
-                        insidetextanchor="end",
-                        marker_line_width=1,
-                        marker_line_color="white",
-                    )
-
-                    fig4.update_layout(
-                        bargap=0.1,
-                        xaxis_title="Idade",
-                        yaxis_title="Quantidade",
-                        plot_bgcolor="rgba(0,0,0,0)",
-                    )
-
                     st.plotly_chart(
-                        fig4,
+                        view.figures["idades"],
                         width="stretch",
                         config={"doubleClick": False, "displayModeBar": False},
+                        key="dashboard_idades",
                     )
 
+                st.subheader("🎂 Aniversariantes dos próximos 30 dias")
+                try:
+                    birthdays = list_upcoming_birthdays(
+                        version, today, get_auth_header()
+                    )
+                except ConnectionError:
+                    birthdays = []
+                if birthdays:
+                    st.dataframe(
+                        pd.DataFrame(birthdays).rename(
+                            columns={
+                                "id_member": "ID",
+                                "member_name": "Nome",
+                                "date_birth": "Nascimento",
+                                "birthday": "Aniversário",
+                                "turning_age": "Completa",
+                            }
+                        ),
+                        hide_index=True,
+                    )
+                else:
+                    st.caption("Nenhum aniversariante nos próximos 30 dias.")
+
                 st.subheader("👥 Dados completos")
-                st.dataframe(df_filtrado)
+                st.dataframe(view.df_filtrado)
 
             else:
                 st.error("❌ Erro no formato dos dados de cadastro dos Jovens")
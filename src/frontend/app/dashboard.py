@@ -0,0 +1,138 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Union
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+from plotly.graph_objects import Figure
+
+from member_table import MemberTable
+
+COLUMNS = {
+    "id_member": "ID",
+    "member_name": "Nome",
+    "gender": "Gênero",
+    "phone_number": "Telefone",
+    "t_shirt": "Camiseta",
+    "food_allergy": "Alergia",
+    "sower": "Semeador",
+    "ministry_position": "Cargo",
+    "date_birth": "Nascimento",
+    "email": "Email",
+}
+
+
+@dataclass(frozen=True)
+class DashboardView:
+    df_filtrado: pd.DataFrame
+    metrics: list[tuple[str, Union[int, str]]] = field(default_factory=list)
+    figures: dict[str, Figure] = field(default_factory=dict)
+
+
+def _fill_missing(values: pd.Series, label: str) -> pd.Series:
+    if not values.hasnans:
+        return values
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        if label not in values.cat.categories:
+            values = values.cat.add_categories(label)
+    return values.fillna(label)
+
+
+def members_frame(members: MemberTable, as_of: date) -> pd.DataFrame:
+    # The table's arrays back the frame directly; the derived columns below
+    # are new arrays, so the shared table is never written to.
+    df = members.to_frame().rename(columns=COLUMNS)
+    born = df["Nascimento"]
+    had_birthday = (born.dt.month < as_of.month) | (
+        (born.dt.month == as_of.month) & (born.dt.day <= as_of.day)
+    )
+    # Exact age in years; missing dates stay NaN.
+    df["Idade"] = as_of.year - born.dt.year - (~had_birthday).astype(int)
+
+    df["Alergia"] = _fill_missing(df["Alergia"], "Nenhuma")
+    df["Cargo"] = _fill_missing(df["Cargo"], "Não informado")
+    df["Camiseta"] = _fill_missing(df["Camiseta"], "Não informado")
+    return df
+
+
+def _mean_age_label(ages: pd.Series) -> str:
+    value = ages.mean()
+    return f"{value:.1f} anos" if pd.notna(value) else "N/A"
+
+
+def _count_bar(df: pd.DataFrame, column: str, title: str) -> Figure:
+    # Categorical columns also count the categories the filter left empty.
+    counts = df[column].value_counts()
+    counts = counts[counts > 0].reset_index()
+    counts.columns = [column, "Total"]
+    return px.bar(counts, x=column, y="Total", title=title, text="Total")
+
+
+def _age_histogram(df: pd.DataFrame) -> Figure:
+    fig = px.histogram(df, x="Idade", nbins=10, title="📅 Faixa Etária")
+    fig.update_traces(
+        texttemplate="%{y}",
+        textposition="inside",
+        insidetextanchor="end",
+        marker_line_width=1,
+        marker_line_color="white",
+    )
+    fig.update_layout(
+        bargap=0.1,
+        xaxis_title="Idade",
+        yaxis_title="Quantidade",
+        plot_bgcolor="rgba(0,0,0,0)",
+    )
+    return fig
+
+
+def dashboard_view(
+    df: pd.DataFrame, semeador_sel: list[str], gender_sel: list[str]
+) -> DashboardView:
+    df_filtrado = df[df["Semeador"].isin(semeador_sel) & df["Gênero"].isin(gender_sel)]
+    meninas = df_filtrado[df_filtrado["Gênero"] == "Feminino"]
+    meninos = df_filtrado[df_filtrado["Gênero"] == "Masculino"]
+
+    return DashboardView(
+        df_filtrado=df_filtrado,
+        metrics=[
+            ("👩 Meninas", len(meninas)),
+            ("👨 Meninos", len(meninos)),
+            ("👥 Jovens Cadastrados", len(df_filtrado)),
+            ("👩 Idade Média Meninas", _mean_age_label(meninas["Idade"])),
+            ("👨 Idade Média Meninos", _mean_age_label(meninos["Idade"])),
+            ("👥 Idade Média Mocidade", _mean_age_label(df_filtrado["Idade"])),
+        ],
+        figures={
+            "semeadores": _count_bar(df_filtrado, "Semeador", "🌱 Semeadores"),
+            "camisetas": _count_bar(df_filtrado, "Camiseta", "👕 Camisetas"),
+            "cargos": _count_bar(df_filtrado, "Cargo", "⛪ Cargo Ministerial"),
+            "alergias": _count_bar(
+                df_filtrado, "Alergia", "🥗 Jovens com Alergia a Alimento"
+            ),
+            "idades": _age_histogram(df_filtrado),
+        },
+    )
+
+
+# The cached wrappers key on the data version instead of hashing the member
+# list; ``_members`` is only read on a miss. Results are shared read-only
+# across sessions and evicted least-recently-used past ``max_entries``.
+@st.cache_resource(max_entries=4, show_spinner=False)
+def cached_members_frame(
+    version: str, as_of: date, _members: MemberTable
+) -> pd.DataFrame:
+    return members_frame(_members, as_of)
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def cached_dashboard_view(
+    version: str,
+    as_of: date,
+    semeador_sel: tuple[str, ...],
+    gender_sel: tuple[str, ...],
+    _members: MemberTable,
+) -> DashboardView:
+    df = cached_members_frame(version, as_of, _members)
+    return dashboard_view(df, list(semeador_sel), list(gender_sel))
@@ -0,0 +1,77 @@
+import logging
+import threading
+import time
+from typing import Optional
+
+import streamlit as st
+
+from api_client import ApiClient, get_api_client
+
+
+class HealthMonitor:
+    """Probe the API from one background thread shared by every session.
+
+    While the API is down the probe is retried with exponential backoff;
+    once it answers, it is re-checked every ``healthy_interval`` seconds.
+    Pages only read the cached state, so no session thread ever sleeps.
+    """
+
+    def __init__(
+        self,
+        client: ApiClient,
+        healthy_interval: float = 60.0,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 30.0,
+    ) -> None:
+        self.client = client
+        self.healthy_interval = healthy_interval
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+
+        self.last_healthy: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.attempts = 0
+        self._wake = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="api-health-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def _probe(self) -> bool:
+        try:
+            response = self.client.get("/", timeout=15)
+            if response.status_code == 200:
+                return True
+            self.last_error = f"Resposta do Servidor: {response.status_code}"
+        except Exception as e:
+            self.last_error = f"Erro técnico: {e}"
+        return False
+
+    def _run(self) -> None:
+        backoff = self.initial_backoff
+        while True:
+            if self._probe():
+                self.last_healthy = time.time()
+                self.attempts = 0
+                backoff = self.initial_backoff
+                wait = self.healthy_interval
+            else:
+                self.attempts += 1
+                logging.warning(f"API indisponível (tentativa {self.attempts})")
+                wait = backoff
+                backoff = min(backoff * 2, self.max_backoff)
+
+            self._wake.wait(wait)
+            self._wake.clear()
+
+    @property
+    def is_healthy(self) -> bool:
+        return self.last_healthy is not None and self.attempts == 0
+
+    def check_now(self) -> None:
+        self._wake.set()
+
+
+@st.cache_resource
+def get_health_monitor() -> HealthMonitor:
+    return HealthMonitor(get_api_client())
@@ -0,0 +1,207 @@
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import streamlit as st
+
+from api_client import ApiClient, get_api_client
+from member_table import MemberTable
+
+MEMBERS_SCOPE = "/registered/"
+EVENTS_PATH = "/registered/events"
+# Longer than the API heartbeat, so a silent connection counts as dropped.
+EVENTS_READ_TIMEOUT = 45
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    etag: Optional[str]
+    members: MemberTable
+    checked_at: float
+    generation: int
+    stale: bool = False
+
+
+class MemberStore:
+    """Member lists shared by every session, revalidated with ETags.
+
+    Entries are keyed by scope (the API path whose data they hold); every
+    authenticated user sees the same members, so they share one entry,
+    kept as a columnar ``MemberTable`` rather than a dict per member. A
+    read sends ``If-None-Match`` and reuses the cached list on 304, and at
+    most one probe per ``min_probe_interval`` seconds is sent for all
+    sessions together. Writes mark only their scope as stale.
+
+    While ``live`` (a ``MemberEventListener`` is connected), member changes
+    are applied to the cached list as they arrive and reads skip the probe.
+    """
+
+    def __init__(self, client: ApiClient, min_probe_interval: float = 1.0) -> None:
+        self.client = client
+        self.min_probe_interval = min_probe_interval
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.live = False
+
+    def get(self, scope: str, headers: dict[str, str]) -> MemberTable:
+        # Holding the lock through the request makes concurrent sessions wait
+        # for one fetch instead of each sending their own.
+        with self._lock:
+            entry = self._entries.get(scope)
+            now = time.monotonic()
+            if (
+                entry is not None
+                and not entry.stale
+                and (self.live or now - entry.checked_at < self.min_probe_interval)
+            ):
+                return entry.members
+
+            request_headers = dict(headers)
+            if entry is not None and entry.etag and not entry.stale:
+                request_headers["If-None-Match"] = entry.etag
+
+            response = self.client.get(scope, headers=request_headers)
+
+            if response.status_code == 304 and entry is not None:
+                entry.checked_at = now
+                return entry.members
+            if response.status_code in (200, 404):
+                # 404 means no members are registered yet.
+                members = MemberTable.from_payload(
+                    response.json() if response.status_code == 200 else []
+                )
+                self._generation += 1
+                self._entries[scope] = _Entry(
+                    etag=response.headers.get("ETag"),
+                    members=members,
+                    checked_at=now,
+                    generation=self._generation,
+                )
+                return members
+            return entry.members if entry is not None else MemberTable.from_payload([])
+
+    def version(self, scope: str) -> str:
+        """Identify the data currently cached for ``scope``.
+
+        The server ETag changes whenever the members change, so it keys
+        anything derived from the list. Without one (scope never fetched or
+        the API sent none) a local fetch counter stands in for it.
+        """
+        with self._lock:
+            entry = self._entries.get(scope)
+            if entry is None:
+                return ""
+            return entry.etag or f"local:{entry.generation}"
+
+    def apply_event(self, event_type: str, data: dict[str, Any]) -> None:
+        """Patch the cached member list with one change from the event stream."""
+        with self._lock:
+            entry = self._entries.get(MEMBERS_SCOPE)
+            if entry is None:
+                return
+            if event_type == "reset":
+                entry.stale = True
+                return
+
+            # Sessions may still be reading the old table; these build a new one.
+            if event_type in ("insert", "update"):
+                members = entry.members.upsert(data)
+            elif event_type == "delete":
+                members = entry.members.without(data.get("id_member"))
+            else:
+                return
+
+            self._generation += 1
+            entry.members = members
+            entry.generation = self._generation
+            # The list no longer matches the server ETag it was fetched with.
+            entry.etag = None
+
+    def invalidate(self, scope: str) -> None:
+        with self._lock:
+            entry = self._entries.get(scope)
+            if entry is not None:
+                entry.stale = True
+
+
+class MemberEventListener:
+    """Follow ``/registered/events`` in a daemon thread and feed the store.
+
+    Reconnects with ``Last-Event-ID`` after a drop, so no change is missed;
+    while disconnected the store falls back to ETag probes.
+    """
+
+    def __init__(self, client: ApiClient, store: MemberStore) -> None:
+        self.client = client
+        self.store = store
+        self.last_event_id: Optional[str] = None
+        self.retry_seconds = 3.0
+        self._thread = threading.Thread(
+            target=self._run, name="member-events", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self._follow()
+            except Exception as e:
+                logger.info("Member event stream dropped: %s", e)
+            self.store.live = False
+            time.sleep(self.retry_seconds)
+
+    def _follow(self) -> None:
+        headers = {"Accept": "text/event-stream"}
+        if self.last_event_id:
+            headers["Last-Event-ID"] = self.last_event_id
+
+        with self.client.get(
+            EVENTS_PATH,
+            headers=headers,
+            stream=True,
+            timeout=(5, EVENTS_READ_TIMEOUT),
+        ) as response:
+            if response.status_code != 200:
+                return
+            if self.last_event_id is None:
+                # Changes made before the stream opened are not replayed.
+                self.store.invalidate(MEMBERS_SCOPE)
+            self.store.live = True
+
+            event_id, event_type, data = None, "message", []
+            for line in response.iter_lines(decode_unicode=True):
+                if line:
+                    field, _, value = line.partition(":")
+                    value = value[1:] if value.startswith(" ") else value
+                    if field == "id":
+                        event_id = value
+                    elif field == "event":
+                        event_type = value
+                    elif field == "data":
+                        data.append(value)
+                    elif field == "retry" and value.isdigit():
+                        self.retry_seconds = int(value) / 1000
+                    continue
+
+                # A blank line ends the event; heartbeats carry no data.
+                if data:
+                    self.store.apply_event(event_type, json.loads("\n".join(data)))
+                if event_id is not None:
+                    self.last_event_id = event_id
+                event_id, event_type, data = None, "message", []
+
+
+@st.cache_resource
+def get_member_store() -> MemberStore:
+    client = get_api_client()
+    store = MemberStore(client)
+    MemberEventListener(client, store).start()
+    return store
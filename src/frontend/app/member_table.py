@@ -0,0 +1,207 @@
+from typing import Any, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pandas.api.types import union_categoricals
+
+FIELDS = (
+    "id_member",
+    "member_name",
+    "gender",
+    "phone_number",
+    "t_shirt",
+    "food_allergy",
+    "sower",
+    "ministry_position",
+    "date_birth",
+    "email",
+)
+# Free text: one contiguous Arrow buffer per column instead of a str per cell.
+STRING_FIELDS = ("member_name", "phone_number", "email")
+# A handful of distinct values each: one int8 code per row.
+CATEGORY_FIELDS = ("gender", "t_shirt", "food_allergy", "sower", "ministry_position")
+
+# pandas' default string dtype, so frames match what pd.DataFrame(payload) gives.
+STRING_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+
+
+class MemberTable:
+    """Members held column by column, as the API list would be in a DataFrame.
+
+    ``id_member`` is an int64 array, ``date_birth`` a ``datetime64[s]``
+    array (NaT when missing), the fixed-choice fields are categoricals and
+    the free-text fields Arrow ``large_string`` arrays. Those are the
+    layouts pandas uses for the same dtypes, so ``to_frame`` wraps the
+    arrays without copying them.
+
+    Tables are never modified in place: ``upsert`` and ``without`` return
+    new tables, so readers holding the old one are unaffected.
+    """
+
+    __slots__ = ("ids", "strings", "categories", "date_birth")
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        strings: dict[str, pa.Array],
+        categories: dict[str, pd.Categorical],
+        date_birth: np.ndarray,
+    ) -> None:
+        self.ids = ids
+        self.strings = strings
+        self.categories = categories
+        self.date_birth = date_birth
+
+    @classmethod
+    def from_payload(cls, members: Iterable[dict[str, Any]]) -> "MemberTable":
+        """Build from API members (``date_birth`` as an ISO date string)."""
+        members = list(members)
+        return cls(
+            ids=np.fromiter(
+                (m["id_member"] for m in members), dtype=np.int64, count=len(members)
+            ),
+            strings={
+                field: pa.array([m.get(field) for m in members], type=pa.large_string())
+                for field in STRING_FIELDS
+            },
+            categories={
+                field: pd.Categorical([m.get(field) for m in members])
+                for field in CATEGORY_FIELDS
+            },
+            date_birth=np.array(
+                [m.get("date_birth") for m in members], dtype="datetime64[D]"
+            ).astype("datetime64[s]"),
+        )
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "MemberTable":
+        """Build from a frame with the API column names.
+
+        Columns already in the table's layout (a ``to_frame`` result) are
+        reused as they are.
+        """
+        return cls(
+            ids=df["id_member"].to_numpy(dtype=np.int64),
+            strings={field: _large_strings(df[field].array) for field in STRING_FIELDS},
+            categories={
+                field: _categorical(df[field].array) for field in CATEGORY_FIELDS
+            },
+            date_birth=df["date_birth"].to_numpy(dtype="datetime64[s]"),
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """The members as a DataFrame sharing this table's arrays."""
+        return pd.DataFrame(
+            {field: self._column(field) for field in FIELDS}, copy=False
+        )
+
+    def _column(self, field: str) -> Any:
+        if field in STRING_FIELDS:
+            return pd.arrays.ArrowStringArray(self.strings[field], dtype=STRING_DTYPE)
+        if field in CATEGORY_FIELDS:
+            return self.categories[field]
+        if field == "date_birth":
+            return self.date_birth
+        return self.ids
+
+    def to_payload(self) -> list[dict[str, Any]]:
+        """The members as the API sends them."""
+        dates = np.datetime_as_string(self.date_birth, unit="D")
+        columns = {
+            "id_member": self.ids.tolist(),
+            **{field: self.strings[field].to_pylist() for field in STRING_FIELDS},
+            **{
+                field: _category_values(self.categories[field])
+                for field in CATEGORY_FIELDS
+            },
+            "date_birth": [None if d == "NaT" else d for d in dates.tolist()],
+        }
+        return [dict(zip(FIELDS, row)) for row in zip(*(columns[f] for f in FIELDS))]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self.ids.nbytes
+            + self.date_birth.nbytes
+            + sum(array.nbytes for array in self.strings.values())
+            + sum(
+                cat.codes.nbytes + cat.categories.memory_usage(deep=True)
+                for cat in self.categories.values()
+            )
+        )
+
+    def _take(self, mask: np.ndarray) -> "MemberTable":
+        arrow_mask = pa.array(mask)
+        return MemberTable(
+            ids=self.ids[mask],
+            strings={f: a.filter(arrow_mask) for f, a in self.strings.items()},
+            categories={f: c[mask] for f, c in self.categories.items()},
+            date_birth=self.date_birth[mask],
+        )
+
+    def without(self, id_member: Optional[int]) -> "MemberTable":
+        return self._take(self.ids != id_member)
+
+    def upsert(self, member: dict[str, Any]) -> "MemberTable":
+        """A table with ``member`` replacing the row with its id.
+
+        The row goes where the list endpoint would put it, by
+        ``member_name`` and then ``id_member``.
+        """
+        rest = self.without(member.get("id_member"))
+        row = MemberTable.from_payload([member])
+        at = rest._position(row.strings["member_name"][0], row.ids[0])
+
+        def insert(values: Any, value: Any) -> Any:
+            return [values[:at], value, values[at:]]
+
+        return MemberTable(
+            ids=np.concatenate(insert(rest.ids, row.ids)),
+            strings={
+                f: pa.concat_arrays(insert(rest.strings[f], row.strings[f]))
+                for f in STRING_FIELDS
+            },
+            categories={
+                # New categories (a first "GG" shirt) are added as needed.
+                f: union_categoricals(insert(rest.categories[f], row.categories[f]))
+                for f in CATEGORY_FIELDS
+            },
+            date_birth=np.concatenate(insert(rest.date_birth, row.date_birth)),
+        )
+
+    def _position(self, name: pa.Scalar, id_member: int) -> int:
+        # Rows are sorted, so the rows that sort before the new one are
+        # exactly the prefix it goes after (a searchsorted over Arrow).
+        names = self.strings["member_name"]
+        if not name.is_valid:
+            return len(self)
+        before = pc.or_kleene(
+            pc.less(names, name),
+            pc.and_kleene(pc.equal(names, name), pa.array(self.ids < id_member)),
+        )
+        return int(pc.sum(pc.fill_null(before, False)).as_py() or 0)
+
+
+def _large_strings(values: Any) -> pa.Array:
+    # Zero-copy for pandas' Arrow-backed strings; NaN and None become nulls.
+    array = pa.array(values, type=pa.large_string(), from_pandas=True)
+    if isinstance(array, pa.ChunkedArray):
+        return array.combine_chunks()
+    return array
+
+
+def _categorical(values: Any) -> pd.Categorical:
+    return values if isinstance(values, pd.Categorical) else pd.Categorical(values)
+
+
+def _category_values(cat: pd.Categorical) -> list[Any]:
+    if not len(cat.categories):
+        return [None] * len(cat)
+    values = cat.categories.to_numpy(dtype=object)[cat.codes]
+    values[cat.codes < 0] = None
+    return values.tolist()
@@ -1,2 +1,19 @@
 from .connection_database import ConnectionDatabase as ConnectionDatabase
 from .sql_read_file import SqlReadFile as SqlReadFile
+from .metrics import (
+    RequestStats as RequestStats,
+    observe_section as observe_section,
+    registry as registry,
+    request_stats as request_stats,
+)
+from .ttl_cache import TTLCache as TTLCache
+from .rate_limit import (
+    MemoryTokenBucketBackend as MemoryTokenBucketBackend,
+    RateLimit as RateLimit,
+    TokenBucketBackend as TokenBucketBackend,
+)
+from .client_address import (
+    END_USER_IP_HEADER as END_USER_IP_HEADER,
+    client_address as client_address,
+    parse_networks as parse_networks,
+)
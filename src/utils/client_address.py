@@ -0,0 +1,46 @@
+import ipaddress
+from typing import Mapping, Optional, Sequence, Union
+
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+# Set by the Streamlit frontend to the browser's address, since every API
+# call it makes comes from the frontend server itself.
+END_USER_IP_HEADER = "X-End-User-IP"
+
+
+def parse_networks(value: str) -> list[IPNetwork]:
+    """Parse a comma-separated list of addresses and CIDR ranges."""
+    return [
+        ipaddress.ip_network(item.strip(), strict=False)
+        for item in value.split(",")
+        if item.strip()
+    ]
+
+
+def client_address(
+    peer: Optional[str], headers: Mapping[str, str], trusted: Sequence[IPNetwork]
+) -> str:
+    """The address a request really comes from, for per-client limits.
+
+    The hops are the end user's address given by the frontend, then
+    ``X-Forwarded-For``, then the socket peer. Walking them from the right,
+    trusted proxies and the frontend are skipped, and the first address not
+    in ``trusted`` is the client. Whatever an untrusted hop claims to its
+    left is ignored, so the headers cannot be spoofed from outside.
+    """
+    hops = [headers.get(END_USER_IP_HEADER, "")]
+    hops += headers.get("X-Forwarded-For", "").split(",")
+    hops.append(peer or "")
+
+    client = "unknown"
+    for hop in reversed([hop.strip() for hop in hops if hop.strip()]):
+        try:
+            address = ipaddress.ip_address(hop)
+        except ValueError:
+            # A garbled hop cannot be vouched for; stop at the
+            # last address that could.
+            break
+        client = str(address)
+        if not any(address in network for network in trusted):
+            break
+    return client
@@ -1,26 +1,75 @@
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
 from sqlalchemy.exc import OperationalError
 import time
 import os
+import uuid
 from typing import Optional
 from dotenv import load_dotenv
 
+SUPPORTED_SGBDS = ("postgres", "sqlite")
+
 
 class ConnectionDatabase:
-    def __init__(self, base: Optional[object] = None) -> None:
+    def __init__(self, base: Optional[object] = None, replica: bool = False) -> None:
         self.base: object | None = base
-        self.sgbd_name: str = "postgres"
         self.engine = None  # type: ignore
+        # A read replica reads DB_REPLICA_* (SQLITE_REPLICA_PATH on SQLite),
+        # each falling back to the primary's variable when unset.
+        self.replica = replica
 
         load_dotenv()
+        self.sgbd_name: str = os.getenv("DB_SGBD", "postgres").lower()
+        # Prepared statements kept per connection (asyncpg, sqlite3) and
+        # compiled SQL kept per engine (SQLAlchemy).
+        self.statement_cache_size = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 256))
+        self.query_cache_size = int(os.getenv("DB_QUERY_CACHE_SIZE", 500))
+        # pgbouncer in transaction mode hands each transaction a different
+        # server connection, so statements prepared on one are unknown on
+        # the next.
+        self.pgbouncer_transaction_mode = (
+            os.getenv("DB_PGBOUNCER_TRANSACTION_MODE", "false").lower() == "true"
+        )
+
+    def _getenv(self, name: str) -> str | None:
+        if self.replica:
+            prefix, _, rest = name.partition("_")
+            return os.getenv(f"{prefix}_REPLICA_{rest}") or os.getenv(name)
+        return os.getenv(name)
+
+    def replica_configured(self) -> bool:
+        """Whether the environment names a read replica for this SGBD."""
+        if self.sgbd_name == "sqlite":
+            return bool(os.getenv("SQLITE_REPLICA_PATH"))
+        return bool(os.getenv("DB_REPLICA_HOST"))
 
     def initialize_engine(self) -> AsyncEngine:
-        db_host: str | None = os.getenv("DB_HOST")
-        db_port: str | None = os.getenv("DB_PORT")
-        db_user: str | None = os.getenv("DB_USER")
-        db_pass: str | None = os.getenv("DB_PASSWORD")
-        db_name: str | None = os.getenv("DB_NAME")
-        db_ssl: str | None = os.getenv("DB_SSL")
+        """Create an async engine for the SGBD selected by ``DB_SGBD``.
+
+        ``postgres`` (the default) reads the DB_* connection variables;
+        ``DB_SSL`` is the sslmode and defaults to ``require``.
+        ``sqlite`` opens the file at ``SQLITE_PATH`` in WAL mode.
+
+        Both keep up to ``DB_STATEMENT_CACHE_SIZE`` prepared statements per
+        connection, keyed by SQL text, so repeated queries skip the parse
+        and plan round trip. ``DB_PGBOUNCER_TRANSACTION_MODE=true`` turns
+        statement reuse off and gives every statement a unique name.
+        """
+        if self.sgbd_name == "postgres":
+            return self._initialize_postgres()
+        if self.sgbd_name == "sqlite":
+            return self._initialize_sqlite()
+        raise ValueError(
+            f"Unsupported SGBD '{self.sgbd_name}', expected one of {SUPPORTED_SGBDS}"
+        )
+
+    def _initialize_postgres(self) -> AsyncEngine:
+        db_host: str | None = self._getenv("DB_HOST")
+        db_port: str | None = self._getenv("DB_PORT")
+        db_user: str | None = self._getenv("DB_USER")
+        db_pass: str | None = self._getenv("DB_PASSWORD")
+        db_name: str | None = self._getenv("DB_NAME")
+        db_ssl: str | None = self._getenv("DB_SSL")
 
         if not all([db_user, db_pass, db_name, db_host, db_port]):
             raise ValueError(
@@ -31,11 +80,55 @@ class ConnectionDatabase:
         connection_string: str = (
             f"postgresql+asyncpg://{db_user}:{db_pass}@{db_host}:{db_port}/{db_name}"
         )
+        # asyncpg sslmode: "disable" for a local server, "verify-full" to
+        # check the certificate.
+        ssl_mode = (db_ssl or "require").lower()
+        ssl_mode = {"true": "require", "false": "disable"}.get(ssl_mode, ssl_mode)
+        connect_args: dict[str, object] = {"ssl": ssl_mode}
+        statement_cache_size = self.statement_cache_size
+        if self.pgbouncer_transaction_mode:
+            statement_cache_size = 0
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_name_func"] = (
+                lambda: f"__asyncpg_{uuid.uuid4().hex}__"
+            )
+
         return create_async_engine(
-            url=connection_string,
-            connect_args={"ssl": "require"},
+            url=f"{connection_string}"
+            f"?prepared_statement_cache_size={statement_cache_size}",
+            connect_args=connect_args,
+            query_cache_size=self.query_cache_size,
         )
 
+    def _initialize_sqlite(self) -> AsyncEngine:
+        sqlite_path: str = self._getenv("SQLITE_PATH") or "./data.db"
+        busy_timeout_ms = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000))
+
+        engine = create_async_engine(
+            url=f"sqlite+aiosqlite:///{sqlite_path}",
+            connect_args={
+                "timeout": busy_timeout_ms / 1000,
+                "cached_statements": self.statement_cache_size,
+            },
+            query_cache_size=self.query_cache_size,
+        )
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            # WAL lets readers run alongside the single writer; NORMAL sync is
+            # durable across application crashes, which is enough in WAL mode.
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA busy_timeout={busy_timeout_ms}")
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA cache_size=-32000")
+            cursor.execute("PRAGMA mmap_size=134217728")
+            cursor.close()
+
+        return engine
+
     def connect(
         self, max_retries: int = 5, wait_seconds: int = 2
     ) -> AsyncEngine | None:
@@ -0,0 +1,69 @@
+import time
+from threading import Lock
+from typing import Protocol
+
+from .ttl_cache import TTLCache
+
+
+class TokenBucketBackend(Protocol):
+    async def consume(
+        self, key: str, capacity: float, refill_per_second: float
+    ) -> float:
+        """Take one token from ``key``'s bucket.
+
+        Return 0 when a token was available, otherwise the seconds until the
+        next one is.
+        """
+        ...
+
+
+class MemoryTokenBucketBackend:
+    """Token buckets for a single process, bounded to ``max_keys`` buckets.
+
+    Idle buckets are dropped once they would have refilled completely, which
+    is indistinguishable from keeping them.
+    """
+
+    def __init__(self, max_keys: int = 100_000) -> None:
+        self._buckets: TTLCache[tuple[float, float]] = TTLCache(max_keys, 0)
+        self._lock = Lock()
+
+    async def consume(
+        self, key: str, capacity: float, refill_per_second: float
+    ) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key) or (capacity, now)
+            tokens = min(capacity, tokens + (now - updated_at) * refill_per_second)
+
+            if tokens >= 1:
+                tokens -= 1
+                retry_after = 0.0
+            else:
+                retry_after = (1 - tokens) / refill_per_second
+
+            full_in = (capacity - tokens) / refill_per_second
+            self._buckets.set(key, (tokens, now), ttl_seconds=full_in)
+            return retry_after
+
+
+class RateLimit:
+    """Allow ``burst`` hits at once and ``per_minute`` sustained, per key."""
+
+    def __init__(
+        self, name: str, burst: int, per_minute: float, backend: TokenBucketBackend
+    ) -> None:
+        if burst < 1 or per_minute <= 0:
+            raise ValueError(
+                f"Rate limit '{name}' needs burst >= 1 and per_minute > 0, "
+                f"got {burst} and {per_minute}"
+            )
+        self.name = name
+        self.burst = burst
+        self.refill_per_second = per_minute / 60
+        self.backend = backend
+
+    async def hit(self, key: str) -> float:
+        return await self.backend.consume(
+            f"{self.name}:{key}", self.burst, self.refill_per_second
+        )
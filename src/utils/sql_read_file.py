@@ -1,8 +1,41 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 import pandas as pd
 from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+
+from .metrics import observe_section
+
+SQL_FILE_TAG = "-- sql_file: "
+
+
+@lru_cache(maxsize=None)
+def _resolve_path(query_dir: Path, sql_file: str, dialect: Optional[str]) -> Path:
+    # A "<name>.<dialect>.sql" variant, when present, overrides "<name>.sql".
+    path_file = query_dir.joinpath(f"{sql_file}.{dialect}.sql")
+    if not path_file.is_file():
+        path_file = query_dir.joinpath(f"{sql_file}.sql")
+
+    if not path_file.is_file():
+        raise FileNotFoundError(f"SQL file '{path_file}' not found.")
+    return path_file
+
+
+@lru_cache(maxsize=None)
+def _read_query(path_file: Path, sql_file: str) -> str:
+    with observe_section("sql_file_read"):
+        with open(path_file, "r") as file:
+            # The tag lets the query instrumentation name the source file.
+            return f"{SQL_FILE_TAG}{sql_file}\n{file.read()}"
+
+
+@lru_cache(maxsize=None)
+def _text_clause(query: str) -> TextClause:
+    # text() parses the bind parameters out of the string on every call;
+    # constructs are immutable, so one per query is shared by all callers.
+    return text(query)
 
 
 class SqlReadFile:
@@ -16,17 +49,21 @@ class SqlReadFile:
         self.columns = None
 
     def read_sql_file(self) -> str:
-        self.path_file = self.current_dir.parent.joinpath(
-            "sql", "query", f"{self.sql_file}.sql"
-        )
+        query_dir = self.current_dir.parent.joinpath("sql", "query")
+        dialect = getattr(getattr(self.engine, "dialect", None), "name", None)
+        self.path_file = _resolve_path(query_dir, self.sql_file, dialect)
 
-        if not self.path_file.is_file():
-            raise FileNotFoundError(f"SQL file '{self.path_file}' not found.")
-
-        with open(self.path_file, "r") as file:
-            self.query = file.read()
+        # Query files only change with a deploy, so each is read once. The
+        # identical string per query also keeps the driver-side prepared
+        # statement caches hitting.
+        self.query = _read_query(self.path_file, self.sql_file)
         return self.query
 
+    def statement(self) -> TextClause:
+        """The query as a ``text()`` construct, built once per file."""
+        self.read_sql_file()
+        return _text_clause(self.query)  # type: ignore
+
     async def execute_query_sql(
         self, params: Optional[dict] = None
     ) -> Any | dict[str, Any]:
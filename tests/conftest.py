@@ -0,0 +1,171 @@
+"""Shared fixtures: one database per test session, one SAVEPOINT per test.
+
+The app's own engine is used, pointed at an in-memory SQLite database or,
+with ``TEST_DATABASE=postgres``, at a dedicated database named by the
+TEST_DB_HOST, TEST_DB_PORT, TEST_DB_USER, TEST_DB_PASSWORD and TEST_DB_NAME
+variables (TEST_DB_SSL defaults to ``disable`` for a local server). The DB_*
+variables of a developer's ``.env`` are never used, and a test database
+that matches them is refused. A single connection holds an outer
+transaction for the whole session (rows that already exist are deleted
+inside it, so they come back when it rolls back). Every test then runs
+inside a SAVEPOINT that is rolled back at teardown.
+
+While a test runs, ``SessionLocal`` is bound to that connection with
+``join_transaction_mode="create_savepoint"``. CRUD functions, routes (through
+``get_db``/``get_read_db``) and anything else that opens a ``SessionLocal``
+work unchanged: ``commit()`` releases a nested savepoint, so a committed
+change is visible to the rest of the test, and ``rollback()`` undoes only that
+session's work. Nothing is ever written to disk.
+"""
+
+import os
+
+from dotenv import dotenv_values
+
+TEST_DB_VARIABLES = ("HOST", "PORT", "USER", "PASSWORD", "NAME")
+
+TEST_DATABASE = os.getenv("TEST_DATABASE", "sqlite").lower()
+if TEST_DATABASE == "sqlite":
+    os.environ["DB_SGBD"] = "sqlite"
+    os.environ["SQLITE_PATH"] = ":memory:"
+elif TEST_DATABASE == "postgres":
+    missing = [f"TEST_DB_{name}" for name in TEST_DB_VARIABLES]
+    missing = [name for name in missing if not os.getenv(name)]
+    if missing:
+        raise RuntimeError(
+            "TEST_DATABASE=postgres needs a dedicated database; set "
+            + ", ".join(missing)
+        )
+    configured = {**dotenv_values(), **os.environ}
+    if all(
+        os.environ[f"TEST_DB_{name}"] == configured.get(f"DB_{name}")
+        for name in ("HOST", "PORT", "NAME")
+    ):
+        raise RuntimeError(
+            "TEST_DB_* names the same database as DB_*; the tests delete "
+            "every row, so point them at a database of their own"
+        )
+    os.environ["DB_SGBD"] = "postgres"
+    for name in TEST_DB_VARIABLES:
+        os.environ[f"DB_{name}"] = os.environ[f"TEST_DB_{name}"]
+    os.environ["DB_SSL"] = os.getenv("TEST_DB_SSL", "disable")
+else:
+    raise RuntimeError(f"Unsupported TEST_DATABASE '{TEST_DATABASE}'")
+# Values from a developer's .env must not reach the tests: no replica,
+# in-process stores only, synchronous registration.
+os.environ["SQLITE_REPLICA_PATH"] = ""
+os.environ["DB_REPLICA_HOST"] = ""
+os.environ["IDEMPOTENCY_STORE"] = "memory"
+os.environ["MEMBER_EVENTS_BACKEND"] = "memory"
+os.environ["REGISTRATION_MODE"] = "sync"
+os.environ.setdefault("SECRET_KEY", "test-only-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+
+from datetime import datetime, timezone  # noqa: E402
+from typing import Any, AsyncIterator, Awaitable, Callable  # noqa: E402
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+from sqlalchemy import event, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession  # noqa: E402
+
+from benchmarks.load_test import synthetic_member  # noqa: E402
+from src.backend.app.crud.create_crud_auth import (  # noqa: E402
+    create_access_token,
+    create_user,
+)
+from src.backend.app.engine_database import Base, SessionLocal, engine  # noqa: E402
+from src.backend.app.main import app  # noqa: E402
+from src.backend.app.schemas import YouthMembersSchema  # noqa: E402
+from src.backend.app.validator import UserCreate  # noqa: E402
+
+if engine.dialect.name == "sqlite":
+    # The sqlite3 module opens transactions on its own and never for
+    # SAVEPOINT, so SQLAlchemy is left to emit BEGIN itself.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_implicit_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session")
+async def connection() -> AsyncIterator[AsyncConnection]:
+    async with engine.connect() as conn:  # type: ignore
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.commit()
+
+        await conn.begin()
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
+        yield conn
+        await conn.rollback()
+
+
+@pytest.fixture(autouse=True)
+async def savepoint(connection: AsyncConnection) -> AsyncIterator[AsyncConnection]:
+    nested = await connection.begin_nested()
+    SessionLocal.configure(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield connection
+    finally:
+        SessionLocal.configure(
+            bind=engine, join_transaction_mode="conservative_savepoint"
+        )
+        if nested.is_active:
+            await nested.rollback()
+
+
+@pytest.fixture
+async def db() -> AsyncIterator[AsyncSession]:
+    async with SessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+def member_payload() -> Callable[..., dict[str, Any]]:
+    """A valid member as the API takes it; keyword arguments override fields."""
+
+    def build(i: int = 1, **overrides: Any) -> dict[str, Any]:
+        member = synthetic_member(i)
+        member["date_birth"] = member["date_birth"].isoformat()
+        return member | overrides
+
+    return build
+
+
+@pytest.fixture
+def seed_members(db: AsyncSession) -> Callable[[int], Awaitable[list[int]]]:
+    """Insert ``n`` synthetic members in one statement; returns their ids."""
+
+    async def seed(n: int) -> list[int]:
+        now = datetime.now(timezone.utc)
+        rows = [
+            synthetic_member(i) | {"create_date": now, "update_date": now}
+            for i in range(1, n + 1)
+        ]
+        await db.execute(YouthMembersSchema.__table__.insert(), rows)
+        await db.commit()
+        result = await db.execute(
+            select(YouthMembersSchema.id_member).order_by(YouthMembersSchema.id_member)
+        )
+        return list(result.scalars())
+
+    return seed
+
+
+@pytest.fixture
+async def auth_headers(db: AsyncSession) -> dict[str, str]:
+    """Bearer header of a user created for the test."""
+    await create_user(db, UserCreate(username="auditor", password="senha-segura-123"))
+    token = create_access_token({"sub": "auditor"})
+    return {"Authorization": f"Bearer {token}"}
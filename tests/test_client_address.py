@@ -0,0 +1,42 @@
+import pytest
+
+from src.utils import (
+    MemoryTokenBucketBackend,
+    RateLimit,
+    client_address,
+    parse_networks,
+)
+
+FRONTEND = "10.0.0.5"
+TRUSTED = parse_networks(f"{FRONTEND}, 172.16.0.0/12")
+
+
+def test_untrusted_peer_is_the_client():
+    headers = {"X-End-User-IP": "1.2.3.4", "X-Forwarded-For": "5.6.7.8"}
+    assert client_address("9.9.9.9", headers, TRUSTED) == "9.9.9.9"
+
+
+def test_frontend_forwards_end_user():
+    headers = {"X-End-User-IP": "1.2.3.4"}
+    assert client_address(FRONTEND, headers, TRUSTED) == "1.2.3.4"
+
+
+def test_frontend_behind_proxy_forwards_end_user():
+    headers = {"X-End-User-IP": "1.2.3.4", "X-Forwarded-For": FRONTEND}
+    assert client_address("172.16.3.1", headers, TRUSTED) == "1.2.3.4"
+
+
+def test_spoofed_headers_through_proxy_are_ignored():
+    headers = {"X-End-User-IP": "1.2.3.4", "X-Forwarded-For": "6.6.6.6, 8.8.8.8"}
+    assert client_address("172.16.3.1", headers, TRUSTED) == "8.8.8.8"
+
+
+def test_garbled_hop_stops_at_last_trusted_address():
+    headers = {"X-End-User-IP": "not-an-ip"}
+    assert client_address(FRONTEND, headers, TRUSTED) == FRONTEND
+
+
+@pytest.mark.parametrize("burst, per_minute", [(20, 0), (0, 10), (5, -1)])
+def test_rate_limit_rejects_impossible_rates(burst, per_minute):
+    with pytest.raises(ValueError):
+        RateLimit("login_ip", burst, per_minute, MemoryTokenBucketBackend())
@@ -0,0 +1,156 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import insert, select
+
+from src.backend.app.crud import (
+    create_member,
+    delete_member,
+    get_all_members,
+    get_birthdays,
+    get_member_by_id,
+    get_members_version,
+    purge_deleted_members,
+    restore_members,
+    search_members,
+    update_member,
+)
+from src.backend.app.engine_database import SessionLocal
+from src.backend.app.schemas import MemberAudit
+from src.backend.app.validator import YouthMemberCreate, YouthMemberUpdate
+
+
+async def test_create_and_read_member(db, member_payload):
+    created = await create_member(db, YouthMemberCreate(**member_payload(1)))
+
+    member = await get_member_by_id(db, created.id_member)
+    assert member["member_name"] == "Membro Sintetico 0000001"
+
+
+async def test_savepoint_rollback_discards_committed_members(savepoint, member_payload):
+    # The SAVEPOINT the fixture wraps every test in, one level further down.
+    nested = await savepoint.begin_nested()
+    async with SessionLocal() as db:
+        await create_member(db, YouthMemberCreate(**member_payload(1)))
+        assert len(await get_all_members(db)) == 1
+    await nested.rollback()
+
+    async with SessionLocal() as db:
+        with pytest.raises(HTTPException) as error:
+            await get_all_members(db)
+    assert error.value.status_code == 404
+
+
+async def test_create_without_commit_only_validates(db, member_payload):
+    await create_member(db, YouthMemberCreate(**member_payload(1)), commit=False)
+
+    with pytest.raises(HTTPException):
+        await get_all_members(db)
+
+
+async def test_delete_without_commit_is_rolled_back(db, seed_members):
+    (id_member,) = await seed_members(1)
+
+    await delete_member(db, id_member, commit=False)
+    await db.rollback()
+
+    assert (await get_member_by_id(db, id_member))["id_member"] == id_member
+
+
+async def test_duplicate_member_is_rejected(db, member_payload):
+    await create_member(db, YouthMemberCreate(**member_payload(1)))
+
+    with pytest.raises(HTTPException) as error:
+        await create_member(db, YouthMemberCreate(**member_payload(1)))
+    assert error.value.detail == "Este membro já está cadastrado."
+
+
+async def test_update_changes_only_given_fields(db, seed_members):
+    (id_member,) = await seed_members(1)
+
+    updated = await update_member(db, id_member, YouthMemberUpdate(t_shirt="GG"))
+
+    assert updated["t_shirt"] == "GG"
+    assert updated["member_name"] == "Membro Sintetico 0000001"
+
+
+async def test_deleted_member_can_be_restored(db, seed_members):
+    ids = await seed_members(3)
+
+    await delete_member(db, ids[0])
+    assert [m.id_member for m in await get_all_members(db)] == ids[1:]
+
+    restored = await restore_members(db, [ids[0], 999])
+    assert [m.id_member for m in restored] == [ids[0]]
+    assert len(await get_all_members(db)) == 3
+
+
+async def test_recreating_a_deleted_member_points_to_restore(
+    db, seed_members, member_payload
+):
+    (id_member,) = await seed_members(1)
+    await delete_member(db, id_member)
+
+    with pytest.raises(HTTPException) as error:
+        await create_member(db, YouthMemberCreate(**member_payload(1)))
+    assert f"código {id_member}" in error.value.detail
+
+
+async def test_search_pages_and_matches(db, seed_members):
+    await seed_members(30)
+
+    # Members 10 to 19.
+    page = await search_members(db, page=2, page_size=10, search="sintetico 000001")
+    assert page.total == 10
+    assert page.items == []
+
+    page = await search_members(db, page=1, page_size=5, fields=("id_member",))
+    assert page.total == 30
+    assert len(page.items) == 5
+
+
+async def test_version_changes_after_a_write(db, seed_members):
+    ids = await seed_members(2)
+    before = await get_members_version(db)
+
+    await delete_member(db, ids[0])
+
+    assert await get_members_version(db) != before
+
+
+async def test_purge_clears_the_member_from_the_audit_history(db, seed_members):
+    purged, kept = await seed_members(2)
+    await db.execute(
+        insert(MemberAudit),
+        [
+            {
+                "id_member": id_member,
+                "operation": "insert",
+                "new_values": {"member_name": "Membro"},
+                "changed_at": datetime.utcnow(),
+            }
+            for id_member in (purged, kept)
+        ],
+    )
+    await delete_member(db, purged)
+
+    cutoff = datetime.now(timezone.utc) + timedelta(seconds=1)
+    assert await purge_deleted_members(db, cutoff) == 1
+
+    result = await db.execute(
+        select(MemberAudit.id_member, MemberAudit.new_values).order_by(
+            MemberAudit.id_member
+        )
+    )
+    assert result.all() == [(purged, None), (kept, {"member_name": "Membro"})]
+
+
+async def test_leap_day_birthday_falls_on_28_february(db, member_payload):
+    leap = YouthMemberCreate(**member_payload(1, date_birth="2004-02-29"))
+    await create_member(db, leap)
+
+    (birthday,) = await get_birthdays(db, date(2027, 2, 1), date(2027, 2, 28))
+    assert birthday.birthday == date(2027, 2, 28)
+    assert birthday.turning_age == 23
+    assert await get_birthdays(db, date(2028, 2, 1), date(2028, 2, 28)) == []
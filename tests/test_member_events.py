@@ -0,0 +1,76 @@
+import asyncio
+
+from src.backend.app.crud.create_crud_events import MemberEventBroker
+
+
+class FakeDriver:
+    """Stands in for the asyncpg connection the broker listens on."""
+
+    def __init__(self):
+        self.on_terminate = None
+
+    def add_termination_listener(self, callback):
+        self.on_terminate = callback
+
+    async def add_listener(self, channel, callback):
+        pass
+
+    async def execute(self, query):
+        pass
+
+
+async def test_lost_listen_connection_is_restored_with_a_reset(monkeypatch):
+    broker = MemberEventBroker("postgres", buffer_size=10, heartbeat_seconds=5)
+    drivers: list[FakeDriver] = []
+
+    async def connect_listener(lost):
+        driver = FakeDriver()
+        driver.add_termination_listener(lambda connection: lost.set())
+        drivers.append(driver)
+        return driver
+
+    monkeypatch.setattr(broker, "_connect_listener", connect_listener)
+    queue: asyncio.Queue = asyncio.Queue()
+    broker.subscribers.add(queue)
+    await broker.start()
+    try:
+        while not drivers:
+            await asyncio.sleep(0)
+        drivers[0].on_terminate(drivers[0])
+
+        event = await asyncio.wait_for(queue.get(), timeout=1)
+        assert event["type"] == "reset" and len(drivers) == 2
+        # Clients resuming from before the gap are told to reload too.
+        assert broker._complete_after == event["id"]
+    finally:
+        await broker.stop()
+
+
+async def read_events(broker: MemberEventBroker, last_event_id, count: int):
+    stream = broker.stream(last_event_id)
+    try:
+        assert await anext(stream) == "retry: 3000\n\n"
+        return [await anext(stream) for _ in range(count)]
+    finally:
+        await stream.aclose()
+
+
+async def test_last_event_id_replays_only_missed_events():
+    broker = MemberEventBroker("memory", buffer_size=10, heartbeat_seconds=5)
+    await broker.publish("insert", {"id_member": 1})
+    seen = broker._last_id
+    await broker.publish("delete", {"id_member": 1})
+
+    [event] = await read_events(broker, str(seen), 1)
+    assert event.startswith(f"id: {broker._last_id}\nevent: delete\n")
+
+
+async def test_last_event_id_out_of_the_buffer_gets_a_reset():
+    broker = MemberEventBroker("memory", buffer_size=2, heartbeat_seconds=5)
+    await broker.publish("insert", {"id_member": 1})
+    seen = broker._last_id
+    for id_member in (2, 3):
+        await broker.publish("insert", {"id_member": id_member})
+
+    [event] = await read_events(broker, str(seen), 1)
+    assert "event: reset\n" in event
@@ -0,0 +1,30 @@
+from member_table import MemberTable
+
+
+def member(id_member: int, member_name: str, **overrides) -> dict:
+    return {
+        "id_member": id_member,
+        "member_name": member_name,
+        "gender": "Masculino",
+        "phone_number": "11999990000",
+        "t_shirt": "M",
+        "food_allergy": "Não",
+        "sower": "Não",
+        "ministry_position": "Membro",
+        "date_birth": "2000-01-01",
+        "email": f"membro{id_member}@exemplo.com",
+    } | overrides
+
+
+def test_upsert_keeps_the_list_order():
+    table = MemberTable.from_payload(
+        [member(1, "Ana"), member(2, "Carla"), member(4, "Eva")]
+    )
+
+    table = table.upsert(member(5, "Bruno", t_shirt="GG"))
+    table = table.upsert(member(1, "Zeca"))
+    table = table.upsert(member(3, "Carla"))
+
+    frame = table.to_frame()
+    assert list(frame["id_member"]) == [5, 2, 3, 4, 1]
+    assert list(frame["t_shirt"]) == ["GG", "M", "M", "M", "M"]
@@ -0,0 +1,159 @@
+"""Performance regression gate built from the benchmark scenarios.
+
+Each timing is the median of a few runs after a warm-up, compared with
+``perf_baseline.json`` times ``PERF_TOLERANCE`` (default 3). Baselines
+are machine-specific: on a new machine, or after an intended change, run
+
+    PERF_UPDATE_BASELINE=1 pytest -m perf
+
+and commit the file. Ratio checks (new path against the legacy one, same
+run) hold on any machine. A plain ``pytest`` leaves these tests out; run
+them with ``task perf``.
+"""
+
+import gc
+import json
+import logging
+import os
+import statistics
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import pyarrow as pa
+import pytest
+
+from benchmarks.bench_dashboard_rerun import (
+    SELECTIONS,
+    api_payload,
+    cached_rerun,
+    uncached_rerun,
+)
+from benchmarks.bench_members_serialization import (
+    build_rows,
+    legacy_path,
+    single_pass_path,
+)
+from member_table import MemberTable
+
+pytestmark = pytest.mark.perf
+
+BASELINE_PATH = Path(__file__).with_name("perf_baseline.json")
+PERF_TOLERANCE = float(os.getenv("PERF_TOLERANCE", 3))
+PERF_UPDATE_BASELINE = os.getenv("PERF_UPDATE_BASELINE") == "1"
+
+
+@pytest.fixture(scope="module")
+def budget():
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    measured: dict[str, float] = {}
+
+    def check(name: str, seconds: float) -> None:
+        ms = round(seconds * 1000, 3)
+        measured[name] = ms
+        if PERF_UPDATE_BASELINE:
+            return
+        if name not in baseline:
+            pytest.fail(f"No baseline for {name}; run with PERF_UPDATE_BASELINE=1")
+        limit = baseline[name] * PERF_TOLERANCE
+        assert ms <= limit, (
+            f"{name} took {ms:.1f} ms, over {limit:.1f} ms "
+            f"({PERF_TOLERANCE}x the {baseline[name]:.1f} ms baseline)"
+        )
+
+    yield check
+    if PERF_UPDATE_BASELINE:
+        BASELINE_PATH.write_text(
+            json.dumps(baseline | measured, indent=2, sort_keys=True) + "\n"
+        )
+
+
+def median_seconds(func: Callable[[], Any], repeat: int) -> float:
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+async def median_seconds_async(
+    func: Callable[[], Awaitable[Any]], repeat: int
+) -> float:
+    await func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def allocated_bytes(build: Callable[[], Any]) -> int:
+    # Arrow buffers live in pyarrow's pool, outside tracemalloc.
+    gc.collect()
+    arrow_before = pa.total_allocated_bytes()
+    tracemalloc.start()
+    value = build()
+    heap, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size = heap + pa.total_allocated_bytes() - arrow_before
+    del value
+    return size
+
+
+async def test_list_members(client, seed_members, budget):
+    await seed_members(2_000)
+
+    async def list_members():
+        response = await client.get("/registered/")
+        assert response.status_code == 200
+
+    budget("list_members_2k", await median_seconds_async(list_members, 5))
+
+
+async def test_members_page(client, seed_members, budget):
+    await seed_members(2_000)
+
+    async def members_page():
+        response = await client.get(
+            "/registered/page", params={"page": 20, "search": "sintetico"}
+        )
+        assert response.status_code == 200
+
+    budget("members_page_2k", await median_seconds_async(members_page, 20))
+
+
+def test_serialize_members(budget):
+    rows = build_rows(10_000)
+
+    single_pass = median_seconds(lambda: single_pass_path(rows), 3)
+    budget("serialize_members_10k", single_pass)
+    assert single_pass * 2 < median_seconds(lambda: legacy_path(rows), 1)
+
+
+def test_dashboard_rerun(budget):
+    # Outside `streamlit run` every cache call warns about the missing runtime.
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    table = MemberTable.from_payload(api_payload(10_000))
+    version, today = f"perf-{id(table)}", date.today()
+    selections = iter(SELECTIONS * 10)
+
+    def rerun(func: Callable[..., None]) -> Callable[[], None]:
+        return lambda: func(table, version, today, *next(selections))
+
+    uncached = median_seconds(rerun(uncached_rerun), 3)
+    budget("dashboard_rerun_10k", uncached)
+    assert median_seconds(rerun(cached_rerun), 7) * 5 < uncached
+
+
+def test_member_table_memory():
+    payload = json.loads(json.dumps(api_payload(20_000)))
+    body = json.dumps(payload)
+
+    as_dicts = allocated_bytes(lambda: json.loads(body))
+    as_table = allocated_bytes(lambda: MemberTable.from_payload(payload))
+    assert as_table * 4 < as_dicts
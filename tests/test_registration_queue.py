@@ -0,0 +1,97 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from src.backend.app.crud.create_crud_queue import (
+    DUPLICATE_DETAIL,
+    REJECTED_DETAIL,
+    RegistrationQueue,
+)
+from src.backend.app.routes import routes_events
+from src.backend.app.validator import RegistrationTicket, YouthMemberCreate
+
+
+@pytest.fixture
+async def start_queue(tmp_path):
+    """Start a queue on a temporary journal, first holding ``records`` if given."""
+    journal = tmp_path / "journal.jsonl"
+    queues = []
+
+    async def start(records=None, **options) -> RegistrationQueue:
+        if records is not None:
+            journal.write_text("".join(json.dumps(r) + "\n" for r in records))
+        queue = RegistrationQueue(str(journal), flush_ms=10, retry_seconds=0, **options)
+        await queue.start()
+        queues.append(queue)
+        return queue
+
+    yield start
+    for queue in queues:
+        await queue.stop()
+
+
+async def settled(queue: RegistrationQueue, ticket: str) -> RegistrationTicket:
+    deadline = time.monotonic() + 5
+    while (status := queue.get_ticket(ticket)).status == "pending":  # type: ignore
+        assert time.monotonic() < deadline, f"ticket {ticket} still pending"
+        await asyncio.sleep(0.01)
+    return status  # type: ignore
+
+
+async def test_bad_member_is_given_up_without_blocking_the_batch(
+    start_queue, member_payload
+):
+    records = [
+        {"ticket": "bad", "member": member_payload(1, gender="Outro")},
+        {"ticket": "good", "member": member_payload(2)},
+    ]
+    queue = await start_queue(records, max_attempts=2)
+
+    bad, good = await settled(queue, "bad"), await settled(queue, "good")
+    assert (bad.status, bad.detail) == ("failed", REJECTED_DETAIL)
+    assert good.status == "done" and good.id_member is not None
+
+    # Both are marked done, so a restart has nothing to replay.
+    await queue.stop()
+    await start_queue()
+    assert queue.journal_path.read_text() == ""
+
+
+async def test_journal_is_compacted_once_it_grows(start_queue, member_payload):
+    queue = await start_queue(compact_bytes=1)
+
+    ticket = await queue.submit(YouthMemberCreate(**member_payload(1)))
+    assert (await settled(queue, ticket.ticket)).status == "done"
+    assert queue.journal_path.read_text() == ""
+
+
+async def test_duplicate_in_a_batch_fails_only_its_ticket(start_queue, member_payload):
+    queue = await start_queue()
+    first, second = [
+        await queue.submit(YouthMemberCreate(**member_payload(1))) for _ in range(2)
+    ]
+
+    assert (await settled(queue, first.ticket)).status == "done"
+    duplicate = await settled(queue, second.ticket)
+    assert (duplicate.status, duplicate.detail) == ("failed", DUPLICATE_DETAIL)
+
+
+async def test_queued_registration_is_followed_through_its_ticket(
+    client, start_queue, member_payload, monkeypatch
+):
+    monkeypatch.setattr(routes_events, "REGISTRATION_MODE", "queued")
+    monkeypatch.setattr(routes_events, "registration_queue", await start_queue())
+
+    response = await client.post("/registered/", json=member_payload(1))
+    assert response.status_code == 202
+    location = response.headers["location"]
+
+    deadline = time.monotonic() + 5
+    while (ticket := (await client.get(location)).json())["status"] == "pending":
+        assert time.monotonic() < deadline, "ticket still pending"
+        await asyncio.sleep(0.01)
+    assert ticket["status"] == "done"
+    member = await client.get(f"/registered/{ticket['id_member']}")
+    assert member.json()["email"] == "membro1@exemplo.com"
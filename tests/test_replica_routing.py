@@ -0,0 +1,57 @@
+import time
+
+import pytest
+from starlette.requests import Request
+
+from src.backend.app.engine_database import replica
+from src.backend.app.middleware import read_your_writes
+
+
+@pytest.fixture
+def healthy_replica(monkeypatch):
+    """Route reads as if a caught-up replica were configured."""
+    replica_sessions = object()
+    monkeypatch.setattr(replica, "read_engine", object())
+    monkeypatch.setattr(replica, "ReadSessionLocal", replica_sessions)
+    monkeypatch.setattr(replica.replica_monitor, "replica", object())
+    monkeypatch.setattr(replica.replica_monitor, "lag_seconds", 0.0)
+    return replica_sessions
+
+
+def request_with(headers: dict[str, str]) -> Request:
+    raw = [(name.lower().encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "headers": raw})
+
+
+def test_reads_go_to_the_replica_without_a_recent_write(healthy_replica):
+    assert replica.read_sessionmaker(request_with({})) is healthy_replica
+
+
+def test_header_pins_only_the_user_who_wrote(healthy_replica):
+    until = f"{time.time() + 2:.3f}"
+    pinned = request_with({"Read-Primary-Until": until})
+    assert replica.read_sessionmaker(pinned) is replica.SessionLocal
+    assert replica.read_sessionmaker(request_with({})) is healthy_replica
+
+
+def test_cookie_still_pins_browsers(healthy_replica):
+    cookie = f"read_primary_until={time.time() + 2:.3f}"
+    assert replica.read_sessionmaker(request_with({"Cookie": cookie})) is (
+        replica.SessionLocal
+    )
+
+
+@pytest.mark.parametrize("offset", [-1, 3600])
+def test_expired_or_forged_deadline_is_ignored(healthy_replica, offset):
+    until = f"{time.time() + offset:.3f}"
+    request = request_with({"Read-Primary-Until": until})
+    assert replica.read_sessionmaker(request) is healthy_replica
+
+
+async def test_member_write_returns_the_deadline(client, member_payload, monkeypatch):
+    monkeypatch.setattr(read_your_writes, "read_engine", object())
+    response = await client.post("/registered/", json=member_payload(1))
+
+    until = float(response.headers["read-primary-until"])
+    assert time.time() < until <= time.time() + replica.DB_REPLICA_STICKY_SECONDS
+    assert "read_primary_until" in response.cookies
@@ -0,0 +1,36 @@
+from src.backend.app.crud import create_crud_auth
+from src.utils import MemoryTokenBucketBackend, RateLimit
+
+USER = {"username": "coordenador", "password": "senha-segura-123"}
+
+
+async def login(client, password: str = USER["password"]):
+    return await client.post(
+        "/auth/login", data={"username": USER["username"], "password": password}
+    )
+
+
+async def test_refresh_token_works_once(client):
+    await client.post("/auth/register", json=USER)
+    first = (await login(client)).json()["refresh_token"]
+
+    rotated = await client.post("/auth/refresh", json={"refresh_token": first})
+    assert rotated.status_code == 200
+    second = rotated.json()["refresh_token"]
+
+    reused = await client.post("/auth/refresh", json={"refresh_token": first})
+    assert reused.status_code == 401
+    again = await client.post("/auth/refresh", json={"refresh_token": second})
+    assert again.status_code == 200
+
+
+async def test_login_is_throttled_before_the_password_is_checked(client, monkeypatch):
+    limit = RateLimit("login_user", 2, 1, MemoryTokenBucketBackend())
+    monkeypatch.setattr(create_crud_auth, "login_user_limit", limit)
+    await client.post("/auth/register", json=USER)
+
+    for _ in range(2):
+        assert (await login(client, "senha-errada")).status_code == 401
+    throttled = await login(client)
+    assert throttled.status_code == 429
+    assert int(throttled.headers["retry-after"]) > 0
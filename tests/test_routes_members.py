@@ -0,0 +1,194 @@
+import asyncio
+import csv
+import io
+from datetime import timedelta
+
+from src.backend.app.crud.create_crud_auth import (
+    create_access_token,
+    username_from_token,
+)
+from src.backend.app.middleware import admission
+from src.backend.app.routes import routes_events
+from src.backend.app.middleware.admission import AdmissionController
+
+
+async def test_create_then_get_member(client, member_payload):
+    response = await client.post("/registered/", json=member_payload(1))
+    assert response.status_code == 200
+    id_member = response.json()["id_member"]
+
+    response = await client.get(f"/registered/{id_member}")
+    assert response.status_code == 200
+    assert response.json()["email"] == "membro1@exemplo.com"
+
+
+async def test_invalid_member_is_rejected(client, member_payload):
+    response = await client.post("/registered/", json=member_payload(1, gender="Outro"))
+    assert response.status_code == 422
+
+    response = await client.post(
+        "/registered/", json=member_payload(1, member_name="   ")
+    )
+    assert response.status_code == 400
+
+
+async def test_list_revalidates_with_etag(client, seed_members):
+    await seed_members(3)
+
+    response = await client.get("/registered/")
+    assert len(response.json()) == 3
+
+    etag = response.headers["etag"]
+    response = await client.get("/registered/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+async def test_list_sparse_fieldset(client, seed_members):
+    await seed_members(2)
+
+    response = await client.get(
+        "/registered/", params={"fields": "member_name,id_member"}
+    )
+    assert [set(member) for member in response.json()] == [
+        {"id_member", "member_name"}
+    ] * 2
+
+    response = await client.get("/registered/", params={"fields": "password"})
+    assert response.status_code == 400
+
+
+async def test_large_list_is_compressed(client, seed_members):
+    await seed_members(50)
+
+    response = await client.get(
+        "/registered/", headers={"Accept-Encoding": "gzip;q=1, br;q=0"}
+    )
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()) == 50
+
+    raw = await client.get("/registered/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in raw.headers
+    assert int(response.headers["content-length"]) < len(raw.content)
+
+
+async def test_compressed_list_has_its_own_etag(client, seed_members):
+    await seed_members(50)
+
+    gzipped = await client.get("/registered/", headers={"Accept-Encoding": "gzip"})
+    raw = await client.get("/registered/", headers={"Accept-Encoding": "identity"})
+    assert gzipped.headers["etag"] == raw.headers["etag"][:-1] + '-gzip"'
+    assert gzipped.headers["vary"] == raw.headers["vary"] == "Accept-Encoding"
+
+    response = await client.get(
+        "/registered/",
+        headers={"If-None-Match": gzipped.headers["etag"], "Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == gzipped.headers["etag"]
+
+
+async def test_page_and_export(client, seed_members):
+    await seed_members(12)
+
+    page = (await client.get("/registered/page", params={"page_size": 5})).json()
+    assert (page["total"], len(page["items"])) == (12, 5)
+
+    response = await client.get(
+        "/registered/export", params={"columns": "id_member,member_name"}
+    )
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == ["id_member", "member_name"]
+    assert len(rows) == 13
+
+
+async def test_delete_restore_round_trip(client, seed_members, auth_headers):
+    ids = await seed_members(2)
+
+    assert (await client.delete(f"/registered/{ids[0]}")).status_code == 200
+    assert (await client.get(f"/registered/{ids[0]}")).status_code == 404
+
+    deleted = (await client.get("/registered/deleted", headers=auth_headers)).json()
+    assert [member["id_member"] for member in deleted] == [ids[0]]
+
+    response = await client.post(f"/registered/{ids[0]}/restore")
+    assert response.status_code == 200
+    assert len((await client.get("/registered/")).json()) == 2
+
+
+async def test_audit_and_deleted_members_need_a_valid_token(client, auth_headers):
+    expired = create_access_token({"sub": "auditor"}, timedelta(minutes=-1))
+    stale = {"Authorization": f"Bearer {expired}"}
+
+    for path in ("/registered/audit", "/registered/deleted"):
+        assert (await client.get(path)).status_code == 401
+        assert (await client.get(path, headers=stale)).status_code == 401
+        assert (await client.get(path, headers=auth_headers)).status_code == 200
+
+    # An expired token no longer signs changes either.
+    assert username_from_token(expired) is None
+
+
+async def test_idempotency_key_replays_member_writes_only(client, member_payload):
+    headers = {"Idempotency-Key": "cadastro-1"}
+    first = await client.post("/registered/", json=member_payload(1), headers=headers)
+    again = await client.post("/registered/", json=member_payload(1), headers=headers)
+    assert again.headers["idempotent-replayed"] == "true"
+    assert again.json() == first.json()
+
+    user = {"username": "coordenador", "password": "senha-segura-123"}
+    assert (await client.post("/auth/register", json=user, headers=headers)).is_success
+    again = await client.post("/auth/register", json=user, headers=headers)
+    assert "idempotent-replayed" not in again.headers
+    assert again.status_code == 400
+
+
+async def test_idempotency_key_in_flight_is_a_conflict(
+    client, member_payload, monkeypatch
+):
+    started, release = asyncio.Event(), asyncio.Event()
+    create_member = routes_events.create_member
+
+    async def slow_create_member(*args, **kwargs):
+        started.set()
+        await release.wait()
+        return await create_member(*args, **kwargs)
+
+    monkeypatch.setattr(routes_events, "create_member", slow_create_member)
+    headers = {"Idempotency-Key": "cadastro-1"}
+    first = asyncio.create_task(
+        client.post("/registered/", json=member_payload(1), headers=headers)
+    )
+    await started.wait()
+
+    again = await client.post("/registered/", json=member_payload(1), headers=headers)
+    assert again.status_code == 409
+    release.set()
+    assert (await first).status_code == 200
+
+
+async def test_heavy_route_sheds_while_cheap_routes_answer(
+    client, seed_members, monkeypatch
+):
+    await seed_members(3)
+    controller = AdmissionController(
+        heavy_limit=1, default_limit=8, max_wait_seconds=0.05, global_limit=4
+    )
+    monkeypatch.setattr(admission, "admission_controller", controller)
+    heavy = controller.limiter("GET", "/registered/")
+    assert await controller.acquire(heavy, "GET /registered/")
+
+    response = await client.get("/registered/")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert (await client.get("/registered/page")).status_code == 200
+
+    # With the pool's worth of requests in flight every route waits.
+    cheap = controller.limiter("GET", "/registered/{id_member}")
+    for _ in range(3):
+        assert await controller.acquire(cheap, "GET /registered/{id_member}")
+    assert (await client.get("/registered/page")).status_code == 503
+
+    for _ in range(3):
+        controller.release(cheap)
+    controller.release(heavy)
+    assert (await client.get("/registered/")).status_code == 200